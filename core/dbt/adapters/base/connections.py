@@ -1,7 +1,10 @@
 import abc
 import multiprocessing
 import os
-from threading import get_ident
+import time
+from collections import deque
+from multiprocessing.dummy import Pool as ThreadPool
+from threading import get_ident, Lock
 
 import dbt.exceptions
 import dbt.flags
@@ -13,7 +16,7 @@ from dbt.utils import translate_aliases
 from hologram.helpers import ExtensibleJsonSchemaMixin
 
 from dataclasses import dataclass, field
-from typing import Any, ClassVar, Dict, Tuple
+from typing import Any, ClassVar, Deque, Dict, Optional, Tuple
 
 
 @dataclass
@@ -64,6 +67,53 @@ class Credentials(
         return serialized
 
 
+class ConnectionPool:
+    """A bounded pool of open connections that no thread is using. Each
+    connection is stored with the time it was added, so connections that were
+    idle for too long can be discarded.
+    """
+    def __init__(self, max_size: int, idle_timeout: Optional[float]) -> None:
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self._idle: Deque[Tuple[float, Connection]] = deque()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._idle)
+
+    def put(self, connection: Connection) -> bool:
+        """Add the connection to the pool. If the pool is full, return False
+        and leave the connection to the caller.
+        """
+        with self._lock:
+            if len(self._idle) >= self.max_size:
+                return False
+            self._idle.append((time.monotonic(), connection))
+            return True
+
+    def get(self) -> Tuple[Optional[Connection], bool]:
+        """Get the most recently added connection, or None if the pool is
+        empty, and whether the connection was idle for too long.
+        """
+        with self._lock:
+            if not self._idle:
+                return None, False
+            added, connection = self._idle.pop()
+        expired = (
+            self.idle_timeout is not None and
+            time.monotonic() - added > self.idle_timeout
+        )
+        return connection, expired
+
+    def drain(self) -> Tuple[Connection, ...]:
+        """Remove and return all the connections in the pool."""
+        with self._lock:
+            connections = tuple(c for _, c in self._idle)
+            self._idle.clear()
+        return connections
+
+
 class BaseConnectionManager(metaclass=abc.ABCMeta):
     """Methods to implement:
         - exception_handler
@@ -76,13 +126,38 @@ class BaseConnectionManager(metaclass=abc.ABCMeta):
 
     You must also set the 'TYPE' class attribute with a class-unique constant
     string.
+
+    Open connections that no thread is using are kept in a pool of up to
+    'threads' connections. Connections that were idle for longer than
+    IDLE_TIMEOUT seconds, or that fail `is_alive`, are reopened before they
+    are used.
     """
     TYPE: str = NotImplemented
+    IDLE_TIMEOUT: Optional[float] = 300.0
 
     def __init__(self, profile):
         self.profile = profile
         self.thread_connections = {}
         self.lock = multiprocessing.RLock()
+        self.pool = ConnectionPool(
+            max_size=max(profile.threads, 1),
+            idle_timeout=self.IDLE_TIMEOUT,
+        )
+        # when each thread last released its connection
+        self._released_at: Dict[Tuple[int, int], float] = {}
+
+    def reset_after_fork(self):
+        """Forget the connections inherited from the parent process in a
+        forked child, without closing them: their handles still belong to the
+        parent. The child opens its own connections if it needs any.
+        """
+        self.thread_connections = {}
+        self.lock = multiprocessing.RLock()
+        self.pool = ConnectionPool(
+            max_size=self.pool.max_size,
+            idle_timeout=self.pool.idle_timeout,
+        )
+        self._released_at = {}
 
     @staticmethod
     def get_thread_identifier():
@@ -133,6 +208,87 @@ class BaseConnectionManager(metaclass=abc.ABCMeta):
         raise dbt.exceptions.NotImplementedException(
             '`exception_handler` is not implemented for this adapter!')
 
+    def _new_connection(self):
+        return Connection(
+            type=self.TYPE,
+            name=None,
+            state='init',
+            transaction_open=False,
+            handle=None,
+            credentials=self.profile.credentials
+        )
+
+    @classmethod
+    def is_alive(cls, connection):
+        """Return whether the open connection can still be used. Adapters can
+        override this with a check of their handle. It should be cheap, and
+        must not start a transaction.
+        """
+        return connection.handle is not None
+
+    def _is_reusable(self, connection, idle_since=None):
+        if connection.state != 'open':
+            return False
+        if (
+            idle_since is not None and
+            self.IDLE_TIMEOUT is not None and
+            time.monotonic() - idle_since > self.IDLE_TIMEOUT
+        ):
+            logger.debug('Connection "{}" was idle for too long'
+                         .format(connection.name))
+            return False
+        try:
+            alive = self.is_alive(connection)
+        except Exception as exc:
+            logger.debug('Connection "{}" liveness check failed: {}'
+                         .format(connection.name, exc))
+            return False
+        if not alive:
+            logger.debug('Connection "{}" is no longer alive'
+                         .format(connection.name))
+        return alive
+
+    def _acquire_from_pool(self):
+        """Get a reusable connection from the pool. Connections that can't be
+        reused are closed.
+        """
+        while True:
+            conn, expired = self.pool.get()
+            if conn is None:
+                return None
+            if not expired and self._is_reusable(conn):
+                return conn
+            self.close(conn)
+
+    def prewarm(self, count):
+        """Open connections in parallel until the pool has `count` of them, so
+        threads don't have to wait to connect when they start.
+        """
+        needed = min(count, self.pool.max_size) - len(self.pool)
+        if needed <= 0:
+            return
+
+        def _open(conn):
+            try:
+                self.open(conn)
+            except Exception as exc:
+                logger.debug('Could not open a connection in advance: {}'
+                             .format(exc))
+            return conn
+
+        pool = ThreadPool(needed)
+        try:
+            connections = pool.map(_open, [
+                self._new_connection() for _ in range(needed)
+            ])
+        finally:
+            pool.close()
+            pool.join()
+
+        for conn in connections:
+            if conn.state != 'open' or not self.pool.put(conn):
+                self.close(conn)
+
     def set_connection_name(self, name=None):
         if name is None:
             # if a name isn't specified, we'll re-use a single handle
@@ -143,15 +299,17 @@ class BaseConnectionManager(metaclass=abc.ABCMeta):
         thread_id_key = self.get_thread_identifier()
 
         if conn is None:
-            conn = Connection(
-                type=self.TYPE,
-                name=None,
-                state='init',
-                transaction_open=False,
-                handle=None,
-                credentials=self.profile.credentials
-            )
-            self.thread_connections[thread_id_key] = conn
+            conn = self._acquire_from_pool()
+            if conn is None:
+                conn = self._new_connection()
+            with self.lock:
+                self.thread_connections[thread_id_key] = conn
+        elif conn.state == 'open':
+            idle_since = self._released_at.get(thread_id_key)
+            if not self._is_reusable(conn, idle_since):
+                self.close(conn)
+
+        self._released_at.pop(thread_id_key, None)
 
         if conn.name == name and conn.state == 'open':
             return conn
@@ -206,6 +364,8 @@ class BaseConnectionManager(metaclass=abc.ABCMeta):
             if conn.state == 'open':
                 if conn.transaction_open is True:
                     self._rollback(conn)
+                self._released_at[self.get_thread_identifier()] = \
+                    time.monotonic()
             else:
                 self.close(conn)
         except Exception:
@@ -213,7 +373,25 @@ class BaseConnectionManager(metaclass=abc.ABCMeta):
             self.clear_thread_connection()
             raise
 
+    def release_to_pool(self):
+        """Release this thread's connection and give it to the pool, so other
+        threads can use it. If the pool is full, close it instead.
+        """
+        self.release()
+        key = self.get_thread_identifier()
+        with self.lock:
+            conn = self.thread_connections.pop(key, None)
+        self._released_at.pop(key, None)
+        if conn is None or conn.state != 'open':
+            return
+        if not self.pool.put(conn):
+            self.close(conn)
+
     def cleanup_all(self):
+        for connection in self.pool.drain():
+            self.close(connection)
+        self._released_at.clear()
+
         with self.lock:
             for connection in self.thread_connections.values():
                 if connection.state not in {'closed', 'init'}:
@@ -1,9 +1,13 @@
 import abc
+import json
+import os
+import time
 from contextlib import contextmanager
 from datetime import datetime
+from multiprocessing.dummy import Pool as ThreadPool
 from typing import (
     Optional, Tuple, Callable, Container, FrozenSet, Type, Dict, Any, List,
-    Mapping
+    Mapping, Sequence, Set
 )
 
 import agate
@@ -12,9 +16,11 @@ import pytz
 import dbt.exceptions
 import dbt.flags
 
-from dbt.clients.agate_helper import empty_table
+from dbt.clients.agate_helper import empty_table, merge_tables
+from dbt.clients.system import load_file_contents, write_json
 from dbt.config import RuntimeConfig
 from dbt.contracts.graph.manifest import Manifest
+from dbt.include.global_project import PROJECT_NAME as GLOBAL_PROJECT_NAME
 from dbt.node_types import NodeType
 from dbt.loader import GraphLoader
 from dbt.logger import GLOBAL_LOGGER as logger
@@ -29,6 +35,8 @@ from dbt.adapters.cache import RelationsCache
 
 GET_CATALOG_MACRO_NAME = 'get_catalog'
 FRESHNESS_MACRO_NAME = 'collect_freshness'
+FRESHNESS_BATCH_MACRO_NAME = 'collect_freshness_batch'
+RELATIONS_CACHE_FILE_NAME = 'relations_cache.json'
 
 
 def _expect_row_value(key: str, row: agate.Row):
@@ -214,6 +222,9 @@ class BaseAdapter(metaclass=AdapterMeta):
     def cleanup_connections(self):
         return self.connections.cleanup_all()
 
+    def prewarm_connections(self, count):
+        return self.connections.prewarm(count)
+
     def clear_transaction(self):
         self.connections.clear_transaction()
 
@@ -324,37 +335,171 @@ class BaseAdapter(metaclass=AdapterMeta):
         # schemas
         return info_schema_name_map
 
+    def _list_relations_for_cache(
+        self, search: Tuple[BaseRelation, str]
+    ) -> List[BaseRelation]:
+        """List the relations in a schema on this thread's connection, then
+        give the connection to the pool.
+        """
+        information_schema, schema = search
+        name = 'list_{}_{}'.format(information_schema.database, schema)
+        try:
+            self.acquire_connection(name)
+            return self.list_relations_without_caching(
+                information_schema, schema
+            )
+        finally:
+            self.connections.release_to_pool()
+
     def _relations_cache_for_schemas(self, manifest: Manifest) -> None:
         """Populate the relations cache for the given schemas. Returns an
         iteratble of the schemas populated, as strings.
+
+        Schemas are listed concurrently, with up to 'threads' connections.
         """
         if not dbt.flags.USE_CACHE:
             return
 
         info_schema_name_map = self._get_cache_schemas(manifest,
                                                        exec_only=True)
-        for db, schema in info_schema_name_map.search():
-            for relation in self.list_relations_without_caching(db, schema):
-                self.cache.add(relation)
+        searches = list(info_schema_name_map.search())
+        num_threads = min(self.config.threads, len(searches))
+        if num_threads > 1:
+            pool = ThreadPool(num_threads)
+            try:
+                results = pool.map(self._list_relations_for_cache, searches)
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            results = [
+                self.list_relations_without_caching(db, schema)
+                for db, schema in searches
+            ]
+
+        self.cache.bulk_add(
+            relation for relations in results for relation in relations
+        )
 
         # it's possible that there were no relations in some schemas. We want
         # to insert the schemas we query into the cache's `.schemas` attribute
         # so we can check it later
         self.cache.update_schemas(info_schema_name_map.schemas_searched())
 
+    def get_relations_fingerprint(
+        self, schemas: Set[Tuple[str, str]]
+    ) -> Optional[str]:
+        """Get a cheap fingerprint of the relations in the given schemas,
+        that changes whenever a relation in them is created, dropped or
+        renamed. Adapters that can't compute one return None.
+
+        :param schemas: The (database, schema) pairs to fingerprint, as
+            lowercase strings.
+        """
+        return None
+
+    def _relations_cache_path(self) -> str:
+        return os.path.join(self.config.target_path, RELATIONS_CACHE_FILE_NAME)
+
+    def _load_relations_cache(self, manifest: Manifest) -> bool:
+        """Load the relations cache saved by `save_relations_cache`, if it
+        covers every schema in the manifest and is still valid. It is valid if
+        it is younger than the relations cache TTL, or if the fingerprint of
+        its schemas has not changed since it was saved.
+
+        Returns whether the cache was loaded.
+        """
+        path = self._relations_cache_path()
+        if not os.path.exists(path):
+            return False
+        try:
+            saved = json.loads(load_file_contents(path, strip=False))
+            schemas = {tuple(s) for s in saved['cache']['schemas']}
+            saved_at = float(saved['saved_at'])
+            fingerprint = saved['fingerprint']
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            logger.debug('Could not read the relations cache at {}: {}'
+                         .format(path, exc))
+            return False
+
+        searched = self._get_cache_schemas(manifest, exec_only=True)
+        missing = {
+            (database, schema)
+            for database, schema in searched.schemas_searched()
+            if (database and database.lower(), schema.lower()) not in schemas
+        }
+        if missing:
+            logger.debug('Saved relations cache is missing schemas {}'
+                         .format(missing))
+            return False
+
+        age = time.time() - saved_at
+        if age < dbt.flags.RELATIONS_CACHE_TTL:
+            logger.debug('Reusing relations cache saved {:0.2f}s ago'
+                         .format(age))
+        elif (fingerprint is not None and
+              fingerprint == self.get_relations_fingerprint(schemas)):
+            logger.debug('Reusing relations cache, fingerprint unchanged')
+        else:
+            logger.debug('Saved relations cache is out of date')
+            return False
+
+        self.cache.load(saved['cache'], self.Relation)
+        return True
+
+    def save_relations_cache(self) -> None:
+        """Save the relations cache in the target directory, so the next run
+        can reuse it. This does nothing unless a relations cache TTL is set.
+        """
+        if not dbt.flags.USE_CACHE or dbt.flags.RELATIONS_CACHE_TTL is None:
+            return
+
+        with self.cache.lock:
+            data = self.cache.serialize()
+            fingerprint = self.get_relations_fingerprint(self.cache.schemas)
+        write_json(self._relations_cache_path(), {
+            'saved_at': time.time(),
+            'fingerprint': fingerprint,
+            'cache': data,
+        })
+
+    def discard_saved_relations_cache(self) -> None:
+        """Remove the relations cache saved by `save_relations_cache`, so no
+        later run reuses it.
+        """
+        path = self._relations_cache_path()
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except OSError as exc:
+            logger.debug('Could not remove the relations cache at {}: {}'
+                         .format(path, exc))
+
     def set_relations_cache(
         self, manifest: Manifest, clear: bool = False
     ) -> None:
         """Run a query that gets a populated cache of the relations in the
         database and set the cache on this adapter.
+
+        If a relations cache TTL is set, first try to reuse the cache saved by
+        the last run. The saved cache is always removed: the task is about to
+        change the database, and saves the cache again only if it has a TTL
+        and reaches its end.
         """
         if not dbt.flags.USE_CACHE:
+            self.discard_saved_relations_cache()
             return
 
         with self.cache.lock:
+            loaded = False
             if clear:
                 self.cache.clear()
-            self._relations_cache_for_schemas(manifest)
+            elif dbt.flags.RELATIONS_CACHE_TTL is not None:
+                loaded = self._load_relations_cache(manifest)
+            self.discard_saved_relations_cache()
+            if not loaded:
+                self._relations_cache_for_schemas(manifest)
 
     @available
     def cache_added(self, relation: Optional[BaseRelation]) -> str:
@@ -951,15 +1096,25 @@ class BaseAdapter(metaclass=AdapterMeta):
         return table.where(_catalog_filter_schemas(manifest))
 
     def get_catalog(self, manifest: Manifest) -> agate.Table:
-        """Get the catalog for this manifest by running the get catalog macro.
-        Returns an agate.Table of catalog information.
+        """Get the catalog for this manifest by running the get catalog macro
+        once per database, passing it the schemas the manifest uses in that
+        database. Returns an agate.Table of catalog information.
         """
-        information_schemas = list(self._get_cache_schemas(manifest).keys())
-        # make it a list so macros can index into it.
-        kwargs = {'information_schemas': information_schemas}
-        table = self.execute_macro(GET_CATALOG_MACRO_NAME,
-                                   kwargs=kwargs,
-                                   release=True)
+        tables = []
+        info_schema_name_map = self._get_cache_schemas(manifest)
+        for information_schema, schemas in info_schema_name_map.items():
+            # make it a list so macros can index into it.
+            kwargs = {
+                'information_schemas': [information_schema],
+                'schemas': sorted(schemas),
+            }
+            tables.append(self.execute_macro(GET_CATALOG_MACRO_NAME,
+                                             kwargs=kwargs,
+                                             release=True))
+
+        if not tables:
+            return empty_table()
+        table = merge_tables(tables)
 
         results = self._catalog_filter_table(table, manifest)
         return results
@@ -997,14 +1152,77 @@ class BaseAdapter(metaclass=AdapterMeta):
                     FRESHNESS_MACRO_NAME, [tuple(r) for r in table]
                 )
             )
-        if table[0][0] is None:
+        return self._freshness_from_row(table[0], source, loaded_at_field)
+
+    def calculate_freshness_batch(
+        self,
+        sources: List[Tuple[BaseRelation, str, Optional[str]]],
+        manifest: Optional[Manifest] = None
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Calculate the freshness of many sources with a single query. The
+        sources are (relation, loaded_at_field, filter) tuples. The freshness
+        of each source is returned in the same order, or None if it could not
+        be determined from the batch and must be calculated on its own.
+        """
+        kwargs: Dict[str, Any] = {
+            'sources': [
+                {'source': s, 'loaded_at_field': f, 'filter': flt}
+                for s, f, flt in sources
+            ],
+        }
+        table = self.execute_macro(
+            FRESHNESS_BATCH_MACRO_NAME,
+            kwargs=kwargs,
+            release=True,
+            manifest=manifest
+        )
+        # one row, with the maximum `loaded_at_field` value of each source
+        # and then the current time according to the db.
+        results: List[Optional[Dict[str, Any]]] = [None] * len(sources)
+        if len(table) != 1 or len(table[0]) != len(sources) + 1:
+            return results
+
+        row = table[0]
+        snapshotted_at = row[len(sources)]
+        for idx, (source, loaded_at_field, _) in enumerate(sources):
+            try:
+                results[idx] = self._freshness_from_row(
+                    (row[idx], snapshotted_at), source, loaded_at_field
+                )
+            except dbt.exceptions.RuntimeException:
+                pass
+        return results
+
+    def can_batch_freshness(self, manifest: Manifest) -> bool:
+        """Batched freshness queries replace the default collect_freshness
+        macro. If a project or plugin overrides that macro, return False so
+        each source is checked with the override instead.
+        """
+        default_names = {
+            FRESHNESS_MACRO_NAME,
+            'default__{}'.format(FRESHNESS_MACRO_NAME),
+        }
+        adapter_name = '{}__{}'.format(self.type(), FRESHNESS_MACRO_NAME)
+        for macro in manifest.macros.values():
+            if macro.name == adapter_name:
+                return False
+            if macro.name in default_names and \
+                    macro.package_name != GLOBAL_PROJECT_NAME:
+                return False
+        return True
+
+    @staticmethod
+    def _freshness_from_row(
+        row: Sequence[Any], source: BaseRelation, loaded_at_field: str
+    ) -> Dict[str, Any]:
+        if row[0] is None:
             # no records in the table, so really the max_loaded_at was
             # infinitely long ago. Just call it 0:00 January 1 year UTC
             max_loaded_at = datetime(1, 1, 1, 0, 0, 0, tzinfo=pytz.UTC)
         else:
-            max_loaded_at = _utc(table[0][0], source, loaded_at_field)
+            max_loaded_at = _utc(row[0], source, loaded_at_field)
 
-        snapshotted_at = _utc(table[0][1], source, loaded_at_field)
+        snapshotted_at = _utc(row[1], source, loaded_at_field)
         age = (snapshotted_at - max_loaded_at).total_seconds()
         return {
             'max_loaded_at': max_loaded_at,
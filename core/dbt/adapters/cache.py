@@ -39,10 +39,13 @@ class _CachedRelation:
     :attr str identifier: The identifier of this relation.
     :attr Dict[_ReferenceKey, _CachedRelation] referenced_by: The relations
         that refer to this relation.
+    :attr Set[_ReferenceKey] references: The relations this relation refers
+        to, the reverse of referenced_by.
     :attr BaseRelation inner: The underlying dbt relation.
     """
     def __init__(self, inner):
         self.referenced_by = {}
+        self.references = set()
         self.inner = inner
 
     def __str__(self):
@@ -71,6 +74,8 @@ class _CachedRelation:
         new = self.__class__(self.inner.incorporate())
         new.__dict__.update(self.__dict__)
         new.referenced_by = deepcopy(self.referenced_by, memo)
+        new.references = set(self.references)
+        return new
 
     def is_referenced_by(self, key):
         return key in self.referenced_by
@@ -89,6 +94,7 @@ class _CachedRelation:
         :param _CachedRelation referrer: The node that refers to this node.
         """
         self.referenced_by[referrer.key()] = referrer
+        referrer.references.add(self.key())
 
     def collect_consequences(self):
         """Recursively collect a set of _ReferenceKeys that would
@@ -172,6 +178,10 @@ class RelationsCache:
     """A cache of the relations known to dbt. Keeps track of relationships
     declared between tables and handles renames/drops as a real database would.
 
+    Updates hold the lock, but only touch the relations they change and the
+    relations linked to them. `get_relations` does not take the lock: it reads
+    a per-schema index whose values are replaced, never modified, by updates.
+
     :attr Dict[_ReferenceKey, _CachedRelation] relations: The known relations.
     :attr threading.RLock lock: The lock around relations, held during updates.
         The adapters also hold this lock while filling the cache.
@@ -181,6 +191,8 @@ class RelationsCache:
         self.relations = {}
         self.lock = threading.RLock()
         self.schemas = set()
+        # (database, schema) -> {_ReferenceKey: BaseRelation}
+        self._schema_index = {}
 
     def add_schema(self, database, schema):
         """Add a schema to the set of known schemas (case-insensitive)
@@ -217,6 +229,32 @@ class RelationsCache:
         db, schema = schema_id
         return (_lower(db), _lower(schema)) in self.schemas
 
+    def _index_set(self, key, inner):
+        """Set a relation in the schema index. Must hold the lock."""
+        schema_id = (key.database, key.schema)
+        relations = dict(self._schema_index.get(schema_id, {}))
+        relations[key] = inner
+        self._schema_index[schema_id] = relations
+
+    def _index_remove(self, keys):
+        """Remove relations from the schema index. Must hold the lock."""
+        by_schema = {}
+        for key in keys:
+            by_schema.setdefault((key.database, key.schema), set()).add(key)
+        for schema_id, removed in by_schema.items():
+            self._schema_index[schema_id] = {
+                k: v for k, v in self._schema_index.get(schema_id, {}).items()
+                if k not in removed
+            }
+
+    def _rebuild_index(self):
+        """Rebuild the whole schema index. Must hold the lock."""
+        index = {}
+        for key, cached in self.relations.items():
+            index.setdefault((key.database, key.schema), {})[key] = \
+                cached.inner
+        self._schema_index = index
+
     def dump_graph(self):
         """Dump a key-only representation of the schema to a dictionary. Every
         known relation is a key with a value of a list of keys it is referenced
@@ -240,7 +278,10 @@ class RelationsCache:
         """
         self.add_schema(relation.database, relation.schema)
         key = relation.key()
-        return self.relations.setdefault(key, relation)
+        if key not in self.relations:
+            self.relations[key] = relation
+            self._index_set(key, relation.inner)
+        return self.relations[key]
 
     def _add_link(self, referenced_key, dependent_key):
         """Add a link between two relations to the database. Both the old and
@@ -316,6 +357,23 @@ class RelationsCache:
 
         lazy_log('after adding: {!s}', self.dump_graph)
 
+    def bulk_add(self, relations):
+        """Add many relations to the cache at once, holding the lock only
+        once. This is used to populate the cache.
+
+        :param Iterable[BaseRelation] relations: The underlying relations.
+        """
+        cached = [_CachedRelation(r) for r in relations]
+        logger.debug('Adding {} relations'.format(len(cached)))
+
+        with self.lock:
+            for relation in cached:
+                self.add_schema(relation.database, relation.schema)
+                self.relations.setdefault(relation.key(), relation)
+            self._rebuild_index()
+
+        lazy_log('after adding: {!s}', self.dump_graph)
+
     def _remove_refs(self, keys):
         """Removes all references to all entries in keys. This does not
         cascade!
@@ -323,11 +381,14 @@ class RelationsCache:
         :param Iterable[_ReferenceKey] keys: The keys to remove.
         """
         # remove direct refs
-        for key in keys:
-            del self.relations[key]
-        # then remove all entries from each child
-        for cached in self.relations.values():
-            cached.release_references(keys)
+        removed = [self.relations.pop(key) for key in keys]
+        self._index_remove(keys)
+        # then remove the entries from the relations they referred to
+        for cached in removed:
+            for referenced_key in cached.references:
+                referenced = self.relations.get(referenced_key)
+                if referenced is not None:
+                    referenced.release_references(keys)
 
     def _drop_cascade_relation(self, dropped):
         """Drop the given relation and cascade it appropriately to all
@@ -373,20 +434,27 @@ class RelationsCache:
         # basically, the name changes but some underlying ID moves. Kind of
         # like an object reference!
         relation = self.relations.pop(old_key)
+        self._index_remove([old_key])
         new_key = new_relation.key()
 
         # relaton has to rename its innards, so it needs the _CachedRelation.
         relation.rename(new_relation)
-        # update all the relations that refer to it
-        for cached in self.relations.values():
-            if cached.is_referenced_by(old_key):
+        # update all the relations that it refers to
+        for referenced_key in relation.references:
+            cached = self.relations.get(referenced_key)
+            if cached is not None and cached.is_referenced_by(old_key):
                 logger.debug(
                     'updated reference from {0} -> {2} to {1} -> {2}'
                     .format(old_key, new_key, cached.key())
                 )
                 cached.rename_key(old_key, new_key)
+        # and the relations that refer to it
+        for referrer in relation.referenced_by.values():
+            referrer.references.discard(old_key)
+            referrer.references.add(new_key)
 
         self.relations[new_key] = relation
+        self._index_set(new_key, relation.inner)
         # also fixup the schemas!
         self.remove_schema(old_key.database, old_key.schema)
         self.add_schema(new_key.database, new_key.schema)
@@ -455,13 +523,9 @@ class RelationsCache:
         :return List[BaseRelation]: The list of relations with the given
             schema
         """
-        schema = _lower(schema)
-        with self.lock:
-            results = [
-                r.inner for r in self.relations.values()
-                if (r.schema == _lower(schema) and
-                    r.database == _lower(database))
-            ]
+        # the index values are never modified, so no lock is needed
+        schema_id = (_lower(database), _lower(schema))
+        results = list(self._schema_index.get(schema_id, {}).values())
 
         if None in results:
             dbt.exceptions.raise_cache_inconsistent(
@@ -469,8 +533,50 @@ class RelationsCache:
             )
         return results
 
+    def serialize(self):
+        """Return a JSON-serializable representation of the cache, that
+        `load` can read back.
+        """
+        with self.lock:
+            return {
+                'schemas': [list(schema) for schema in self.schemas],
+                'relations': [
+                    {
+                        'relation': cached.inner.serialize(),
+                        'referenced_by': [
+                            list(key) for key in cached.referenced_by
+                        ],
+                    }
+                    for cached in self.relations.values()
+                ],
+            }
+
+    def load(self, data, relation_cls):
+        """Replace the contents of the cache with the output of `serialize`.
+
+        :param Dict[str, Any] data: The serialized cache.
+        :param Type[BaseRelation] relation_cls: The relation class to
+            deserialize relations as.
+        """
+        entries = [
+            (_CachedRelation(relation_cls.deserialize(entry['relation'])),
+             entry['referenced_by'])
+            for entry in data['relations']
+        ]
+        with self.lock:
+            self.clear()
+            for cached, _ in entries:
+                self.add_schema(cached.database, cached.schema)
+                self.relations.setdefault(cached.key(), cached)
+            self._rebuild_index()
+            for cached, referenced_by in entries:
+                for dependent in referenced_by:
+                    self._add_link(cached.key(), _ReferenceKey(*dependent))
+            self.update_schemas(data['schemas'])
+
     def clear(self):
         """Clear the cache"""
         with self.lock:
             self.relations.clear()
             self.schemas.clear()
+            self._schema_index = {}
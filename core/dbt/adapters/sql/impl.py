@@ -17,6 +17,7 @@ RENAME_RELATION_MACRO_NAME = 'rename_relation'
 TRUNCATE_RELATION_MACRO_NAME = 'truncate_relation'
 DROP_RELATION_MACRO_NAME = 'drop_relation'
 ALTER_COLUMN_TYPE_MACRO_NAME = 'alter_column_type'
+GET_RELATIONS_FINGERPRINT_MACRO_NAME = 'get_relations_fingerprint'
 
 
 class SQLAdapter(BaseAdapter):
@@ -198,6 +199,18 @@ class SQLAdapter(BaseAdapter):
     def quote(cls, identifier):
         return '"{}"'.format(identifier)
 
+    def get_relations_fingerprint(self, schemas):
+        if not schemas:
+            return None
+        kwargs = {'schemas': list(schemas)}
+        results = self.execute_macro(
+            GET_RELATIONS_FINGERPRINT_MACRO_NAME,
+            kwargs=kwargs
+        )
+        if results is None:
+            return None
+        return str(results[0][0])
+
     def list_schemas(self, database):
         results = self.execute_macro(
             LIST_SCHEMAS_MACRO_NAME,
@@ -0,0 +1,73 @@
+from typing import Any, Dict, List, NamedTuple
+
+import jinja2.nodes
+
+
+class StaticCall(NamedTuple):
+    name: str
+    args: List[Any]
+    kwargs: Dict[str, Any]
+
+
+class NotStatic(Exception):
+    """Raised when a template can't be statically analyzed."""
+
+
+def _literal(node):
+    if isinstance(node, jinja2.nodes.Const):
+        return node.value
+    elif isinstance(node, jinja2.nodes.List):
+        return [_literal(item) for item in node.items]
+    elif isinstance(node, jinja2.nodes.Tuple):
+        return tuple(_literal(item) for item in node.items)
+    elif isinstance(node, jinja2.nodes.Dict):
+        result = {}
+        for pair in node.items:
+            key = _literal(pair.key)
+            try:
+                result[key] = _literal(pair.value)
+            except TypeError:
+                # unhashable key
+                raise NotStatic()
+        return result
+    raise NotStatic()
+
+
+def _call(node, names):
+    if not isinstance(node, jinja2.nodes.Call):
+        raise NotStatic()
+    if node.dyn_args is not None or node.dyn_kwargs is not None:
+        raise NotStatic()
+    if not isinstance(node.node, jinja2.nodes.Name):
+        raise NotStatic()
+    if node.node.name not in names:
+        raise NotStatic()
+
+    return StaticCall(
+        name=node.node.name,
+        args=[_literal(a) for a in node.args],
+        kwargs={kw.key: _literal(kw.value) for kw in node.kwargs},
+    )
+
+
+def find_static_calls(template, names):
+    """Find the calls to the given function names in the template, in the
+    order they would be rendered. If the template does anything besides
+    output plain text and call those functions with literal arguments,
+    return None.
+    """
+    calls = []
+    try:
+        for node in template.body:
+            if isinstance(node, jinja2.nodes.Output):
+                for child in node.nodes:
+                    if not isinstance(child, jinja2.nodes.TemplateData):
+                        calls.append(_call(child, names))
+            elif isinstance(node, jinja2.nodes.ExprStmt):
+                # {% do ... %}
+                calls.append(_call(node.node, names))
+            else:
+                return None
+    except NotStatic:
+        return None
+    return calls
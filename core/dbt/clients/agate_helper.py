@@ -1,12 +1,18 @@
 from codecs import BOM_UTF8
+from itertools import islice
 
 import agate
+import csv
 import json
 
+import dbt.exceptions
+
 
 BOM = BOM_UTF8.decode('utf-8')  # '\ufeff'
 
-DEFAULT_TYPE_TESTER = agate.TypeTester(types=[
+TEXT_TYPE = agate.data_types.Text(null_values=('null', ''))
+
+DEFAULT_TYPES = [
     agate.data_types.Number(null_values=('null', '')),
     agate.data_types.TimeDelta(null_values=('null', '')),
     agate.data_types.Date(null_values=('null', '')),
@@ -14,8 +20,10 @@ DEFAULT_TYPE_TESTER = agate.TypeTester(types=[
     agate.data_types.Boolean(true_values=('true',),
                              false_values=('false',),
                              null_values=('null', '')),
-    agate.data_types.Text(null_values=('null', ''))
-])
+    TEXT_TYPE,
+]
+
+DEFAULT_TYPE_TESTER = agate.TypeTester(types=DEFAULT_TYPES)
 
 
 def table_from_data(data, column_names):
@@ -55,14 +63,139 @@ def empty_table():
     return agate.Table(rows=[])
 
 
+def merge_tables(tables):
+    """Merge the rows of the given tables into one table. Column types are
+    inferred once from all of the rows, so tables whose types were inferred
+    differently (like an empty table and one with values) can be merged.
+    """
+    if len(tables) == 1:
+        return tables[0]
+
+    column_names = []
+    for table in tables:
+        for name in table.column_names:
+            if name not in column_names:
+                column_names.append(name)
+
+    rows = [dict(row.items()) for table in tables for row in table.rows]
+    for row in rows:
+        for name in column_names:
+            row.setdefault(name, None)
+    return table_from_data(rows, column_names)
+
+
 def as_matrix(table):
     "Return an agate table as a matrix of data sans columns"
 
     return [r.values() for r in table.rows.values()]
 
 
-def from_csv(abspath):
-    with open(abspath, encoding='utf-8') as fp:
-        if fp.read(1) != BOM:
-            fp.seek(0)
-        return agate.Table.from_csv(fp, column_types=DEFAULT_TYPE_TESTER)
+# seeds with more rows than this are streamed from disk, with column types
+# inferred from this many rows
+STREAMING_SAMPLE_SIZE = 10000
+
+
+def _type_tester(text_columns):
+    """Get the type tester for a csv file. Columns in text_columns are
+    always read as text, so their values are loaded as written.
+    """
+    if not text_columns:
+        return DEFAULT_TYPE_TESTER
+    return agate.TypeTester(
+        force={name: TEXT_TYPE for name in text_columns},
+        types=DEFAULT_TYPES
+    )
+
+
+def _open_csv(abspath):
+    fp = open(abspath, encoding='utf-8')
+    if fp.read(1) != BOM:
+        fp.seek(0)
+    return fp
+
+
+def from_csv(abspath, text_columns=()):
+    with _open_csv(abspath) as fp:
+        return agate.Table.from_csv(fp,
+                                    column_types=_type_tester(text_columns))
+
+
+class _StreamedRows:
+    """The rows of a csv file, read and cast each time they are iterated
+    over. The length is counted on first use.
+    """
+    def __init__(self, abspath, column_names, column_types, sample_size):
+        self.abspath = abspath
+        self.column_names = column_names
+        self.column_types = column_types
+        self.sample_size = sample_size
+        self._length = None
+
+    def _read(self):
+        with _open_csv(self.abspath) as fp:
+            reader = csv.reader(fp)
+            next(reader)  # the header
+            yield from reader
+
+    def __iter__(self):
+        width = len(self.column_names)
+        # line numbers are only right if there are no multi-line values
+        for lineno, row in enumerate(self._read(), start=2):
+            if len(row) > width:
+                dbt.exceptions.raise_compiler_error(
+                    'Row {} of {} has {} values, but there are {} columns'
+                    .format(lineno, self.abspath, len(row), width)
+                )
+            row.extend([None] * (width - len(row)))
+            try:
+                yield agate.Row(
+                    [t.cast(v) for t, v in zip(self.column_types, row)],
+                    self.column_names
+                )
+            except agate.exceptions.CastError as exc:
+                dbt.exceptions.raise_compiler_error(
+                    'Row {} of {}: {} Column types were inferred from the '
+                    'first {} rows, set column_types in the seed config to '
+                    'override them.'
+                    .format(lineno, self.abspath, exc, self.sample_size)
+                )
+
+    def __len__(self):
+        if self._length is None:
+            self._length = sum(1 for _ in self._read())
+        return self._length
+
+
+class StreamingTable(agate.Table):
+    """An agate table of the first rows of a csv file. Its column types are
+    inferred from those rows, but its `rows` are all of the file's rows, read
+    from disk each time they are iterated over, so memory use does not grow
+    with the size of the file.
+
+    Other agate operations, like aggregations, only see the sampled rows.
+    """
+    def __init__(self, sample, abspath):
+        super().__init__(sample._rows, sample._column_names,
+                         sample._column_types, _is_fork=True)
+        self._streamed_rows = _StreamedRows(abspath, sample._column_names,
+                                            sample._column_types, len(sample))
+
+    @property
+    def rows(self):
+        return self._streamed_rows
+
+
+def streaming_from_csv(abspath, text_columns=(),
+                       sample_size=STREAMING_SAMPLE_SIZE):
+    """Read a csv file like `from_csv`. If it has more than sample_size rows,
+    return a StreamingTable with column types inferred from the first
+    sample_size rows.
+    """
+    with _open_csv(abspath) as fp:
+        sample = list(islice(csv.reader(fp), sample_size + 2))
+    if len(sample) <= sample_size + 1:
+        return from_csv(abspath, text_columns)
+
+    table = agate.Table(sample[1:sample_size + 1], sample[0],
+                        _type_tester(text_columns))
+    return StreamingTable(table, abspath)
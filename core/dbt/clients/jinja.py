@@ -1,7 +1,14 @@
 import codecs
+import hashlib
 import linecache
+import marshal
 import os
+import sys
 import tempfile
+import threading
+import time
+from collections import OrderedDict
+from types import CodeType
 from typing import List, Union, Set, Optional
 
 import jinja2
@@ -13,8 +20,10 @@ import jinja2.sandbox
 
 import dbt.exceptions
 import dbt.utils
+from dbt.version import __version__ as dbt_version
 
 from dbt.clients._jinja_blocks import BlockIterator, BlockData, BlockTag
+from dbt.clients._jinja_static import StaticCall, find_static_calls
 
 from dbt.logger import GLOBAL_LOGGER as logger  # noqa
 
@@ -63,6 +72,151 @@ class MacroFuzzParser(jinja2.parser.Parser):
         return node
 
 
+# how many compiled templates are kept in memory
+BYTECODE_CACHE_SIZE = 4096
+# compiled templates on disk that no invocation used for this long are removed
+BYTECODE_CACHE_MAX_AGE = 7 * 24 * 60 * 60
+# how often the directory is checked for unused templates, and how often a
+# template's modification time is refreshed when it is used
+BYTECODE_CACHE_PRUNE_INTERVAL = 24 * 60 * 60
+_PRUNED_MARKER = '.pruned'
+
+
+class BytecodeCache:
+    """Cache the code objects jinja compiles templates to, keyed by a hash of
+    the template source. The most recently used code is kept in memory, and if
+    a directory is set, also written there so later invocations can skip
+    compilation.
+
+    Files in the directory are touched when they are used, and files no
+    invocation has used in BYTECODE_CACHE_MAX_AGE seconds are removed. That
+    includes the files of other dbt, jinja or python versions, whose keys are
+    never looked up. The directory is in the target path, so `dbt clean`
+    removes it.
+    """
+    def __init__(self, size: int = BYTECODE_CACHE_SIZE) -> None:
+        self.directory: Optional[str] = None
+        self.size = size
+        self._code: 'OrderedDict[str, CodeType]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def set_directory(self, directory: Optional[str]) -> None:
+        if directory is not None:
+            # tasks may change the working directory later
+            directory = os.path.abspath(directory)
+        self.directory = directory
+        if directory is not None and self._prune_due():
+            self.prune()
+
+    @staticmethod
+    def key(source: str, filename: Optional[str], defer_init: bool) -> str:
+        # code objects are specific to the python version, and the code jinja
+        # generates depends on the jinja and dbt versions.
+        prefix = '\0'.join([
+            sys.version, getattr(jinja2, '__version__', ''), dbt_version,
+            str(filename), str(defer_init), '',
+        ])
+        data = (prefix + source).encode('utf-8')
+        return hashlib.sha256(data).hexdigest()
+
+    def _path(self, key: str) -> Optional[str]:
+        if self.directory is None:
+            return None
+        return os.path.join(self.directory, key[:2], key)
+
+    def _remember(self, key: str, code: CodeType) -> None:
+        with self._lock:
+            self._code[key] = code
+            self._code.move_to_end(key)
+            while len(self._code) > self.size:
+                self._code.popitem(last=False)
+
+    def get(self, key: str) -> Optional[CodeType]:
+        with self._lock:
+            if key in self._code:
+                self._code.move_to_end(key)
+                return self._code[key]
+        path = self._path(key)
+        if path is None:
+            return None
+        try:
+            mtime = os.stat(path).st_mtime
+        except OSError:
+            return None
+        try:
+            with open(path, 'rb') as fp:
+                code = marshal.load(fp)
+        except Exception as exc:
+            logger.debug('Could not load compiled template from {}: {}'
+                         .format(path, exc))
+            return None
+        if time.time() - mtime > BYTECODE_CACHE_PRUNE_INTERVAL:
+            # mark the file as used, so it isn't pruned
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+        self._remember(key, code)
+        return code
+
+    def set(self, key: str, code: CodeType) -> None:
+        self._remember(key, code)
+        path = self._path(key)
+        if path is None:
+            return
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # write to a temporary file and rename it, so other threads and
+            # processes never see a partial file
+            tmp_path = '{}.{}.tmp'.format(path, os.getpid())
+            with open(tmp_path, 'wb') as fp:
+                marshal.dump(code, fp)
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            logger.debug('Could not write compiled template to {}: {}'
+                         .format(path, exc))
+
+    def _prune_due(self) -> bool:
+        marker = os.path.join(self.directory, _PRUNED_MARKER)
+        try:
+            age = time.time() - os.stat(marker).st_mtime
+        except OSError:
+            return os.path.isdir(self.directory)
+        return age > BYTECODE_CACHE_PRUNE_INTERVAL
+
+    def prune(self, max_age: float = BYTECODE_CACHE_MAX_AGE) -> None:
+        """Remove the files in the directory that were not used in the last
+        max_age seconds.
+        """
+        if self.directory is None or not os.path.isdir(self.directory):
+            return
+        cutoff = time.time() - max_age
+        removed = 0
+        try:
+            for shard in os.scandir(self.directory):
+                if not shard.is_dir():
+                    continue
+                for entry in os.scandir(shard.path):
+                    if entry.stat().st_mtime < cutoff:
+                        os.remove(entry.path)
+                        removed += 1
+            with open(os.path.join(self.directory, _PRUNED_MARKER), 'w'):
+                pass
+        except OSError as exc:
+            logger.debug('Could not prune compiled templates in {}: {}'
+                         .format(self.directory, exc))
+        if removed:
+            logger.debug('Removed {} unused compiled templates from {}'
+                         .format(removed, self.directory))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._code.clear()
+
+
+bytecode_cache = BytecodeCache()
+
+
 class MacroFuzzEnvironment(jinja2.sandbox.SandboxedEnvironment):
     def _parse(self, source, name, filename):
         return MacroFuzzParser(
@@ -85,6 +239,26 @@ class MacroFuzzEnvironment(jinja2.sandbox.SandboxedEnvironment):
 
         return super()._compile(source, filename)
 
+    def compile(self, source, name=None, filename=None, raw=False,
+                defer_init=False):
+        """Override jinja's compilation to look up and store compiled
+        templates in the bytecode cache.
+        """
+        use_cache = (
+            isinstance(source, str) and
+            not raw and
+            not dbt.utils.env_set_truthy('DBT_MACRO_DEBUGGING')
+        )
+        if not use_cache:
+            return super().compile(source, name, filename, raw, defer_init)
+
+        key = bytecode_cache.key(source, filename, defer_init)
+        code = bytecode_cache.get(key)
+        if code is None:
+            code = super().compile(source, name, filename, raw, defer_init)
+            bytecode_cache.set(key, code)
+        return code
+
 
 class TemplateCache:
 
@@ -247,18 +421,29 @@ def create_macro_capture_env(node):
     return ParserMacroCapture
 
 
-def get_environment(node=None, capture_macros=False):
-    args = {
-        'extensions': ['jinja2.ext.do']
-    }
+def _make_environment(**kwargs):
+    return MacroFuzzEnvironment(
+        extensions=[
+            'jinja2.ext.do', MaterializationExtension, DocumentationExtension
+        ],
+        **kwargs
+    )
 
-    if capture_macros:
-        args['undefined'] = create_macro_capture_env(node)
 
-    args['extensions'].append(MaterializationExtension)
-    args['extensions'].append(DocumentationExtension)
+_SHARED_ENVIRONMENT = None
 
-    return MacroFuzzEnvironment(**args)
+
+def get_environment(node=None, capture_macros=False):
+    """Get a jinja environment. Macro-capturing environments are specific to
+    the node, everything else shares a single environment.
+    """
+    global _SHARED_ENVIRONMENT
+    if capture_macros:
+        return _make_environment(undefined=create_macro_capture_env(node))
+
+    if _SHARED_ENVIRONMENT is None:
+        _SHARED_ENVIRONMENT = _make_environment()
+    return _SHARED_ENVIRONMENT
 
 
 def parse(string):
@@ -302,6 +487,22 @@ def get_rendered(string, ctx, node=None,
     return render_template(template, ctx, node)
 
 
+def extract_static_calls(
+    string: str, names: Set[str]
+) -> Optional[List[StaticCall]]:
+    """Statically extract the calls to the given function names from a jinja
+    string, without rendering it. If the string does anything besides output
+    text and call those functions with literal arguments, or if it can't be
+    parsed, return None.
+    """
+    try:
+        template = get_environment().parse(str(string))
+    except (jinja2.exceptions.TemplateSyntaxError,
+            jinja2.exceptions.UndefinedError):
+        return None
+    return find_static_calls(template, names)
+
+
 def undefined_error(msg):
     raise jinja2.exceptions.UndefinedError(msg)
 
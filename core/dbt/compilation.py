@@ -1,14 +1,22 @@
+import hashlib
 import itertools
+import json
+import multiprocessing
 import os
+import re
+import threading
 from collections import defaultdict
 
 import dbt.utils
 import dbt.include
 import dbt.tracking
+import dbt.version
 
+from dbt.adapters.factory import get_adapter
 from dbt.utils import get_materialization, NodeType, is_type
 from dbt.linker import Linker
 
+import dbt.context.common
 import dbt.context.runtime
 import dbt.contracts.project
 import dbt.exceptions
@@ -21,6 +29,7 @@ from dbt.contracts.graph.parsed import ParsedNode
 from dbt.logger import GLOBAL_LOGGER as logger
 
 graph_file_name = 'graph.gpickle'
+compile_cache_file_name = 'compile_cache.json'
 
 
 def _compiled_type_for(model: ParsedNode):
@@ -107,21 +116,17 @@ class Compiler:
         dbt.clients.system.make_directory(self.config.target_path)
         dbt.clients.system.make_directory(self.config.modules_path)
 
-    def compile_node(self, node, manifest, extra_context=None):
+    def render_node(self, node, manifest, extra_context=None):
+        """Render the raw SQL of a node, without injecting the CTEs of its
+        ephemeral ancestors. Rendering only reads the manifest, so it can run
+        in a worker process with a copy of it.
+        """
         if extra_context is None:
             extra_context = {}
 
         logger.debug("Compiling {}".format(node.unique_id))
 
-        data = node.to_dict()
-        data.update({
-            'compiled': False,
-            'compiled_sql': None,
-            'extra_ctes_injected': False,
-            'extra_ctes': [],
-            'injected_sql': None,
-        })
-        compiled_node = _compiled_type_for(node).from_dict(data)
+        compiled_node = _new_compiled_node(node)
 
         context = dbt.context.runtime.generate(
             compiled_node, self.config, manifest)
@@ -133,7 +138,12 @@ class Compiler:
             node)
 
         compiled_node.compiled = True
+        return compiled_node
 
+    def inject_node(self, compiled_node, manifest):
+        """Inject the CTEs of a rendered node's ephemeral ancestors, which must
+        already be compiled in the manifest, and wrap its SQL.
+        """
         injected_node, _ = prepend_ctes(compiled_node, manifest)
 
         should_wrap = {NodeType.Test, NodeType.Operation}
@@ -165,6 +175,18 @@ class Compiler:
 
         return injected_node
 
+    def compile_node(self, node, manifest, extra_context=None, cache=None):
+        compiled_node = None
+        if cache is not None and not extra_context:
+            compiled_node = cache.lookup(node, manifest)
+
+        if compiled_node is None:
+            compiled_node = self.render_node(node, manifest, extra_context)
+            if cache is not None and not extra_context:
+                cache.store(node, manifest, compiled_node)
+
+        return self.inject_node(compiled_node, manifest)
+
     def write_graph_file(self, linker, manifest):
         filename = graph_file_name
         graph_path = os.path.join(self.config.target_path, filename)
@@ -226,9 +248,28 @@ def _is_writable(node):
     return True
 
 
-def compile_node(adapter, config, node, manifest, extra_context, write=True):
+def _new_compiled_node(node, compiled_sql=None, extra_ctes=None,
+                       validate=True, data=None):
+    if data is None:
+        data = node.to_dict()
+    data.update({
+        'compiled': compiled_sql is not None,
+        'compiled_sql': compiled_sql,
+        'extra_ctes_injected': False,
+        'extra_ctes': [] if extra_ctes is None else extra_ctes,
+        'injected_sql': None,
+    })
+    return _compiled_type_for(node).from_dict(data, validate=validate)
+
+
+def compile_node(adapter, config, node, manifest, extra_context, write=True,
+                 cache=None):
     compiler = Compiler(config)
-    node = compiler.compile_node(node, manifest, extra_context)
+    node = compiler.compile_node(node, manifest, extra_context, cache)
+    return _finish_node(adapter, config, node, extra_context, write)
+
+
+def _finish_node(adapter, config, node, extra_context, write=True):
     node = _inject_runtime_config(adapter, node, extra_context)
 
     if write and _is_writable(node):
@@ -260,3 +301,286 @@ def _node_context(adapter, node):
         "run_started_at": dbt.tracking.active_user.run_started_at,
         "invocation_id": dbt.tracking.active_user.invocation_id,
     }
+
+
+# context members whose values can differ between runs of an unchanged
+# project, or that have side effects when a node is rendered
+_VOLATILE_NAMES = frozenset({
+    'env_var', 'run_started_at', 'invocation_id', 'graph', 'flags', 'write',
+    'log', 'datetime',
+})
+# adapter members that don't depend on the state of the warehouse
+_STABLE_ADAPTER_MEMBERS = frozenset({
+    'Relation', 'config', 'convert_type', 'quote', 'quote_as_configured',
+    'type',
+})
+_ADAPTER_MEMBER_RE = re.compile(r'\badapter\s*\.\s*(\w+)')
+_TOKEN_RE = re.compile(r'\w+')
+
+
+def _is_volatile_sql(sql, tokens):
+    if not tokens.isdisjoint(_VOLATILE_NAMES):
+        return True
+    members = _ADAPTER_MEMBER_RE.findall(sql)
+    return not _STABLE_ADAPTER_MEMBERS.issuperset(members)
+
+
+class _VolatileMacros:
+    """The names of the macros that use a volatile context member or query
+    the warehouse, directly or through other macros. Calls are found by name,
+    so a node that mentions one of these names anywhere is treated as calling
+    it.
+    """
+    def __init__(self, macros, generation):
+        self.macros = macros
+        # the manifest's macros generation these names were found at
+        self.generation = generation
+
+        tokens_by_name = defaultdict(set)
+        volatile = set()
+        for macro in macros.values():
+            tokens = set(_TOKEN_RE.findall(macro.macro_sql))
+            # adapter_macro('name') dispatches to '<adapter>__name'
+            names = {macro.name, macro.name.split('__', 1)[-1]}
+            for name in names:
+                tokens_by_name[name].update(tokens)
+            if _is_volatile_sql(macro.macro_sql, tokens):
+                volatile.update(names)
+
+        changed = True
+        while changed:
+            changed = False
+            for name, tokens in tokens_by_name.items():
+                if name not in volatile and not tokens.isdisjoint(volatile):
+                    volatile.add(name)
+                    changed = True
+
+        self.names = frozenset(volatile)
+        digest = hashlib.sha256()
+        for unique_id in sorted(macros):
+            digest.update(unique_id.encode('utf-8'))
+            digest.update(macros[unique_id].macro_sql.encode('utf-8'))
+        self.digest = digest.hexdigest()
+
+
+class CompileCache:
+    """Reuse the rendered SQL of nodes from earlier invocations.
+
+    Each entry is keyed by a fingerprint of everything rendering a node reads:
+    the node itself, the relations it refers to, the project's macros, vars,
+    quoting and target, and the dbt version. The CTEs of ephemeral ancestors
+    are injected after rendering, so they are not part of the fingerprint.
+    Nodes that use a volatile context member like env_var() or that query the
+    warehouse, directly or through a macro, are always rendered.
+    """
+    def __init__(self, config, entries=None):
+        self.config = config
+        self.entries = {} if entries is None else entries
+        self._lock = threading.Lock()
+        self._macros = None
+        self._base_fingerprint = None
+        self._fingerprints = {}
+
+    @staticmethod
+    def path(config):
+        return os.path.join(config.target_path, compile_cache_file_name)
+
+    @classmethod
+    def load(cls, config):
+        path = cls.path(config)
+        entries = {}
+        if os.path.exists(path):
+            try:
+                entries = json.loads(
+                    dbt.clients.system.load_file_contents(path, strip=False)
+                )
+            except (OSError, ValueError) as exc:
+                logger.debug('Could not read the compile cache at {}: {}'
+                             .format(path, exc))
+        return cls(config, entries)
+
+    def write(self, manifest):
+        entries = {
+            k: v for k, v in self.entries.items() if k in manifest.nodes
+        }
+        dbt.clients.system.write_json(self.path(self.config), entries)
+
+    def _volatile_macros(self, manifest):
+        with self._lock:
+            macros = self._macros
+            generation = manifest.generation('macros')
+            if (macros is None or macros.macros is not manifest.macros or
+                    macros.generation != generation):
+                macros = _VolatileMacros(manifest.macros, generation)
+                self._macros = macros
+                self._base_fingerprint = None
+                self._fingerprints = {}
+        return macros
+
+    def _get_base_fingerprint(self, macros):
+        if self._base_fingerprint is None:
+            target = dbt.context.common.generate_target_context(self.config)
+            self._base_fingerprint = {
+                'dbt_version': dbt.version.__version__,
+                'macros': macros.digest,
+                'target': dict(target),
+                'quoting': self.config.quoting,
+                'vars': self.config.cli_vars,
+            }
+        return self._base_fingerprint
+
+    def fingerprint(self, node, manifest, data=None):
+        """Return the fingerprint of the node, or None if it can't be
+        cached. If given, data is the node as a dict.
+        """
+        macros = self._volatile_macros(manifest)
+        if node.unique_id in self._fingerprints:
+            return self._fingerprints[node.unique_id]
+
+        tokens = set(_TOKEN_RE.findall(node.raw_sql))
+        if (_is_volatile_sql(node.raw_sql, tokens) or
+                not tokens.isdisjoint(macros.names)):
+            fingerprint = None
+        else:
+            dependencies = {}
+            for unique_id in node.depends_on_nodes:
+                dependency = manifest.nodes.get(unique_id)
+                if dependency is None:
+                    continue
+                # the parts of a dependency that ref() and source() render
+                relation = {
+                    'database': dependency.database,
+                    'schema': dependency.schema,
+                }
+                if dependency.resource_type == NodeType.Source:
+                    relation['identifier'] = dependency.identifier
+                    relation['quoting'] = dependency.quoting.to_dict()
+                else:
+                    relation['alias'] = dependency.alias
+                    relation['materialized'] = get_materialization(dependency)
+                dependencies[unique_id] = relation
+            data = {
+                'base': self._get_base_fingerprint(macros),
+                'node': node.to_dict() if data is None else data,
+                'dependencies': dependencies,
+            }
+            fingerprint = hashlib.sha256(
+                json.dumps(data, sort_keys=True, default=str).encode('utf-8')
+            ).hexdigest()
+
+        self._fingerprints[node.unique_id] = fingerprint
+        return fingerprint
+
+    def lookup(self, node, manifest):
+        """Return the node rendered from the cache, or None on a miss."""
+        entry = self.entries.get(node.unique_id)
+        if entry is None:
+            return None
+
+        data = node.to_dict()
+        if entry.get('fingerprint') != self.fingerprint(node, manifest, data):
+            return None
+
+        logger.debug('Using cached SQL for {}'.format(node.unique_id))
+        # the node is validated once its CTEs are injected
+        return _new_compiled_node(node, entry['compiled_sql'],
+                                  entry['extra_ctes'], validate=False,
+                                  data=data)
+
+    def store(self, node, manifest, compiled_node):
+        fingerprint = self.fingerprint(node, manifest)
+        if fingerprint is None:
+            self.entries.pop(node.unique_id, None)
+            return
+
+        self.entries[node.unique_id] = {
+            'fingerprint': fingerprint,
+            'compiled_sql': compiled_node.compiled_sql,
+            'extra_ctes': [cte.to_dict() for cte in compiled_node.extra_ctes],
+        }
+
+
+# the config and manifest that compile worker processes render nodes from.
+# They are set before the workers are forked, so each worker inherits them
+# once instead of receiving them with every node.
+_WORKER_STATE = None
+
+
+def _init_compile_worker():
+    config, _ = _WORKER_STATE
+    # the adapter's connections belong to the parent process
+    get_adapter(config).connections.reset_after_fork()
+
+
+def _render_in_worker(unique_id):
+    """Render the node with the given unique ID in a worker process. Return
+    the rendered node, or None if it could not be rendered there, for example
+    because it runs introspective queries.
+    """
+    config, manifest = _WORKER_STATE
+    node = manifest.nodes[unique_id]
+    try:
+        return Compiler(config).render_node(node, manifest), None
+    except Exception as exc:
+        return None, str(exc)
+
+
+class CompilePool:
+    """Render nodes in a pool of forked worker processes, so compilation is
+    not limited to a single core.
+
+    Workers have no warehouse connections: a node that runs a query while it
+    is rendered fails in the worker, and is compiled again in the calling
+    thread with that thread's connection. So are nodes that fail to render for
+    any other reason, so their errors are reported as usual.
+    """
+    def __init__(self, pool):
+        self.pool = pool
+
+    @classmethod
+    def start(cls, config, manifest, processes):
+        """Start a pool with the given number of processes, or return None if
+        this platform can't fork.
+        """
+        global _WORKER_STATE
+        if 'fork' not in multiprocessing.get_all_start_methods():
+            logger.debug('Cannot fork, compiling in threads instead')
+            return None
+
+        _WORKER_STATE = (config, manifest)
+        pool = multiprocessing.get_context('fork').Pool(
+            processes, initializer=_init_compile_worker
+        )
+        return cls(pool)
+
+    def compile_node(self, adapter, config, node, manifest, cache=None):
+        rendered = None
+        if cache is not None:
+            rendered = cache.lookup(node, manifest)
+
+        if rendered is None:
+            rendered, error = self.pool.apply(_render_in_worker,
+                                              (node.unique_id,))
+            if rendered is None:
+                logger.debug('Could not render {} in a worker process, '
+                             'compiling it in-process: {}'
+                             .format(node.unique_id, error))
+                return compile_node(adapter, config, node, manifest, {},
+                                    cache=cache)
+            if cache is not None:
+                cache.store(node, manifest, rendered)
+
+        compiled = Compiler(config).inject_node(rendered, manifest)
+        return _finish_node(adapter, config, compiled, {})
+
+    def close(self):
+        global _WORKER_STATE
+        self.pool.close()
+        self.pool.join()
+        _WORKER_STATE = None
+
+    def terminate(self):
+        global _WORKER_STATE
+        self.pool.terminate()
+        self.pool.join()
+        _WORKER_STATE = None
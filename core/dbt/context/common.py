@@ -1,7 +1,10 @@
 import agate
+import jinja2
 import json
 import os
-from typing import Union, Callable
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, Union, Callable, Dict, Tuple
 
 from dbt.adapters.factory import get_adapter
 from dbt.node_types import NodeType
@@ -10,6 +13,7 @@ from dbt.include.global_project import PROJECT_NAME as GLOBAL_PROJECT_NAME
 
 import dbt.clients.jinja
 import dbt.clients.agate_helper
+from dbt.context.dependencies import record_env_var, record_var, TargetDict
 from dbt.contracts.graph.compiled import CompiledSeedNode
 from dbt.contracts.graph.parsed import ParsedSeedNode
 import dbt.exceptions
@@ -88,44 +92,129 @@ class BaseResolver:
         return self.db_wrapper.Relation
 
 
-def _add_macro_map(context, package_name, macro_map):
-    """Update an existing context in-place, adding the given macro map to the
-    appropriate package namespace. Adapter packages get inserted into the
-    global namespace.
+class MacroNamespace(Mapping):
+    """A read-only mapping of the macros in a package namespace. Macros are
+    bound to the context the first time they are looked up, and the bound
+    macro is cached for as long as the context lives.
     """
-    key = package_name
-    if package_name in PACKAGES:
-        key = GLOBAL_PROJECT_NAME
-    if key not in context:
-        context[key] = {}
+    def __init__(self, context, macros, unique_ids):
+        self._context = context
+        self._macros = macros
+        # macro name -> macro unique ID
+        self._unique_ids = unique_ids
+        self._bound = {}
 
-    context[key].update(macro_map)
+    def __getitem__(self, name):
+        if name not in self._bound:
+            macro = self._macros[self._unique_ids[name]]
+            self._bound[name] = macro.generator(self._context)
+        return self._bound[name]
 
+    def __contains__(self, name):
+        return name in self._unique_ids
 
-def _add_macros(context, model, manifest):
-    macros_to_add = {'global': [], 'local': []}
+    def __iter__(self):
+        return iter(self._unique_ids)
 
-    for unique_id, macro in manifest.macros.items():
-        if macro.resource_type != NodeType.Macro:
-            continue
-        package_name = macro.package_name
+    def __len__(self):
+        return len(self._unique_ids)
 
-        macro_map = {
-            macro.name: macro.generator(context)
-        }
 
-        # adapter packages are part of the global project space
-        _add_macro_map(context, package_name, macro_map)
+class MacroCallable:
+    """A macro in the top-level namespace of a context. These are shared by
+    every context built from the same manifest: the macro is bound when it is
+    called, to the context of the template that called it.
+    """
+    def __init__(self, macros, unique_id):
+        self._macros = macros
+        self.unique_id = unique_id
+
+    @jinja2.contextfunction
+    def __call__(self, jinja_context, *args, **kwargs):
+        # every context with macros refers to itself as 'context'
+        context = jinja_context.parent.get('context', jinja_context.parent)
+        macro = self._macros[self.unique_id]
+        return macro.generator(context)(*args, **kwargs)
+
+
+class MacroMaps:
+    """The macros of a manifest, grouped the way they are added to contexts.
+    Macros are stored by unique ID and looked up when they are bound, so a
+    macro that is replaced in the manifest is picked up without a rebuild.
+    """
+    def __init__(self, macros, generation):
+        self.macros = macros
+        # the manifest's macros generation these maps were built at
+        self.generation = generation
+        # namespace -> macro name -> unique ID. Adapter packages are part of
+        # the global project namespace.
+        self.namespaces: Dict[str, Dict[str, str]] = {}
+        # package name -> macro name -> unique ID
+        self._packages: Dict[str, Dict[str, str]] = {}
+        # package name -> the unprefixed macros for nodes in that package
+        self._unprefixed: Dict[str, Dict[str, MacroCallable]] = {}
+        self._callables: Dict[str, MacroCallable] = {}
+
+        for unique_id, macro in macros.items():
+            if macro.resource_type != NodeType.Macro:
+                continue
+            package_name = macro.package_name
+            key = package_name
+            if package_name in PACKAGES:
+                key = GLOBAL_PROJECT_NAME
+            self.namespaces.setdefault(key, {})[macro.name] = unique_id
+            self._packages.setdefault(package_name, {})[macro.name] = \
+                unique_id
+
+    def _callable(self, unique_id):
+        if unique_id not in self._callables:
+            self._callables[unique_id] = MacroCallable(self.macros, unique_id)
+        return self._callables[unique_id]
+
+    def unprefixed(self, package_name):
+        """Get the macros that a node in the given package can call without a
+        package prefix.
+        """
+        if package_name not in self._unprefixed:
+            # Load global macros before local macros -- local takes precedence
+            unique_ids = {}
+            for pkg, macros in self._packages.items():
+                if pkg != package_name and pkg in PACKAGES:
+                    unique_ids.update(macros)
+            unique_ids.update(self._packages.get(package_name, {}))
+            self._unprefixed[package_name] = {
+                name: self._callable(unique_id)
+                for name, unique_id in unique_ids.items()
+            }
+        return self._unprefixed[package_name]
+
+
+_MACRO_MAPS = None
+
+
+def _get_macro_maps(manifest):
+    global _MACRO_MAPS
+    maps = _MACRO_MAPS
+    generation = manifest.generation('macros')
+    if (maps is None or maps.macros is not manifest.macros or
+            maps.generation != generation):
+        maps = MacroMaps(manifest.macros, generation)
+        _MACRO_MAPS = maps
+    return maps
 
-        if package_name == model.package_name:
-            macros_to_add['local'].append(macro_map)
-        elif package_name in PACKAGES:
-            macros_to_add['global'].append(macro_map)
 
-    # Load global macros before local macros -- local takes precedence
-    unprefixed_macros = macros_to_add['global'] + macros_to_add['local']
-    for macro_map in unprefixed_macros:
-        context.update(macro_map)
+def _add_macros(context, model, manifest):
+    maps = _get_macro_maps(manifest)
+
+    for key, unique_ids in maps.namespaces.items():
+        if key in context:
+            # a package named like another context member: add its macros
+            context[key].update(MacroNamespace(context, maps.macros,
+                                               unique_ids))
+        else:
+            context[key] = MacroNamespace(context, maps.macros, unique_ids)
+
+    context.update(maps.unprefixed(model.package_name))
 
     return context
 
@@ -168,6 +257,7 @@ def _add_validation(context):
 
 
 def env_var(var, default=None):
+    record_env_var(var)
     if var in os.environ:
         return os.environ[var]
     elif default is not None:
@@ -208,11 +298,12 @@ def _debug_here():
 
 def _add_sql_handlers(context):
     sql_results = {}
-    return dbt.utils.merge(context, {
+    context.update({
         '_sql_results': sql_results,
         'store_result': _store_result(sql_results),
         'load_result': _load_result(sql_results),
     })
+    return context
 
 
 def log(msg, info=False):
@@ -269,6 +360,7 @@ class Var:
         return dbt.clients.jinja.get_rendered(raw, self.context)
 
     def __call__(self, var_name, default=_VAR_NOTSET):
+        record_var(var_name, self.overrides)
         if var_name in self.local_vars:
             return self.get_rendered_var(var_name)
         elif default is not self._VAR_NOTSET:
@@ -372,8 +464,12 @@ def _build_load_agate_table(
 ) -> Callable[[], agate.Table]:
     def load_agate_table():
         path = model.seed_file_path
+        # columns with a configured type are loaded as written
+        text_columns = list(model.config.column_types)
         try:
-            table = dbt.clients.agate_helper.from_csv(path)
+            table = dbt.clients.agate_helper.streaming_from_csv(
+                path, text_columns
+            )
         except ValueError as e:
             dbt.exceptions.raise_compiler_error(str(e))
         table.original_abspath = os.path.abspath(path)
@@ -381,77 +477,127 @@ def _build_load_agate_table(
     return load_agate_table
 
 
-def generate_base(model, model_dict, config, manifest, source_config,
-                  provider, adapter=None):
-    """Generate the common aspects of the config dict."""
-    if provider is None:
-        raise dbt.exceptions.InternalException(
-            "Invalid provider given to context: {}".format(provider))
-
-    target_name = config.target_name
+def generate_target_context(config):
+    """Generate the 'target' context member: the profile information with
+    the credentials inlined and any password removed.
+    """
     target = config.to_profile_info()
     del target['credentials']
     target.update(config.credentials.to_dict(with_aliases=True))
     target['type'] = config.credentials.type
     target.pop('pass', None)
     target.pop('password', None)
-    target['name'] = target_name
+    target['name'] = config.target_name
+    return TargetDict(target)
 
-    adapter = get_adapter(config)
 
-    context = {'env': target}
+# provider type -> (stamp, base context)
+_BASE_CONTEXTS: Dict[type, Tuple[Tuple[Any, ...], MappingProxyType]] = {}
 
-    pre_hooks = None
-    post_hooks = None
+
+def _generate_base_context(config, adapter, provider):
+    """Generate the members of the context that are the same for every node,
+    given the config, adapter and provider.
+    """
+    target = generate_target_context(config)
 
     db_wrapper = provider.DatabaseWrapper(adapter)
 
-    context = dbt.utils.merge(context, {
+    context = {
+        "env": target,
         "adapter": db_wrapper,
         "api": {
             "Relation": db_wrapper.Relation,
             "Column": adapter.Column,
         },
         "column": adapter.Column,
-        "config": provider.Config(model, source_config),
         "database": config.credentials.database,
         "env_var": env_var,
-        "exceptions": dbt.exceptions.wrapped_exports(model),
         "execute": provider.execute,
         "flags": dbt.flags,
-        "load_agate_table": _build_load_agate_table(model),
-        "graph": manifest.flat_graph,
         "log": log,
-        "model": model_dict,
         "modules": get_context_modules(),
-        "post_hooks": post_hooks,
-        "pre_hooks": pre_hooks,
-        "ref": provider.ref(db_wrapper, model, config, manifest),
+        "post_hooks": None,
+        "pre_hooks": None,
         "return": _return,
         "schema": config.credentials.schema,
         "sql": None,
         "sql_now": adapter.date_function(),
-        "source": provider.source(db_wrapper, model, config, manifest),
         "fromjson": fromjson,
         "tojson": tojson,
         "target": target,
-        "try_or_compiler_error": try_or_compiler_error(model)
-    })
+    }
     if os.environ.get('DBT_MACRO_DEBUGGING'):
         context['debug'] = _debug_here
 
+    context = _add_tracking(context)
+    context = _add_validation(context)
+    return MappingProxyType(context)
+
+
+def _get_base_context(config, adapter, provider):
+    """Get the base context for the current invocation, building it the first
+    time. It is rebuilt if the config, adapter or tracked user change.
+    """
+    # the stamp holds references to its members, so their ids stay unique
+    stamp = (config, adapter, dbt.tracking.active_user,
+             os.environ.get('DBT_MACRO_DEBUGGING'))
+    cached = _BASE_CONTEXTS.get(type(provider))
+    if cached is not None:
+        cached_stamp, base = cached
+        if all(a is b for a, b in zip(cached_stamp, stamp)):
+            return base
+
+    base = _generate_base_context(config, adapter, provider)
+    _BASE_CONTEXTS[type(provider)] = (stamp, base)
+    return base
+
+
+def generate_base(model, model_dict, config, manifest, source_config,
+                  provider, adapter=None):
+    """Generate the common aspects of the config dict."""
+    if provider is None:
+        raise dbt.exceptions.InternalException(
+            "Invalid provider given to context: {}".format(provider))
+
+    adapter = get_adapter(config)
+
+    # the node's context is a copy of the shared base with the node-specific
+    # members layered on top
+    context = dict(_get_base_context(config, adapter, provider))
+    db_wrapper = context['adapter']
+
+    # the nested members are mutable, so each node gets its own copies of
+    # them, as it did when the whole context was built per node
+    target = TargetDict(context['target'])
+    context.update({
+        "api": dict(context['api']),
+        "env": target,
+        "modules": {
+            name: dict(module) for name, module in context['modules'].items()
+        },
+        "target": target,
+    })
+
+    context.update({
+        "config": provider.Config(model, source_config),
+        "exceptions": dbt.exceptions.wrapped_exports(model),
+        "load_agate_table": _build_load_agate_table(model),
+        "graph": manifest.flat_graph,
+        "model": model_dict,
+        "ref": provider.ref(db_wrapper, model, config, manifest),
+        "source": provider.source(db_wrapper, model, config, manifest),
+        "try_or_compiler_error": try_or_compiler_error(model)
+    })
+
     return context
 
 
 def modify_generated_context(context, model, config, manifest, provider):
     cli_var_overrides = config.cli_vars
 
-    context = _add_tracking(context)
-    context = _add_validation(context)
+    # tracking and validation are part of the base context
     context = _add_sql_handlers(context)
-
-    # we make a copy of the context for each of these ^^
-
     context = _add_macros(context, model, manifest)
 
     context["write"] = write(model, config.target_path, 'run')
@@ -0,0 +1,101 @@
+"""Record the cli vars, env vars and target values that a file used while it
+was parsed, so partial parsing can re-parse only the files whose inputs
+changed.
+
+Only fingerprints of the values are stored, as env vars and target values
+may be secrets.
+"""
+import hashlib
+import json
+import os
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Mapping
+
+from hologram import JsonSchemaMixin
+
+
+def fingerprint(value: Any) -> str:
+    contents = json.dumps(value, sort_keys=True, default=str)
+    return hashlib.sha256(contents.encode('utf-8')).hexdigest()
+
+
+def _var_fingerprint(name: str, cli_vars: Mapping[str, Any]) -> str:
+    # distinguish a missing var from one that is set to None
+    return fingerprint([name in cli_vars, cli_vars.get(name)])
+
+
+@dataclass
+class ParseDependencies(JsonSchemaMixin):
+    """The fingerprints of the values a file used while it was parsed, keyed
+    by cli var name, env var name and target key.
+    """
+    vars: Dict[str, str] = field(default_factory=dict)
+    env_vars: Dict[str, str] = field(default_factory=dict)
+    target: Dict[str, str] = field(default_factory=dict)
+
+    def update(self, other: 'ParseDependencies') -> None:
+        self.vars.update(other.vars)
+        self.env_vars.update(other.env_vars)
+        self.target.update(other.target)
+
+    def changed(
+        self, cli_vars: Mapping[str, Any], target: Mapping[str, Any]
+    ) -> List[str]:
+        """Return a description of each recorded value that differs from the
+        given cli vars, target and the current environment.
+        """
+        changed = []
+        for name, value in self.vars.items():
+            if _var_fingerprint(name, cli_vars) != value:
+                changed.append('var "{}"'.format(name))
+        for name, value in self.env_vars.items():
+            if fingerprint(os.environ.get(name)) != value:
+                changed.append('env_var "{}"'.format(name))
+        for key, value in self.target.items():
+            if fingerprint(target.get(key)) != value:
+                changed.append('target "{}"'.format(key))
+        return changed
+
+
+_ACTIVE: List[ParseDependencies] = []
+
+
+@contextmanager
+def record_dependencies() -> Iterator[ParseDependencies]:
+    """Record everything used inside the block into the yielded
+    ParseDependencies.
+    """
+    dependencies = ParseDependencies()
+    _ACTIVE.append(dependencies)
+    try:
+        yield dependencies
+    finally:
+        _ACTIVE.pop()
+
+
+def record_var(name: str, cli_vars: Mapping[str, Any]) -> None:
+    if _ACTIVE:
+        _ACTIVE[-1].vars[name] = _var_fingerprint(name, cli_vars)
+
+
+def record_env_var(name: str) -> None:
+    if _ACTIVE:
+        _ACTIVE[-1].env_vars[name] = fingerprint(os.environ.get(name))
+
+
+def record_target(key: str, value: Any) -> None:
+    if _ACTIVE:
+        _ACTIVE[-1].target[key] = fingerprint(value)
+
+
+class TargetDict(dict):
+    """The 'target' context member. Reading a key records it."""
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        record_target(key, value)
+        return value
+
+    def get(self, key, default=None):
+        record_target(key, super().get(key))
+        return super().get(key, default)
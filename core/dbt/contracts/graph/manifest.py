@@ -2,7 +2,10 @@ import hashlib
 import os
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional, Union, Mapping
+from typing import (
+    Dict, List, Optional, Union, Mapping, Any, Callable, Generic, Iterable,
+    Tuple, TypeVar
+)
 from uuid import UUID
 
 from hologram import JsonSchemaMixin
@@ -91,6 +94,17 @@ class FileHash(JsonSchemaMixin):
         checksum = hashlib.new(name, data).hexdigest()
         return cls(name=name, checksum=checksum)
 
+    @classmethod
+    def from_path(cls, path: str, name='sha256', chunk_size=1024 * 1024):
+        """Create a file hash from the contents of the file at the given path,
+        reading it in chunks so large files are never held in memory.
+        """
+        hasher = hashlib.new(name)
+        with open(path, 'rb') as fp:
+            for chunk in iter(lambda: fp.read(chunk_size), b''):
+                hasher.update(chunk)
+        return cls(name=name, checksum=hasher.hexdigest())
+
 
 @dataclass
 class RemoteFile(JsonSchemaMixin):
@@ -197,6 +211,87 @@ def _deepcopy(value):
     return value.from_dict(value.to_dict())
 
 
+K = TypeVar('K')
+
+
+class NameIndex(Generic[K]):
+    """An index of a manifest subgraph by resource name, so lookups by name
+    don't have to scan every node. The candidates for each name are kept in
+    the subgraph's order, so a lookup finds the same entry a linear search
+    would.
+    """
+    def __init__(self) -> None:
+        # name -> [(resource type, package name, key)]
+        self._entries: Dict[str, List[Tuple[Optional[str], str, K]]] = {}
+        # (resource type, error function) for entries with invalid names.
+        # Looking up that resource type raises the error.
+        self._invalid: List[Tuple[Optional[str], Callable[[], Any]]] = []
+
+    def add(
+        self, name: str, package: str, resource_type: Optional[str], key: K
+    ) -> None:
+        self._entries.setdefault(name, []).append(
+            (resource_type, package, key)
+        )
+
+    def add_invalid(
+        self, resource_type: Optional[str], raise_error: Callable[[], Any]
+    ) -> None:
+        self._invalid.append((resource_type, raise_error))
+
+    def find(self, name, package, nodetypes=None) -> Optional[K]:
+        for invalid_type, raise_error in self._invalid:
+            if nodetypes is None or invalid_type in (None, *nodetypes):
+                raise_error()
+
+        for resource_type, found_package, key in self._entries.get(name, ()):
+            if nodetypes is not None and resource_type not in nodetypes:
+                continue
+            if package is None or package == found_package:
+                return key
+        return None
+
+
+def build_unique_id_index(items: Iterable[Tuple[K, str, Any]]) -> NameIndex[K]:
+    """Build a NameIndex from (key, unique ID, node) triples. Unique IDs that
+    dbt.utils.id_matches would reject raise the same error when looked up.
+    """
+    index: NameIndex[K] = NameIndex()
+    for key, unique_id, node in items:
+        parts = unique_id.split('.', 2)
+        if len(parts) != 3:
+            resource_type = None
+        else:
+            resource_type, package_name, name = parts
+            if node.resource_type == NodeType.Source:
+                valid = name.count('.') == 1
+            else:
+                valid = '.' not in name
+            if valid:
+                index.add(name, package_name, resource_type, key)
+                continue
+
+        def raise_error(unique_id=unique_id, node=node, types=[resource_type]):
+            dbt.utils.id_matches(unique_id, None, None, types, node)
+        index.add_invalid(resource_type, raise_error)
+    return index
+
+
+def build_docs_index(docs: Mapping[str, ParsedDocumentation]):
+    index: NameIndex[str] = NameIndex()
+    for unique_id, doc in docs.items():
+        parts = unique_id.split('.')
+        if len(parts) != 2:
+            def raise_error(doc=doc):
+                msg = "documentation names cannot contain '.' characters"
+                dbt.exceptions.raise_compiler_error(msg, doc)
+            index.add_invalid(None, raise_error)
+        else:
+            package_name, name = parts
+            index.add(name, package_name, None, unique_id)
+    return index
+
+
 @dataclass(init=False)
 class Manifest:
     """The manifest for the full graph, after parsing and during compilation.
@@ -227,6 +322,10 @@ class Manifest:
         self.disabled = disabled
         self.files = files
         self.flat_graph = None
+        # subgraph name -> number of changes made through the manifest
+        self._generations: Dict[str, int] = {}
+        # subgraph name -> (subgraph, generation, index)
+        self._indexes: Dict[str, Tuple[Any, int, NameIndex]] = {}
         super(Manifest, self).__init__()
 
     @classmethod
@@ -257,6 +356,7 @@ class Manifest:
             raise dbt.exceptions.RuntimeException(
                 'cannot update a node to have a new file path!'
             )
+        # the name index only holds unique IDs, so it is still valid
         self.nodes[unique_id] = new_node
 
     @staticmethod
@@ -290,9 +390,46 @@ class Manifest:
             },
         }
 
+    def generation(self, subgraph: str) -> int:
+        """Get the number of times the given subgraph was changed through
+        the manifest's methods. Anything derived from a subgraph should be
+        rebuilt when this changes.
+        """
+        return self._generations.get(subgraph, 0)
+
+    def _changed(self, subgraph: str) -> None:
+        self._generations[subgraph] = self.generation(subgraph) + 1
+
+    def _get_index(self, subgraph: str) -> NameIndex:
+        """Get the name index for the given subgraph, (re)building it if the
+        subgraph was replaced or changed since it was built.
+        """
+        search = getattr(self, subgraph)
+        generation = self.generation(subgraph)
+        if subgraph in self._indexes:
+            built_search, built_generation, index = self._indexes[subgraph]
+            if built_search is search and built_generation == generation:
+                return index
+
+        if subgraph == 'docs':
+            index = build_docs_index(search)
+        elif subgraph == 'disabled':
+            index = build_unique_id_index(
+                (idx, n.unique_id, n) for idx, n in enumerate(search)
+            )
+        else:
+            index = build_unique_id_index(
+                (k, k, v) for k, v in search.items()
+            )
+        self._indexes[subgraph] = (search, generation, index)
+        return index
+
     def find_disabled_by_name(self, name, package=None):
-        return dbt.utils.find_in_list_by_name(self.disabled, name, package,
-                                              NodeType.refable())
+        idx = self._get_index('disabled').find(name, package,
+                                               NodeType.refable())
+        if idx is None:
+            return None
+        return self.disabled[idx]
 
     def _find_by_name(self, name, package, subgraph, nodetype):
         """
@@ -308,24 +445,16 @@ class Manifest:
             raise NotImplementedError(
                 'subgraph search for {} not implemented'.format(subgraph)
             )
-        return dbt.utils.find_in_subgraph_by_name(
-            search,
-            name,
-            package,
-            nodetype)
+        unique_id = self._get_index(subgraph).find(name, package, nodetype)
+        if unique_id is None:
+            return None
+        return search[unique_id]
 
     def find_docs_by_name(self, name, package=None):
-        for unique_id, doc in self.docs.items():
-            parts = unique_id.split('.')
-            if len(parts) != 2:
-                msg = "documentation names cannot contain '.' characters"
-                dbt.exceptions.raise_compiler_error(msg, doc)
-
-            found_package, found_node = parts
-
-            if (name == found_node and package in {None, found_package}):
-                return doc
-        return None
+        unique_id = self._get_index('docs').find(name, package)
+        if unique_id is None:
+            return None
+        return self.docs[unique_id]
 
     def find_macro_by_name(self, name, package):
         """Find a macro in the graph by its name and package name, or None for
@@ -386,6 +515,14 @@ class Manifest:
             if unique_id in self.nodes:
                 raise_duplicate_resource_name(node, self.nodes[unique_id])
             self.nodes[unique_id] = node
+        self._changed('nodes')
+
+    def add_macros(self, new_macros):
+        """Add the given dict of macros to the manifest, replacing any
+        macros with the same unique IDs.
+        """
+        self.macros.update(new_macros)
+        self._changed('macros')
 
     def patch_nodes(self, patches):
         """Patch nodes with the given dict of patches. Note that this consumes
@@ -7,11 +7,15 @@ WARN_ERROR = None
 TEST_NEW_PARSER = None
 WRITE_JSON = None
 PARTIAL_PARSE = None
+PARALLEL_PARSE = None
+TEST_STATIC_PARSER = None
+RELATIONS_CACHE_TTL = None
 
 
 def reset():
     global STRICT_MODE, FULL_REFRESH, USE_CACHE, WARN_ERROR, TEST_NEW_PARSER, \
-        WRITE_JSON, PARTIAL_PARSE
+        WRITE_JSON, PARTIAL_PARSE, PARALLEL_PARSE, TEST_STATIC_PARSER, \
+        RELATIONS_CACHE_TTL
 
     STRICT_MODE = False
     FULL_REFRESH = False
@@ -20,11 +24,15 @@ def reset():
     TEST_NEW_PARSER = False
     WRITE_JSON = True
     PARTIAL_PARSE = False
+    PARALLEL_PARSE = False
+    TEST_STATIC_PARSER = False
+    RELATIONS_CACHE_TTL = None
 
 
 def set_from_args(args):
     global STRICT_MODE, FULL_REFRESH, USE_CACHE, WARN_ERROR, TEST_NEW_PARSER, \
-        WRITE_JSON, PARTIAL_PARSE
+        WRITE_JSON, PARTIAL_PARSE, PARALLEL_PARSE, TEST_STATIC_PARSER, \
+        RELATIONS_CACHE_TTL
     USE_CACHE = getattr(args, 'use_cache', USE_CACHE)
 
     FULL_REFRESH = getattr(args, 'full_refresh', FULL_REFRESH)
@@ -37,6 +45,11 @@ def set_from_args(args):
     TEST_NEW_PARSER = getattr(args, 'test_new_parser', TEST_NEW_PARSER)
     WRITE_JSON = getattr(args, 'write_json', WRITE_JSON)
     PARTIAL_PARSE = getattr(args, 'partial_parse', PARTIAL_PARSE)
+    PARALLEL_PARSE = getattr(args, 'parallel_parse', PARALLEL_PARSE)
+    TEST_STATIC_PARSER = getattr(args, 'test_static_parser',
+                                 TEST_STATIC_PARSER)
+    RELATIONS_CACHE_TTL = getattr(args, 'relations_cache_ttl',
+                                  RELATIONS_CACHE_TTL)
 
 
 # initialize everything to the defaults on module load
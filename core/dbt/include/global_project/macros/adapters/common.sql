@@ -87,11 +87,26 @@
 {% endmacro %}
 
 
-{% macro get_catalog(information_schemas) -%}
-  {{ return(adapter_macro('get_catalog', information_schemas)) }}
+{#- a comma-separated list of string literals, for use in an `in (...)`
+    filter. An empty list is rendered as null, which matches nothing -#}
+{% macro string_literal_list(values) -%}
+  {{ return(adapter_macro('string_literal_list', values)) }}
 {%- endmacro %}
 
-{% macro default__get_catalog(information_schemas) -%}
+{% macro default__string_literal_list(values) -%}
+  {%- for value in values -%}
+    '{{ value | replace("'", "''") }}'{% if not loop.last %}, {% endif %}
+  {%- else -%}
+    null
+  {%- endfor -%}
+{%- endmacro %}
+
+
+{% macro get_catalog(information_schemas, schemas) -%}
+  {{ return(adapter_macro('get_catalog', information_schemas, schemas)) }}
+{%- endmacro %}
+
+{% macro default__get_catalog(information_schemas, schemas) -%}
 
   {% set typename = adapter.type() %}
   {% set msg -%}
@@ -229,6 +244,17 @@
 {% endmacro %}
 
 
+{% macro get_relations_fingerprint(schemas) %}
+  {{ return(adapter_macro('get_relations_fingerprint', schemas)) }}
+{% endmacro %}
+
+
+{% macro default__get_relations_fingerprint(schemas) %}
+  {#-- adapters that can't fingerprint their schemas only use the TTL --#}
+  {{ return(none) }}
+{% endmacro %}
+
+
 {% macro current_timestamp() -%}
   {{ adapter_macro('current_timestamp') }}
 {%- endmacro %}
@@ -258,6 +284,31 @@
   {{ return(load_result('collect_freshness').table) }}
 {% endmacro %}
 
+
+{% macro collect_freshness_batch(sources) %}
+  {{ return(adapter_macro('collect_freshness_batch', sources))}}
+{% endmacro %}
+
+
+{% macro default__collect_freshness_batch(sources) %}
+  {#- each source gets its own column rather than a row of a union, so the
+      column has the same type that collect_freshness would return -#}
+  {% call statement('collect_freshness_batch', fetch_result=True, auto_begin=False) -%}
+    select
+    {% for item in sources %}
+      (
+        select max({{ item.loaded_at_field }})
+        from {{ item.source }}
+        {% if item.filter %}
+        where {{ item.filter }}
+        {% endif %}
+      ) as max_loaded_at_{{ loop.index0 }},
+    {% endfor %}
+      {{ current_timestamp() }} as snapshotted_at
+  {% endcall %}
+  {{ return(load_result('collect_freshness_batch').table) }}
+{% endmacro %}
+
 {% macro make_temp_relation(base_relation, suffix='__dbt_tmp') %}
   {{ return(adapter_macro('make_temp_relation', base_relation, suffix))}}
 {% endmacro %}
@@ -25,9 +25,12 @@ class GraphQueue:
     that separate threads do not call `.empty()` or `__len__()` and `.get()` at
     the same time, as there is an unlocked race!
     """
-    def __init__(self, graph, manifest):
+    def __init__(self, graph, manifest, execution_times=None):
         self.graph = graph
         self.manifest = manifest
+        # if set, the execution times of nodes in a previous run, used to
+        # prioritize nodes on the critical path
+        self.execution_times = execution_times
         # store the queue as a priority queue.
         self.inner = PriorityQueue()
         # things that have been popped off the queue but not finished
@@ -37,8 +40,11 @@ class GraphQueue:
         self.queued = set()
         # this lock controls most things
         self.lock = threading.Lock()
-        # store the 'score' of each node as a number. Lower is higher priority.
+        # store the 'score' of each node. Lower is higher priority.
         self._scores = self._calculate_scores()
+        # the number of unfinished dependencies of each node. Nodes are queued
+        # when this reaches 0.
+        self._remaining_deps = dict(self.graph.in_degree())
         # populate the initial queue
         self._find_new_additions()
 
@@ -53,6 +59,18 @@ class GraphQueue:
             return False
         return True
 
+    def _default_execution_time(self):
+        """The time to assume for nodes without a previous execution time: the
+        mean of the known times.
+        """
+        known = [
+            self.execution_times[node] for node in self.graph.nodes()
+            if node in self.execution_times
+        ]
+        if not known:
+            return 0.0
+        return sum(known) / len(known)
+
     def _calculate_scores(self):
         """Calculate the 'value' of each node in the graph based on how many
         blocking descendants it has. We use this score for the internal
@@ -61,22 +79,52 @@ class GraphQueue:
         The score is stored as a negative number because the internal
         PriorityQueue picks lowest values first.
 
-        We could do this in one pass over the graph instead of len(self.graph)
-        passes but this is easy. For large graphs this may hurt performance.
+        The descendants of each node are calculated in one pass over the graph
+        in reverse topological order, as the union of the descendants of its
+        successors. Each set of blocking descendants is stored as a bitset in
+        an int, with a bit for each blocking node.
+
+        If execution times are set, the score is instead a tuple of the
+        negated length of the longest path from the node to the end of the
+        graph, weighted by execution time, and the negated number of blocking
+        descendants. Those are calculated in the same pass.
 
         This operates on the graph, so it would require a lock if called from
         outside __init__.
 
-        :return Dict[str, int]: The score dict, mapping unique IDs to integer
-            scores. Lower scores are higher priority.
+        :return Dict[str, Union[int, Tuple[float, int]]]: The score dict,
+            mapping unique IDs to scores. Lower scores are higher priority.
         """
-        scores = {}
+        bits = {}
         for node in self.graph.nodes():
-            score = -1 * len([
-                d for d in nx.descendants(self.graph, node)
-                if self._include_in_cost(d)
-            ])
-            scores[node] = score
+            if self._include_in_cost(node):
+                bits[node] = 1 << len(bits)
+
+        if self.execution_times is not None:
+            default_time = self._default_execution_time()
+
+        # include each node's own bit in its bitset, so a node's bitset is the
+        # union of its successors' bitsets
+        descendants = {}
+        path_lengths = {}
+        scores = {}
+        successors = self.graph.succ
+        for node in reversed(list(nx.topological_sort(self.graph))):
+            node_descendants = 0
+            for successor in successors[node]:
+                node_descendants |= descendants[successor]
+            descendants[node] = node_descendants | bits.get(node, 0)
+            score = -1 * bin(node_descendants).count('1')
+
+            if self.execution_times is not None:
+                path_length = self.execution_times.get(node, default_time)
+                path_length += max(
+                    (path_lengths[s] for s in successors[node]), default=0.0
+                )
+                path_lengths[node] = path_length
+                scores[node] = (-1 * path_length, score)
+            else:
+                scores[node] = score
         return scores
 
     def get(self, block=True, timeout=None):
@@ -126,19 +174,28 @@ class GraphQueue:
         """
         return node in self.in_progress or node in self.queued
 
+    def _add_to_queue(self, node):
+        """Add a node to the internal queue.
+
+        Callers must hold the lock.
+        """
+        self.inner.put((self._scores[node], node))
+        self.queued.add(node)
+
     def _find_new_additions(self):
         """Find any nodes in the graph that need to be added to the internal
-        queue and add them.
+        queue and add them. This scans the whole graph, so it is only used to
+        populate the initial queue.
 
         Callers must hold the lock.
         """
-        for node, in_degree in dict(self.graph.in_degree()).items():
-            if not self._already_known(node) and in_degree == 0:
-                self.inner.put((self._scores[node], node))
-                self.queued.add(node)
+        for node, remaining in self._remaining_deps.items():
+            if not self._already_known(node) and remaining == 0:
+                self._add_to_queue(node)
 
     def mark_done(self, node_id):
-        """Given a node's unique ID, mark it as done.
+        """Given a node's unique ID, mark it as done. Any of its successors
+        that have no remaining dependencies are added to the queue.
 
         This method takes the lock.
 
@@ -146,8 +203,12 @@ class GraphQueue:
         """
         with self.lock:
             self.in_progress.remove(node_id)
+            for successor in self.graph.successors(node_id):
+                self._remaining_deps[successor] -= 1
+                if self._remaining_deps[successor] == 0:
+                    self._add_to_queue(successor)
             self.graph.remove_node(node_id)
-            self._find_new_additions()
+            del self._remaining_deps[node_id]
             self.inner.task_done()
 
     def _mark_in_progress(self, node_id):
@@ -170,23 +231,63 @@ class GraphQueue:
 
 def _subset_graph(graph, include_nodes):
     """Create and return a new graph that is a shallow copy of graph but with
-    only the nodes in include_nodes. Transitive edges across removed nodes are
-    preserved as explicit new edges.
-    """
-    new_graph = nx.algorithms.transitive_closure(graph)
+    only the nodes in include_nodes. Paths between included nodes through
+    removed nodes are preserved as explicit new edges.
 
+    Rather than building the transitive closure of the whole graph, this only
+    visits the removed nodes that are reachable from included nodes, once
+    each.
+    """
     include_nodes = set(include_nodes)
 
-    for node in graph.nodes():
-        if node not in include_nodes:
-            new_graph.remove_node(node)
-
     for node in include_nodes:
-        if node not in new_graph:
+        if node not in graph:
             raise RuntimeError(
                 "Couldn't find model '{}' -- does it exist or is "
                 "it disabled?".format(node)
             )
+
+    successors = graph.succ
+    ordered = list(include_nodes)
+    bits = {node: 1 << idx for idx, node in enumerate(ordered)}
+
+    # for each removed node reachable from an included node without passing
+    # through another included node, find the nearest included nodes
+    # downstream of it, as a bitset with a bit for each included node. The
+    # search is depth-first, so a node's successors are finished before it.
+    downstream = {}
+    seen = set()
+    for start in ordered:
+        stack = [(start, iter(successors[start]))]
+        while stack:
+            node, children = stack[-1]
+            for child in children:
+                if child not in bits and child not in seen:
+                    seen.add(child)
+                    stack.append((child, iter(successors[child])))
+                    break
+            else:
+                stack.pop()
+                if node in bits:
+                    continue
+                nearest = 0
+                for successor in successors[node]:
+                    nearest |= bits.get(successor) or downstream[successor]
+                downstream[node] = nearest
+
+    new_graph = graph.__class__()
+    new_graph.add_nodes_from((n, graph.nodes[n]) for n in ordered)
+    for node in ordered:
+        nearest = 0
+        for successor, data in successors[node].items():
+            if successor in bits:
+                new_graph.add_edge(node, successor, **data)
+            else:
+                nearest |= downstream[successor]
+        while nearest:
+            lowest = nearest & -nearest
+            new_graph.add_edge(node, ordered[lowest.bit_length() - 1])
+            nearest ^= lowest
     return new_graph
 
 
@@ -216,9 +317,10 @@ class Linker:
 
         return None
 
-    def as_graph_queue(self, manifest, limit_to=None):
+    def as_graph_queue(self, manifest, limit_to=None, execution_times=None):
         """Returns a queue over nodes in the graph that tracks progress of
-        dependecies.
+        dependecies. If execution_times is given, nodes on the longest path
+        through the graph are prioritized.
         """
         if limit_to is None:
             graph_nodes = self.graph.nodes()
@@ -226,7 +328,7 @@ class Linker:
             graph_nodes = limit_to
 
         new_graph = _subset_graph(self.graph, graph_nodes)
-        return GraphQueue(new_graph, manifest)
+        return GraphQueue(new_graph, manifest, execution_times)
 
     def get_dependent_nodes(self, node):
         return nx.descendants(self.graph, node)
@@ -1,8 +1,10 @@
 import itertools
+import multiprocessing
 import os
 import pickle
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, Optional, Mapping
+from typing import Any, Dict, Optional, Mapping, List, Set, Tuple, Type
 
 from dbt.include.global_project import PACKAGES
 import dbt.exceptions
@@ -12,6 +14,8 @@ from dbt.logger import GLOBAL_LOGGER as logger
 from dbt.node_types import NodeType
 from dbt.clients.system import make_directory
 from dbt.config import Project, RuntimeConfig
+from dbt.context.common import generate_target_context
+from dbt.context.dependencies import record_dependencies
 from dbt.contracts.graph.compiled import CompileResultNode
 from dbt.contracts.graph.manifest import Manifest, FilePath, FileHash
 from dbt.parser.base import BaseParser
@@ -31,6 +35,12 @@ from dbt.version import __version__
 
 
 PARTIAL_PARSE_FILE_NAME = 'partial_parse.pickle'
+# below this many files to parse, starting up worker processes costs more than
+# it saves.
+PARALLEL_PARSE_MIN_FILES = 64
+# split the files to parse into about this many chunks per worker, so one
+# slow chunk doesn't leave the other workers idle.
+PARALLEL_PARSE_CHUNKS_PER_WORKER = 4
 
 
 _parser_types = [
@@ -45,28 +55,14 @@ _parser_types = [
 ]
 
 
-# TODO: this should be calculated per-file based on the vars() calls made in
-# parsing, so changing one var doesn't invalidate everything. also there should
-# be something like that for env_var - currently changing env_vars in way that
-# impact graph selection or configs will result in weird test failures.
-# finally, we should hash the actual profile used, not just root project +
-# profiles.yml + relevant args. While sufficient, it is definitely overkill.
 def make_parse_result(
     config: RuntimeConfig, all_projects: Mapping[str, Project]
 ) -> ParseResult:
-    """Make a ParseResult from the project configuration and the profile."""
+    """Make a ParseResult from the project configuration. The vars, env vars
+    and target values used by each file are tracked per-file while parsing.
+    """
     # if any of these change, we need to reject the parser
-    vars_hash = FileHash.from_contents(
-        '\0'.join([
-            getattr(config.args, 'vars', '{}') or '{}',
-            getattr(config.args, 'profile', '') or '',
-            getattr(config.args, 'target', '') or '',
-            __version__
-        ])
-    )
-    profile_path = os.path.join(config.args.profiles_dir, 'profiles.yml')
-    with open(profile_path) as fp:
-        profile_hash = FileHash.from_contents(fp.read())
+    version_hash = FileHash.from_contents(__version__)
 
     project_hashes = {}
     for name, project in all_projects.items():
@@ -75,12 +71,71 @@ def make_parse_result(
             project_hashes[name] = FileHash.from_contents(fp.read())
 
     return ParseResult(
-        vars_hash=vars_hash,
-        profile_hash=profile_hash,
+        version_hash=version_hash,
         project_hashes=project_hashes,
     )
 
 
+def parse_file(parser: BaseParser, block: FileBlock) -> None:
+    """Parse the file, recording the vars, env vars and target values it
+    uses into the parser's results.
+    """
+    with record_dependencies() as dependencies:
+        parser.parse_file(block)
+    parser.results.add_dependencies(block.file, dependencies)
+
+
+@dataclass
+class ParallelParseState:
+    """Everything a parse worker needs. This is stored in a global before
+    the worker pool is created so that forked workers inherit it instead of
+    having it pickled to them.
+    """
+    results: ParseResult
+    project: Project
+    root_project: RuntimeConfig
+    macro_manifest: Manifest
+    items: List[Tuple[Type[BaseParser], FileBlock]]
+
+
+_PARALLEL_PARSE_STATE: Optional[ParallelParseState] = None
+
+
+def _parse_chunk(indices: List[int]) -> Optional[ParseResult]:
+    """Parse the items at the given indices into a fresh ParseResult. On
+    failure, return None: the caller re-parses the chunk itself so that the
+    error is raised in the main process with all its original information.
+    """
+    state = _PARALLEL_PARSE_STATE
+    if state is None:
+        return None
+    results = ParseResult(
+        version_hash=state.results.version_hash,
+        project_hashes=state.results.project_hashes,
+    )
+    parsers: Dict[Type[BaseParser], BaseParser] = {}
+    try:
+        for idx in indices:
+            cls, block = state.items[idx]
+            if cls not in parsers:
+                parsers[cls] = cls(  # type: ignore
+                    results, state.project, state.root_project,
+                    state.macro_manifest
+                )
+            parse_file(parsers[cls], block)
+    except Exception as exc:
+        logger.debug(
+            'Failed to parse files in a worker process: {}'.format(exc),
+            exc_info=True
+        )
+        return None
+    return results
+
+
+def _parallel_parse_supported() -> bool:
+    return 'fork' in multiprocessing.get_all_start_methods()
+
+
 class GraphLoader:
     def __init__(
         self, root_project: RuntimeConfig, all_projects: Mapping[str, Project]
@@ -90,6 +145,7 @@ class GraphLoader:
 
         self.results = make_parse_result(root_project, all_projects)
         self._loaded_file_cache: Dict[str, FileBlock] = {}
+        self._target: Optional[Dict[str, Any]] = None
 
     def _load_macros(
         self,
@@ -118,7 +174,35 @@ class GraphLoader:
     ) -> None:
         block = self._get_file(path, parser)
         if not self._get_cached(block, old_results):
-            parser.parse_file(block)
+            parse_file(parser, block)
+
+    def _dependencies_changed(
+        self, block: FileBlock, old_results: ParseResult
+    ) -> bool:
+        key = block.file.search_key
+        if key is None or key not in old_results.dependencies:
+            return False
+        dependencies = old_results.dependencies[key]
+        if self._target is None:
+            self._target = generate_target_context(self.root_project)
+        changed = dependencies.changed(self.root_project.cli_vars,
+                                       self._target)
+        if changed:
+            logger.debug(
+                'Parse dependencies changed for {}, re-parsing: {}'
+                .format(block.path.original_file_path, ', '.join(changed))
+            )
+        return bool(changed)
+
+    def _is_cached(
+        self, block: FileBlock, old_results: Optional[ParseResult]
+    ) -> bool:
+        if old_results is None:
+            return False
+        return (
+            old_results.has_file(block.file) and
+            not self._dependencies_changed(block, old_results)
+        )
 
     def _get_cached(
         self,
@@ -128,11 +212,9 @@ class GraphLoader:
         # TODO: handle multiple parsers w/ same files, by
         # tracking parser type vs node type? Or tracking actual
         # parser type during parsing?
-        if old_results is None:
+        if old_results is None or not self._is_cached(block, old_results):
             return False
-        if old_results.has_file(block.file):
-            return self.results.sanitized_update(block.file, old_results)
-        return False
+        return self.results.sanitized_update(block.file, old_results)
 
     def _get_file(self, path: FilePath, parser: BaseParser) -> FileBlock:
         if path.search_key in self._loaded_file_cache:
@@ -157,10 +239,117 @@ class GraphLoader:
         # per-project cache.
         self._loaded_file_cache.clear()
 
+        if dbt.flags.PARALLEL_PARSE and _parallel_parse_supported():
+            self.parse_project_parallel(
+                project, parsers, macro_manifest, old_results
+            )
+            return
+
         for parser in parsers:
             for path in parser.search():
                 self.parse_with_cache(path, parser, old_results)
 
+    def _chunk_parse_items(
+        self, items: List[Tuple[BaseParser, FileBlock]], indices: List[int],
+    ) -> List[List[int]]:
+        """Split the given item indices into chunks for the workers. All the
+        items for a given file go into the same chunk, as the results for a
+        file are merged all at once.
+        """
+        by_key: Dict[Optional[str], List[int]] = {}
+        for idx in indices:
+            by_key.setdefault(items[idx][1].file.search_key, []).append(idx)
+
+        num_chunks = (os.cpu_count() or 1) * PARALLEL_PARSE_CHUNKS_PER_WORKER
+        keys = list(by_key)
+        chunk_size = max(1, -(-len(keys) // num_chunks))
+        return [
+            [idx for key in keys[i:i + chunk_size] for idx in by_key[key]]
+            for i in range(0, len(keys), chunk_size)
+        ]
+
+    def _run_parse_chunks(
+        self, state: ParallelParseState, chunks: List[List[int]]
+    ) -> List[Optional[ParseResult]]:
+        global _PARALLEL_PARSE_STATE
+        _PARALLEL_PARSE_STATE = state
+        try:
+            context = multiprocessing.get_context('fork')
+            with context.Pool(min(len(chunks), os.cpu_count() or 1)) as pool:
+                return pool.map(_parse_chunk, chunks)
+        finally:
+            _PARALLEL_PARSE_STATE = None
+
+    def parse_project_parallel(
+        self,
+        project: Project,
+        parsers: List[BaseParser],
+        macro_manifest: Manifest,
+        old_results: Optional[ParseResult],
+    ) -> None:
+        """Parse the project's files in worker processes, then merge the
+        per-worker results in the order the files would have been parsed
+        serially. Merging goes through the regular ParseResult methods, so
+        the uniqueness checks still apply across workers.
+        """
+        items: List[Tuple[BaseParser, FileBlock]] = []
+        for parser in parsers:
+            for path in parser.search():
+                items.append((parser, self._get_file(path, parser)))
+
+        # files without a search key (hooks) can't be merged by key, so
+        # they are always parsed here.
+        to_parse = [
+            idx for idx, (_, block) in enumerate(items)
+            if block.file.search_key is not None and
+            not self._is_cached(block, old_results)
+        ]
+
+        # map search keys to their worker's results and item indices
+        worker_results: Dict[Optional[str], Optional[ParseResult]] = {}
+        worker_items: Dict[Optional[str], List[int]] = {}
+        if len(to_parse) >= PARALLEL_PARSE_MIN_FILES:
+            chunks = self._chunk_parse_items(items, to_parse)
+            state = ParallelParseState(
+                results=self.results,
+                project=project,
+                root_project=self.root_project,
+                macro_manifest=macro_manifest,
+                items=[(type(p), b) for p, b in items],
+            )
+            logger.debug(
+                'Parsing {} files for project {} in {} chunks'
+                .format(len(to_parse), project.project_name, len(chunks))
+            )
+            chunk_results = self._run_parse_chunks(state, chunks)
+            for chunk, result in zip(chunks, chunk_results):
+                for idx in chunk:
+                    key = items[idx][1].file.search_key
+                    worker_results[key] = result
+                    worker_items.setdefault(key, []).append(idx)
+
+        merged: Set[Optional[str]] = set()
+        for parser, block in items:
+            key = block.file.search_key
+            if key not in worker_results:
+                if not self._get_cached(block, old_results):
+                    parse_file(parser, block)
+            elif key in merged:
+                continue
+            else:
+                merged.add(key)
+                result = worker_results[key]
+                if result is None:
+                    # the worker failed. Parse the file here instead, so any
+                    # error is raised as usual.
+                    for idx in worker_items[key]:
+                        item_parser, item_block = items[idx]
+                        parse_file(item_parser, item_block)
+                else:
+                    if key in result.files:
+                        self.results.get_file(block.file)
+                    self.results.sanitized_update(block.file, result)
+
     def load_only_macros(self) -> Manifest:
         old_results = self.read_parse_results()
         self._load_macros(old_results, internal_manifest=None)
@@ -196,11 +385,8 @@ class GraphLoader:
         the known ones, and return if it is ok to re-use the results.
         """
         valid = True
-        if self.results.vars_hash != result.vars_hash:
-            logger.debug('vars hash mismatch, cache invalidated')
-            valid = False
-        if self.results.profile_hash != result.profile_hash:
-            logger.debug('profile hash mismatch, cache invalidated')
+        if self.results.version_hash != result.version_hash:
+            logger.debug('dbt version mismatch, cache invalidated')
             valid = False
 
         missing_keys = {
@@ -480,6 +480,48 @@ def _add_common_arguments(*subparsers):
         )
 
 
+def _add_scheduling_arguments(*subparsers):
+    for sub in subparsers:
+        sub.add_argument(
+            '--critical-path',
+            action='store_true',
+            help='''
+            If set, use the execution times in the previous run_results.json
+            to start nodes on the longest path through the graph first.
+            '''
+        )
+
+
+def _add_relations_cache_arguments(*subparsers):
+    for sub in subparsers:
+        sub.add_argument(
+            '--relations-cache-ttl',
+            type=int,
+            metavar='SECONDS',
+            help='''
+            If set, save the adapter-level cache of database state in the
+            target directory at the end of the command. Later commands reuse
+            the saved cache if it is younger than SECONDS, or if the adapter
+            can tell that the cached schemas have not changed since it was
+            saved.
+            ''',
+        )
+
+
+def _add_processes_arguments(*subparsers):
+    for sub in subparsers:
+        sub.add_argument(
+            '--processes',
+            type=int,
+            required=False,
+            help='''
+            Render nodes in this many worker processes, so compilation can use
+            more than one core. Each thread hands its nodes to a worker, so set
+            --threads to at least this many. Not available on Windows.
+            '''
+        )
+
+
 def _build_seed_subparser(subparsers, base_subparser):
     seed_sub = subparsers.add_parser(
         'seed',
@@ -542,6 +584,15 @@ def _build_test_subparser(subparsers, base_subparser):
         Run constraint validations from schema.yml files
         '''
     )
+    sub.add_argument(
+        '--batch-size',
+        type=int,
+        default=None,
+        help='''
+        Combine up to this many schema tests on the same model into a single
+        query. Tests in a batch that fails are rerun one at a time.
+        '''
+    )
 
     sub.set_defaults(cls=test_task.TestTask, which='test')
     return sub
@@ -582,6 +633,16 @@ def _build_source_snapshot_freshness_subparser(subparsers, base_subparser):
         Specify number of threads to use. Overrides settings in profiles.yml
         '''
     )
+    sub.add_argument(
+        '--batch-size',
+        type=int,
+        default=None,
+        help='''
+        Check the freshness of up to this many sources in the same schema with
+        a single query. By default, each source is checked with its own query.
+        Ignored if the collect_freshness macro is overridden.
+        '''
+    )
     sub.set_defaults(cls=freshness_task.FreshnessTask,
                      which='snapshot-freshness')
     return sub
@@ -775,9 +836,17 @@ def parse_args(args):
         action='store_true',
         help='''
         Allow for partial parsing by looking for and writing to a pickle file
-        in the target directory.
+        in the target directory. Files are re-parsed when their contents or
+        the vars, env vars or target values they used change.
+        '''
+    )
 
-        WARNING: This can result in unexpected behavior if you use env_var()!
+    p.add_argument(
+        '--parallel-parse',
+        action='store_true',
+        help='''
+        Parse project files in a pool of worker processes, one per CPU. This
+        is only supported on platforms where processes can be forked.
         '''
     )
 
@@ -801,6 +870,15 @@ def parse_args(args):
         help=argparse.SUPPRESS
     )
 
+    # if set, render every model that the static parser can handle as well,
+    # and raise an error if the two disagree on the model's refs, sources or
+    # config.
+    p.add_argument(
+        '--test-static-parser',
+        action='store_true',
+        help=argparse.SUPPRESS
+    )
+
     subs = p.add_subparsers(title="Available sub-commands")
 
     base_subparser = _build_base_subparser()
@@ -832,6 +910,13 @@ def parse_args(args):
     _add_selection_arguments(snapshot_sub, models_name='select')
     # --full-refresh
     _add_table_mutability_arguments(run_sub, compile_sub)
+    # --critical-path
+    _add_scheduling_arguments(run_sub, compile_sub, test_sub, seed_sub,
+                              snapshot_sub)
+    # --processes
+    _add_processes_arguments(compile_sub, generate_sub)
+    # --relations-cache-ttl
+    _add_relations_cache_arguments(run_sub, test_sub, seed_sub, snapshot_sub)
 
     _build_docs_serve_subparser(docs_subs, base_subparser)
     _build_source_snapshot_freshness_subparser(source_subs, base_subparser)
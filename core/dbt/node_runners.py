@@ -1,3 +1,4 @@
+import json
 import threading
 import time
 import traceback
@@ -13,8 +14,10 @@ from dbt.exceptions import (
 from dbt.node_types import NodeType
 from dbt.contracts.results import (
     RunModelResult, collect_timing_info, SourceFreshnessResult, PartialResult,
+    TimingInfo,
 )
 from dbt.compilation import compile_node
+from dbt.contracts.graph.manifest import FileHash
 
 import dbt.context.runtime
 import dbt.exceptions
@@ -297,6 +300,13 @@ class BaseRunner:
 
 
 class CompileRunner(BaseRunner):
+    def __init__(self, config, adapter, node, node_index, num_nodes):
+        super().__init__(config, adapter, node, node_index, num_nodes)
+        # set by the CompileTask when nodes are rendered in worker processes
+        self.compile_pool = None
+        # set by the CompileTask to reuse SQL rendered by earlier invocations
+        self.compile_cache = None
+
     def before_execute(self):
         pass
 
@@ -307,7 +317,13 @@ class CompileRunner(BaseRunner):
         return RunModelResult(compiled_node)
 
     def compile(self, manifest):
-        return compile_node(self.adapter, self.config, self.node, manifest, {})
+        if self.compile_pool is not None:
+            return self.compile_pool.compile_node(
+                self.adapter, self.config, self.node, manifest,
+                self.compile_cache
+            )
+        return compile_node(self.adapter, self.config, self.node, manifest, {},
+                            cache=self.compile_cache)
 
 
 # make sure that we got an ok result back from a materialization
@@ -430,7 +446,54 @@ class ModelRunner(CompileRunner):
         return self._build_run_model_result(model, context)
 
 
+class FreshnessBatch:
+    """A group of sources whose freshness is calculated with a single query.
+    The first runner that needs the batch runs the query, and the other
+    runners reuse its results. Sources missing from the results, including
+    every source if the query fails, are checked one at a time instead.
+    """
+    def __init__(self, sources):
+        self.sources = sources
+        self.lock = threading.Lock()
+        self.freshness = None
+
+    def get_freshness(self, adapter, source, manifest):
+        with self.lock:
+            if self.freshness is None:
+                self.freshness = self._execute(adapter, manifest)
+        return self.freshness.get(source.unique_id)
+
+    def _execute(self, adapter, manifest):
+        sources = [
+            (adapter.Relation.create_from_source(node),
+             node.loaded_at_field,
+             node.freshness.filter)
+            for node in self.sources
+        ]
+        try:
+            results = adapter.calculate_freshness_batch(
+                sources, manifest=manifest
+            )
+        except RuntimeException as exc:
+            logger.debug(
+                'Batched freshness query failed, checking its {} sources one '
+                'at a time: {}'.format(len(sources), exc)
+            )
+            return {}
+
+        return {
+            node.unique_id: freshness
+            for node, freshness in zip(self.sources, results)
+            if freshness is not None
+        }
+
+
 class FreshnessRunner(BaseRunner):
+    def __init__(self, config, adapter, node, node_index, num_nodes):
+        super().__init__(config, adapter, node, node_index, num_nodes)
+        # set by the FreshnessTask when the source is checked in a batch
+        self.batch = None
+
     def on_skip(self):
         raise RuntimeException(
             'Freshness: nodes cannot be skipped!'
@@ -480,12 +543,18 @@ class FreshnessRunner(BaseRunner):
         # given a Source, calculate its fresnhess.
         with self.adapter.connection_named(compiled_node.unique_id):
             self.adapter.clear_transaction()
-            freshness = self.adapter.calculate_freshness(
-                relation,
-                compiled_node.loaded_at_field,
-                compiled_node.freshness.filter,
-                manifest=manifest
-            )
+            freshness = None
+            if self.batch is not None:
+                freshness = self.batch.get_freshness(
+                    self.adapter, compiled_node, manifest
+                )
+            if freshness is None:
+                freshness = self.adapter.calculate_freshness(
+                    relation,
+                    compiled_node.loaded_at_field,
+                    compiled_node.freshness.filter,
+                    manifest=manifest
+                )
 
         status = compiled_node.freshness.status(freshness['age'])
 
@@ -504,7 +573,110 @@ class FreshnessRunner(BaseRunner):
         return self.node
 
 
+class TestBatch:
+    """A group of schema tests that are executed as a single query. The first
+    runner that needs the batch compiles all of its tests and runs the query,
+    and the other runners reuse its results. Tests that fail to compile are
+    left out of the query, and if the query itself fails the tests in the
+    batch are run one at a time instead.
+
+    The time spent compiling and running the batch is split evenly between
+    the tests whose results came from the batch query.
+    """
+    def __init__(self, tests):
+        self.tests = tests
+        self.lock = threading.Lock()
+        self.compiled = None
+        self.compile_errors = {}
+        self.failed_rows = None
+        self.timing = []
+
+    def compile(self, runner, manifest, test):
+        with self.lock:
+            if self.compiled is None:
+                self.compiled = {}
+                with collect_timing_info('compile') as timing_info:
+                    for node in self.tests:
+                        try:
+                            self.compiled[node.unique_id] = compile_node(
+                                runner.adapter, runner.config, node,
+                                manifest, {}
+                            )
+                        except Exception as exc:
+                            self.compile_errors[node.unique_id] = exc
+                self.timing.append(timing_info)
+
+        if test.unique_id in self.compile_errors:
+            raise self.compile_errors[test.unique_id]
+        return self.compiled[test.unique_id]
+
+    def get_failed_rows(self, adapter, test):
+        """Get the number of failed rows for the given test, or None if it has
+        to be run on its own.
+        """
+        with self.lock:
+            if self.failed_rows is None:
+                with collect_timing_info('execute') as timing_info:
+                    self.failed_rows = self._execute(adapter)
+                self.timing.append(timing_info)
+        return self.failed_rows.get(test.unique_id)
+
+    def timing_for(self, test):
+        """Get the timing info and execution time to report for the given
+        test, or None if its result did not come from the batch query.
+        """
+        with self.lock:
+            if not self.failed_rows or test.unique_id not in self.failed_rows:
+                return None
+            timing = [
+                TimingInfo(name=t.name, started_at=t.started_at,
+                           completed_at=t.completed_at)
+                for t in self.timing
+            ]
+        elapsed = sum(
+            (t.completed_at - t.started_at).total_seconds() for t in timing
+        )
+        return timing, elapsed / len(self.failed_rows)
+
+    def _execute(self, adapter):
+        tests = [
+            self.compiled[node.unique_id] for node in self.tests
+            if node.unique_id in self.compiled
+        ]
+        if len(tests) < 2:
+            return {}
+
+        sql = '\nunion all\n'.join(
+            'select {idx} as dbt_test_index, * from (\n{sql}\n) '
+            'dbt_test_{idx}'.format(idx=idx, sql=test.wrapped_sql)
+            for idx, test in enumerate(tests)
+        )
+        try:
+            _, table = adapter.execute(sql, auto_begin=True, fetch=True)
+        except RuntimeException as exc:
+            logger.debug(
+                'Batched test query failed, running its {} tests one at a '
+                'time: {}'.format(len(tests), exc)
+            )
+            return {}
+
+        failed_rows = {}
+        bad = set()
+        for row in table:
+            unique_id = tests[int(row[0])].unique_id
+            if unique_id in failed_rows:
+                # the single-query path reports tests returning many rows
+                bad.add(unique_id)
+            failed_rows[unique_id] = row[1]
+        return {k: v for k, v in failed_rows.items() if k not in bad}
+
+
 class TestRunner(CompileRunner):
+    def __init__(self, config, adapter, node, node_index, num_nodes):
+        super().__init__(config, adapter, node, node_index, num_nodes)
+        # set by the TestTask when the test is run in a batch
+        self.batch = None
+
     def describe_node(self):
         node_name = self.node.name
         return "test {}".format(node_name)
@@ -521,7 +693,25 @@ class TestRunner(CompileRunner):
         dbt.ui.printer.print_start_line(description, self.node_index,
                                         self.num_nodes)
 
+    def compile(self, manifest):
+        if self.batch is not None:
+            return self.batch.compile(self, manifest, self.node)
+        return super().compile(manifest)
+
+    def from_run_result(self, result, start_time, timing_info):
+        result = super().from_run_result(result, start_time, timing_info)
+        if self.batch is not None:
+            batch_timing = self.batch.timing_for(result.node)
+            if batch_timing is not None:
+                result.timing, result.execution_time = batch_timing
+        return result
+
     def execute_test(self, test):
+        if self.batch is not None:
+            failed_rows = self.batch.get_failed_rows(self.adapter, test)
+            if failed_rows is not None:
+                return failed_rows
+
         res, table = self.adapter.execute(
             test.wrapped_sql,
             auto_begin=True,
@@ -567,6 +757,12 @@ class SnapshotRunner(ModelRunner):
 
 
 class SeedRunner(ModelRunner):
+    def __init__(self, config, adapter, node, node_index, num_nodes):
+        super().__init__(config, adapter, node, node_index, num_nodes)
+        # the seed checksums recorded by previous runs, keyed by unique ID.
+        # Shared between runners by the SeedTask, which persists them.
+        self.seed_checksums = {}
+
     def describe_node(self):
         return "seed file {}".format(self.get_node_representation())
 
@@ -581,6 +777,39 @@ class SeedRunner(ModelRunner):
         result.agate_table = agate_result.table
         return result
 
+    def _seed_checksum(self, model):
+        config = json.dumps(model.config.to_dict(), sort_keys=True,
+                            cls=dbt.utils.JSONEncoder)
+        relation = self.adapter.Relation.create_from(self.config, model)
+        return {
+            'relation': str(relation),
+            'checksum': FileHash.from_path(model.seed_file_path).checksum,
+            'config_checksum': FileHash.from_contents(config).checksum,
+        }
+
+    def _is_unchanged(self, model, checksum):
+        if dbt.flags.FULL_REFRESH:
+            return False
+        if self.seed_checksums.get(model.unique_id) != checksum:
+            return False
+        relation = self.adapter.get_relation(
+            database=model.database,
+            schema=model.schema,
+            identifier=model.alias,
+        )
+        return relation is not None
+
+    def execute(self, model, manifest):
+        checksum = self._seed_checksum(model)
+        if self._is_unchanged(model, checksum):
+            return RunModelResult(model, status='SKIP', skip=True)
+
+        # forget the old checksum first, so a failed load is retried
+        self.seed_checksums.pop(model.unique_id, None)
+        result = super().execute(model, manifest)
+        self.seed_checksums[model.unique_id] = checksum
+        return result
+
     def compile(self, manifest):
         return self.node
 
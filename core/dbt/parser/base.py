@@ -12,6 +12,7 @@ from dbt import deprecations
 from dbt import hooks
 from dbt.clients.jinja import get_rendered
 from dbt.config import Project, RuntimeConfig
+from dbt.context.dependencies import record_target
 from dbt.contracts.graph.manifest import (
     Manifest, SourceFile, FilePath, FileHash
 )
@@ -125,11 +126,15 @@ class ConfiguredParser(
 
     @property
     def default_schema(self):
-        return self.root_project.credentials.schema
+        schema = self.root_project.credentials.schema
+        record_target('schema', schema)
+        return schema
 
     @property
     def default_database(self):
-        return self.root_project.credentials.database
+        database = self.root_project.credentials.database
+        record_target('database', database)
+        return database
 
     def get_schema_func(self) -> RelationUpdate:
         """The get_schema function is set by a few different things:
@@ -296,6 +301,9 @@ class ConfiguredParser(
 
         Note: this mutates the config object when config() calls are rendered.
         """
+        # the adapter type decides the context's adapter, relation and column
+        # implementations
+        record_target('type', self.root_project.credentials.type)
         context = dbt.context.parser.generate(
             parsed_node, self.root_project, self.macro_manifest, config
         )
@@ -1,7 +1,17 @@
+from typing import List, Optional
+
+import dbt.context.parser
+import dbt.exceptions
+import dbt.flags
+from dbt.clients.jinja import extract_static_calls, StaticCall
 from dbt.contracts.graph.parsed import ParsedModelNode
 from dbt.node_types import NodeType
 from dbt.parser.base import SimpleSQLParser
 from dbt.parser.search import FilesystemSearcher, FileBlock
+from dbt.source_config import SourceConfig
+
+
+STATIC_FUNCTIONS = {'ref', 'source', 'config'}
 
 
 class ModelParser(SimpleSQLParser[ParsedModelNode]):
@@ -20,3 +30,96 @@ class ModelParser(SimpleSQLParser[ParsedModelNode]):
     @classmethod
     def get_compiled_path(cls, block: FileBlock):
         return block.path.relative_path
+
+    def _static_functions_overridden(self) -> bool:
+        # a macro with the same name as one of the functions could replace it
+        # in the context, and do anything at all.
+        return any(
+            self.macro_manifest.find_macro_by_name(name, None) is not None
+            for name in STATIC_FUNCTIONS
+        )
+
+    def get_static_calls(
+        self, node: ParsedModelNode
+    ) -> Optional[List[StaticCall]]:
+        """Get the model's ref(), source() and config() calls without
+        rendering it. If the model does anything else, or calls those
+        functions with arguments that rendering would reject, return None.
+        """
+        if self._static_functions_overridden():
+            return None
+
+        calls = extract_static_calls(node.raw_sql, STATIC_FUNCTIONS)
+        if calls is None:
+            return None
+
+        for call in calls:
+            if call.name == 'ref':
+                valid = len(call.args) in (1, 2) and not call.kwargs
+            elif call.name == 'source':
+                valid = len(call.args) == 2 and not call.kwargs
+            else:
+                valid = True
+            if not valid:
+                return None
+        return calls
+
+    def apply_static_calls(
+        self,
+        node: ParsedModelNode,
+        config: SourceConfig,
+        calls: List[StaticCall],
+    ) -> None:
+        """Update the node and config as rendering the calls would."""
+        model_config = dbt.context.parser.Config(node, config)
+        for call in calls:
+            if call.name == 'ref':
+                node.refs.append(list(call.args))
+            elif call.name == 'source':
+                node.sources.append(list(call.args))
+            else:
+                model_config(*call.args, **call.kwargs)
+
+    def _verify_static_calls(
+        self,
+        node: ParsedModelNode,
+        config: SourceConfig,
+        calls: List[StaticCall],
+    ) -> None:
+        """Render the model, then compare the results with applying the
+        statically extracted calls to a copy of the node and config.
+        """
+        static_node = node.from_dict(node.to_dict())
+        static_config = self.initial_config(config.fqn)
+        self.apply_static_calls(static_node, static_config, calls)
+
+        super().render_with_context(node, config)
+
+        mismatches = [
+            name for name, rendered, static in (
+                ('refs', node.refs, static_node.refs),
+                ('sources', node.sources, static_node.sources),
+                ('config', config.config, static_config.config),
+            )
+            if rendered != static
+        ]
+        if mismatches:
+            dbt.exceptions.raise_compiler_error(
+                'Static parser results differ from rendering for: {}'
+                .format(', '.join(mismatches)),
+                node
+            )
+
+    def render_with_context(
+        self, parsed_node: ParsedModelNode, config: SourceConfig
+    ) -> None:
+        """If the model only calls ref(), source() and config() with literal
+        arguments, skip rendering it and apply the calls directly.
+        """
+        calls = self.get_static_calls(parsed_node)
+        if calls is None:
+            super().render_with_context(parsed_node, config)
+        elif dbt.flags.TEST_STATIC_PARSER:
+            self._verify_static_calls(parsed_node, config, calls)
+        else:
+            self.apply_static_calls(parsed_node, config, calls)
@@ -3,6 +3,7 @@ from typing import TypeVar, MutableMapping, Mapping, Union, List
 
 from hologram import JsonSchemaMixin
 
+from dbt.context.dependencies import ParseDependencies
 from dbt.contracts.graph.manifest import SourceFile, RemoteFile, FileHash
 from dbt.contracts.graph.parsed import (
     ParsedNode, HasUniqueID, ParsedMacro, ParsedDocumentation, ParsedNodePatch,
@@ -44,8 +45,7 @@ def dict_field():
 
 @dataclass
 class ParseResult(JsonSchemaMixin, Writable):
-    vars_hash: FileHash
-    profile_hash: FileHash
+    version_hash: FileHash
     project_hashes: MutableMapping[str, FileHash]
     nodes: MutableMapping[str, ManifestNodes] = dict_field()
     sources: MutableMapping[str, ParsedSourceDefinition] = dict_field()
@@ -54,6 +54,8 @@ class ParseResult(JsonSchemaMixin, Writable):
     patches: MutableMapping[str, ParsedNodePatch] = dict_field()
     files: MutableMapping[str, SourceFile] = dict_field()
     disabled: MutableMapping[str, List[ParsedNode]] = dict_field()
+    # the vars/env vars/target values used by each file, by search key
+    dependencies: MutableMapping[str, ParseDependencies] = dict_field()
 
     def get_file(self, source_file: SourceFile) -> SourceFile:
         key = source_file.search_key
@@ -102,6 +104,17 @@ class ParseResult(JsonSchemaMixin, Writable):
         self.patches[patch.name] = patch
         self.get_file(source_file).patches.append(patch.name)
 
+    def add_dependencies(
+        self, source_file: SourceFile, dependencies: ParseDependencies
+    ):
+        key = source_file.search_key
+        if key is None:
+            return
+        if key in self.dependencies:
+            self.dependencies[key].update(dependencies)
+        else:
+            self.dependencies[key] = dependencies
+
     def _get_disabled(
         self, unique_id: str, match_file: SourceFile
     ) -> List[ParsedNode]:
@@ -165,6 +178,10 @@ class ParseResult(JsonSchemaMixin, Writable):
             )
             self.add_patch(source_file, patch)
 
+        key = old_file.search_key
+        if key is not None and key in old_result.dependencies:
+            self.add_dependencies(source_file, old_result.dependencies[key])
+
         return True
 
     def has_file(self, source_file: SourceFile) -> bool:
@@ -179,7 +196,7 @@ class ParseResult(JsonSchemaMixin, Writable):
     @classmethod
     def rpc(cls):
         # ugh!
-        return cls(FileHash.empty(), FileHash.empty(), {})
+        return cls(FileHash.empty(), {})
 
 
 T = TypeVar('T')
@@ -44,7 +44,7 @@ class SnapshotParser(
         if node.config.target_database:
             node.database = node.config.target_database
         elif not node.database:
-            node.database = self.root_project.credentials.database
+            node.database = self.default_database
 
         # the target schema must be set if we got here, so overwrite the node's
         # schema
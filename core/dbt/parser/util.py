@@ -261,7 +261,7 @@ class ParserUtils:
         """
         manifest = manifest.deepcopy(config=current_project)
         # it's ok for macros to silently override a local project macro name
-        manifest.macros.update(macros)
+        manifest.add_macros(macros)
 
         manifest.add_nodes({node.unique_id: node})
         cls.process_sources_for_node(
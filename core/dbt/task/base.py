@@ -3,6 +3,7 @@ from abc import ABCMeta, abstractmethod
 from typing import Type, Union
 
 from dbt.config import RuntimeConfig, Project
+from dbt.clients.jinja import bytecode_cache
 from dbt.config.profile import read_profile, PROFILES_DIR
 from dbt import tracking
 from dbt.logger import GLOBAL_LOGGER as logger
@@ -130,9 +131,19 @@ class RequiresProjectTask(BaseTask):
         return super().from_args(args)
 
 
+JINJA_CACHE_DIR_NAME = 'jinja_cache'
+
+
 class ConfiguredTask(RequiresProjectTask):
     ConfigType = RuntimeConfig
 
+    def __init__(self, args, config):
+        super().__init__(args, config)
+        # keep compiled templates around for the next invocation
+        bytecode_cache.set_directory(
+            os.path.join(config.target_path, JINJA_CACHE_DIR_NAME)
+        )
+
 
 class ProjectOnlyTask(RequiresProjectTask):
     ConfigType = Project
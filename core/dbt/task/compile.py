@@ -1,3 +1,4 @@
+from dbt.compilation import CompileCache, CompilePool
 from dbt.node_runners import CompileRunner
 from dbt.node_types import NodeType
 import dbt.ui.printer
@@ -6,6 +7,11 @@ from dbt.task.runnable import GraphRunnableTask
 
 
 class CompileTask(GraphRunnableTask):
+    def __init__(self, args, config):
+        super().__init__(args, config)
+        self.compile_pool = None
+        self.compile_cache = None
+
     def raise_on_first_error(self):
         return True
 
@@ -20,5 +26,40 @@ class CompileTask(GraphRunnableTask):
     def get_runner_type(self):
         return CompileRunner
 
+    def get_runner(self, node):
+        runner = super().get_runner(node)
+        if isinstance(runner, CompileRunner):
+            runner.compile_pool = self.compile_pool
+            runner.compile_cache = self.compile_cache
+        return runner
+
+    def execute_nodes(self):
+        self.compile_cache = CompileCache.load(self.config)
+        try:
+            return self._execute_nodes()
+        finally:
+            self.compile_cache.write(self.manifest)
+
+    def _execute_nodes(self):
+        processes = getattr(self.args, 'processes', None)
+        if processes is None or processes < 2:
+            return super().execute_nodes()
+
+        # fork the workers before any threads start
+        self.compile_pool = CompilePool.start(self.config, self.manifest,
+                                              processes)
+        if self.compile_pool is None:
+            return super().execute_nodes()
+
+        try:
+            results = super().execute_nodes()
+        except BaseException:
+            self.compile_pool.terminate()
+            raise
+        finally:
+            pool, self.compile_pool = self.compile_pool, None
+        pool.close()
+        return results
+
     def task_end_messages(self, results):
         dbt.ui.printer.print_timestamped_line('Done.')
@@ -1,14 +1,21 @@
 import os
+from collections import defaultdict
+
 from dbt.task.runnable import GraphRunnableTask
-from dbt.node_runners import FreshnessRunner
+from dbt.node_runners import FreshnessBatch, FreshnessRunner
 from dbt.node_types import NodeType
 from dbt.ui.printer import print_timestamped_line, print_run_result_error
 from dbt.contracts.results import FreshnessExecutionResult
+from dbt.logger import GLOBAL_LOGGER as logger
 
 RESULT_FILE_NAME = 'sources.json'
 
 
 class FreshnessTask(GraphRunnableTask):
+    def __init__(self, args, config):
+        super().__init__(args, config)
+        self.batches = {}
+
     def result_path(self):
         if self.args.output:
             return os.path.realpath(self.args.output)
@@ -18,6 +25,9 @@ class FreshnessTask(GraphRunnableTask):
     def raise_on_first_error(self):
         return False
 
+    def prewarms_connections(self):
+        return True
+
     def build_query(self):
         include = [
             'source:{}'.format(s)
@@ -34,6 +44,44 @@ class FreshnessTask(GraphRunnableTask):
     def get_runner_type(self):
         return FreshnessRunner
 
+    def get_runner(self, node):
+        runner = super().get_runner(node)
+        runner.batch = self.batches.get(node.unique_id)
+        return runner
+
+    def build_batches(self, adapter, selected_uids):
+        """Group the selected sources by database and schema, into batches of
+        at most `--batch-size` sources. Nothing is batched unless a batch size
+        is given, or if the collect_freshness macro is overridden.
+        """
+        batch_size = getattr(self.args, 'batch_size', None)
+        if batch_size is None or batch_size < 2:
+            return {}
+
+        if not adapter.can_batch_freshness(self.manifest):
+            logger.debug('collect_freshness is overridden, checking each '
+                         'source with its own query')
+            return {}
+
+        groups = defaultdict(list)
+        for unique_id in sorted(selected_uids):
+            node = self.manifest.nodes[unique_id]
+            groups[(node.database, node.schema)].append(node)
+
+        batches = {}
+        for sources in groups.values():
+            for start in range(0, len(sources), batch_size):
+                chunk = sources[start:start + batch_size]
+                if len(chunk) < 2:
+                    continue
+                batch = FreshnessBatch(chunk)
+                for source in chunk:
+                    batches[source.unique_id] = batch
+        return batches
+
+    def before_run(self, adapter, selected_uids):
+        self.batches = self.build_batches(adapter, selected_uids)
+
     def get_result(self, results, elapsed_time, generated_at):
         return FreshnessExecutionResult(
             elapsed_time=elapsed_time,
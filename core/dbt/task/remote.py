@@ -84,7 +84,7 @@ class _RPCExecTask(RPCTask):
             for node in macro_parser.parse_remote(macros):
                 macro_overrides[node.unique_id] = node
 
-        self._base_manifest.macros.update(macro_overrides)
+        self._base_manifest.add_macros(macro_overrides)
         rpc_parser = RPCCallParser(
             results=results,
             project=self.config,
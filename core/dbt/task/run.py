@@ -56,6 +56,9 @@ class RunTask(CompileTask):
     def raise_on_first_error(self):
         return False
 
+    def prewarms_connections(self):
+        return True
+
     def populate_adapter_cache(self, adapter):
         adapter.set_relations_cache(self.manifest)
 
@@ -156,6 +159,7 @@ class RunTask(CompileTask):
         with adapter.connection_named('master'):
             self.safe_run_hooks(adapter, RunHookType.End,
                                 {'schemas': schemas, 'results': results})
+            adapter.save_relations_cache()
 
     def after_hooks(self, adapter, results, elapsed):
         self.print_results_line(results, elapsed)
@@ -36,6 +36,8 @@ class RunOperationTask(ConfiguredTask):
                 kwargs=macro_kwargs,
                 manifest=manifest
             )
+        # the macro may have changed relations that a saved cache lists
+        adapter.discard_saved_relations_cache()
 
         return res
 
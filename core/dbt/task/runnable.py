@@ -1,3 +1,4 @@
+import json
 import os
 import time
 from datetime import datetime
@@ -5,6 +6,7 @@ from multiprocessing.dummy import Pool as ThreadPool
 
 from dbt.task.base import ConfiguredTask
 from dbt.adapters.factory import get_adapter
+from dbt.clients.system import load_file_contents
 from dbt.logger import GLOBAL_LOGGER as logger
 from dbt.compilation import compile_manifest
 from dbt.contracts.results import ExecutionResult
@@ -14,6 +16,7 @@ import dbt.exceptions
 import dbt.flags
 import dbt.ui.printer
 import dbt.utils
+import dbt.writer
 
 import dbt.graph.selector
 
@@ -36,6 +39,24 @@ def load_manifest(config):
     return manifest
 
 
+def load_execution_times(path):
+    """Load the execution time of each node from a run_results.json file.
+    If the file does not exist or can't be read, return an empty dict.
+    """
+    if not os.path.exists(path):
+        return {}
+    try:
+        results = json.loads(load_file_contents(path))['results']
+        return {
+            result['node']['unique_id']: float(result['execution_time'])
+            for result in results
+        }
+    except (OSError, ValueError, KeyError, TypeError) as exc:
+        logger.debug('Could not load execution times from {}: {}'
+                     .format(path, exc))
+        return {}
+
+
 class ManifestTask(ConfiguredTask):
     def __init__(self, args, config):
         super().__init__(args, config)
@@ -76,8 +97,9 @@ class GraphRunnableTask(ManifestTask):
     def _runtime_initialize(self):
         super()._runtime_initialize()
         selected_nodes = self.select_nodes()
-        self.job_queue = self.linker.as_graph_queue(self.manifest,
-                                                    selected_nodes)
+        self.job_queue = self.linker.as_graph_queue(
+            self.manifest, selected_nodes, self.get_execution_times()
+        )
 
         # we use this a couple times. order does not matter.
         self._flattened_nodes = [
@@ -89,9 +111,23 @@ class GraphRunnableTask(ManifestTask):
             if not n.is_ephemeral_model
         ])
 
+    def get_execution_times(self):
+        """If critical path scheduling was requested, get the execution times
+        of nodes from the previous run's results.
+        """
+        if not getattr(self.args, 'critical_path', False):
+            return None
+        return load_execution_times(self.result_path())
+
     def raise_on_first_error(self):
         return False
 
+    def prewarms_connections(self):
+        """Whether the task's nodes run SQL, so each thread will need a
+        connection.
+        """
+        return False
+
     def build_query(self):
         raise dbt.exceptions.NotImplementedException('Not Implemented')
 
@@ -202,6 +238,13 @@ class GraphRunnableTask(ManifestTask):
         dbt.ui.printer.print_timestamped_line(concurrency_line)
         dbt.ui.printer.print_timestamped_line("")
 
+        if self.prewarms_connections() and \
+                not self.config.args.single_threaded:
+            # open the threads' connections all at once, before they start
+            get_adapter(self.config).prewarm_connections(
+                min(num_threads, len(self._flattened_nodes))
+            )
+
         pool = ThreadPool(num_threads)
         try:
             self.run_queue(pool)
@@ -252,6 +295,26 @@ class GraphRunnableTask(ManifestTask):
     def after_hooks(self, adapter, results, elapsed):
         pass
 
+    def flush_writes(self, results):
+        """Wait for the nodes' compiled and run files, which are written in
+        the background. Mark the result of any node whose file could not be
+        written as an error.
+        """
+        try:
+            dbt.writer.flush()
+        except dbt.writer.WriteErrors as exc:
+            errors = dict(exc.errors)
+            for result in results:
+                error = errors.pop(result.node.unique_id, None)
+                if error is not None:
+                    logger.error('Could not write files for {}: {}'
+                                 .format(result.node.unique_id, error))
+                    result.error = str(error)
+                    result.status = 'ERROR'
+            for key, error in errors.items():
+                logger.error('Could not write files for {}: {}'
+                             .format(key, error))
+
     def execute_with_hooks(self, selected_uids):
         adapter = get_adapter(self.config)
         try:
@@ -259,6 +322,7 @@ class GraphRunnableTask(ManifestTask):
             started = time.time()
             self.before_run(adapter, selected_uids)
             res = self.execute_nodes()
+            self.flush_writes(res)
             self.after_run(adapter, res)
             elapsed = time.time() - started
             self.after_hooks(adapter, res, elapsed)
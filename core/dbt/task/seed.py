@@ -1,5 +1,8 @@
+import json
+import os
 import random
 
+from dbt.clients.system import load_file_contents, write_json
 from dbt.logger import GLOBAL_LOGGER as logger
 from dbt.node_runners import SeedRunner
 from dbt.node_types import NodeType
@@ -7,7 +10,14 @@ from dbt.task.run import RunTask
 import dbt.ui.printer
 
 
+SEED_CHECKSUMS_FILE_NAME = 'seed_checksums.json'
+
+
 class SeedTask(RunTask):
+    def __init__(self, args, config):
+        super().__init__(args, config)
+        self.seed_checksums = {}
+
     def raise_on_first_error(self):
         return False
 
@@ -21,6 +31,33 @@ class SeedTask(RunTask):
     def get_runner_type(self):
         return SeedRunner
 
+    def get_runner(self, node):
+        runner = super().get_runner(node)
+        runner.seed_checksums = self.seed_checksums
+        return runner
+
+    def seed_checksums_path(self):
+        return os.path.join(self.config.target_path, SEED_CHECKSUMS_FILE_NAME)
+
+    def load_seed_checksums(self):
+        path = self.seed_checksums_path()
+        if not os.path.exists(path):
+            return {}
+        try:
+            return json.loads(load_file_contents(path, strip=False))
+        except (OSError, ValueError) as exc:
+            logger.debug('Could not read the seed checksums at {}: {}'
+                         .format(path, exc))
+            return {}
+
+    def before_run(self, adapter, selected_uids):
+        self.seed_checksums.update(self.load_seed_checksums())
+        super().before_run(adapter, selected_uids)
+
+    def after_run(self, adapter, results):
+        super().after_run(adapter, results)
+        write_json(self.seed_checksums_path(), self.seed_checksums)
+
     def task_end_messages(self, results):
         if self.args.show:
             self.show_tables(results)
@@ -43,5 +80,6 @@ class SeedTask(RunTask):
 
     def show_tables(self, results):
         for result in results:
-            if result.error is None:
+            # unchanged seeds are not loaded, so there is no table to show
+            if result.error is None and not result.skip:
                 self.show_table(result)
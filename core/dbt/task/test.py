@@ -1,4 +1,6 @@
-from dbt.node_runners import TestRunner
+from collections import defaultdict
+
+from dbt.node_runners import TestBatch, TestRunner
 from dbt.node_types import NodeType
 from dbt.task.run import RunTask
 
@@ -9,6 +11,10 @@ class TestTask(RunTask):
         Read schema files + custom data tests and validate that
         constraints are satisfied.
     """
+    def __init__(self, args, config):
+        super().__init__(args, config)
+        self.batches = {}
+
     def raise_on_first_error(self):
         return False
 
@@ -38,3 +44,37 @@ class TestTask(RunTask):
 
     def get_runner_type(self):
         return TestRunner
+
+    def get_runner(self, node):
+        runner = super().get_runner(node)
+        runner.batch = self.batches.get(node.unique_id)
+        return runner
+
+    def build_batches(self, selected_uids):
+        """Group the selected schema tests by the nodes they depend on, into
+        batches of at most `--batch-size` tests.
+        """
+        batch_size = getattr(self.args, 'batch_size', None)
+        if batch_size is None or batch_size < 2:
+            return {}
+
+        groups = defaultdict(list)
+        for unique_id in sorted(selected_uids):
+            node = self.manifest.nodes[unique_id]
+            if node.resource_type == NodeType.Test and 'schema' in node.tags:
+                groups[tuple(sorted(node.depends_on.nodes))].append(node)
+
+        batches = {}
+        for tests in groups.values():
+            for start in range(0, len(tests), batch_size):
+                chunk = tests[start:start + batch_size]
+                if len(chunk) < 2:
+                    continue
+                batch = TestBatch(chunk)
+                for test in chunk:
+                    batches[test.unique_id] = batch
+        return batches
+
+    def before_run(self, adapter, selected_uids):
+        self.batches = self.build_batches(selected_uids)
+        super().before_run(adapter, selected_uids)
@@ -213,7 +213,10 @@ def print_snapshot_result_line(
 def print_seed_result_line(result, schema_name: str, index: int, total: int):
     model = result.node
 
-    info, status = get_printable_result(result, 'loaded', 'loading')
+    if result.skip:
+        info, status = 'SKIP unchanged', yellow(result.status)
+    else:
+        info, status = get_printable_result(result, 'loaded', 'loading')
 
     print_fancy_output_line(
         "{info} seed file {schema}.{relation}".format(
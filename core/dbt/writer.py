@@ -1,6 +1,134 @@
+import atexit
+import os
 import os.path
+import queue
+import threading
 
 import dbt.clients.system
+from dbt.logger import GLOBAL_LOGGER as logger
+
+# how many writes can be waiting before write_node blocks
+WRITE_QUEUE_SIZE = 1000
+
+
+def _is_unchanged(path, payload):
+    try:
+        with open(path, 'r', encoding='utf-8') as fp:
+            return fp.read() == payload
+    except (OSError, UnicodeDecodeError):
+        return False
+
+
+class WriteErrors(Exception):
+    """Raised by flush() when files could not be written. `errors` maps the
+    key each failed file was written with to its exception.
+    """
+    def __init__(self, errors):
+        self.errors = errors
+        super().__init__('Could not write {} file(s): {}'.format(
+            len(errors), '; '.join(str(e) for e in errors.values())
+        ))
+
+
+def _write_file(path, payload):
+    with open(path, 'w', encoding='utf-8') as fp:
+        fp.write(payload)
+
+
+class BufferedWriter:
+    """Write files from a background thread, so the threads that run nodes
+    don't wait on the filesystem. Writes happen in the order they were queued.
+    Each directory is created once, and a file that already has the given
+    contents is left alone.
+
+    Errors are raised together from the next call to flush().
+    """
+    def __init__(self, maxsize=WRITE_QUEUE_SIZE):
+        self._queue = queue.Queue(maxsize)
+        self._lock = threading.Lock()
+        self._thread = None
+        self._directories = set()
+        self._errors = {}
+
+    def write(self, path, payload, key=None):
+        """Queue a write. If it fails, its error is reported under the given
+        key, or under the path if there is none.
+        """
+        self._start()
+        self._queue.put((path, str(payload), path if key is None else key))
+
+    def flush(self):
+        """Wait for the queued writes to finish, and raise WriteErrors if any
+        of them failed.
+        """
+        self._queue.join()
+        errors, self._errors = self._errors, {}
+        if errors:
+            raise WriteErrors(errors)
+
+    def _start(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name='dbt-writer', daemon=True
+                )
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            path, payload, key = self._queue.get()
+            try:
+                self._write(path, payload)
+            except Exception as exc:
+                logger.debug('Could not write {}: {}'.format(path, exc))
+                self._errors.setdefault(key, exc)
+            finally:
+                self._queue.task_done()
+
+    def _write(self, path, payload):
+        if _is_unchanged(path, payload):
+            return
+
+        directory = os.path.dirname(path)
+        if directory not in self._directories:
+            dbt.clients.system.make_directory(directory)
+            self._directories.add(directory)
+
+        try:
+            _write_file(path, payload)
+        except FileNotFoundError:
+            # the directory was removed since this writer created it
+            dbt.clients.system.make_directory(directory)
+            _write_file(path, payload)
+
+
+_WRITER = BufferedWriter()
+
+
+def _reset_writer():
+    # a forked child doesn't inherit the writer thread, and the queue's locks
+    # may have been held by it
+    global _WRITER
+    _WRITER = BufferedWriter()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_writer)
+
+
+def flush():
+    """Wait until every file passed to write_node has been written. Errors
+    are keyed by the unique ID of the node that wrote the file.
+    """
+    _WRITER.flush()
+
+
+@atexit.register
+def _flush_at_exit():
+    try:
+        flush()
+    except Exception as exc:
+        logger.error('Error writing files: {}'.format(exc))
 
 
 def write_node(node, target_path, subdirectory, payload):
@@ -9,6 +137,6 @@ def write_node(node, target_path, subdirectory, payload):
     full_path = os.path.join(target_path, subdirectory, node.package_name,
                              node_path)
 
-    dbt.clients.system.write_file(full_path, payload)
+    _WRITER.write(full_path, payload, key=node.unique_id)
 
     return full_path
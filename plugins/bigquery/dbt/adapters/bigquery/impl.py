@@ -1,4 +1,5 @@
-import copy
+import functools
+from multiprocessing.dummy import Pool as ThreadPool
 
 import dbt.deprecations
 import dbt.exceptions
@@ -450,62 +451,89 @@ class BigQueryAdapter(BaseAdapter):
         )
         return zip(column_names, column_values)
 
+    _catalog_column_names = (
+        'table_database',
+        'table_schema',
+        'table_name',
+        'table_type',
+        'table_comment',
+        # does not exist in bigquery, but included for consistency
+        'table_owner',
+        'column_name',
+        'column_index',
+        'column_type',
+        'column_comment',
+    )
+
+    def _get_catalog_rows(self, connection, relation):
+        """Fetch the full table object for a relation and build its catalog
+        rows, one per flattened column. This runs on catalog worker threads,
+        so it uses the given connection's client.
+        """
+        # This relation contains a subset of the info we care about.
+        # Fetch the full table object here
+        table_ref = self.connections.table_ref(
+            relation.database,
+            relation.schema,
+            relation.identifier,
+            connection
+        )
+        table = connection.handle.get_table(table_ref)
+
+        flattened = self._flat_columns_in_table(table)
+        # the stats values are all immutable, so every column can share them
+        relation_stats = dict(self._get_stats_columns(table, relation.type))
+
+        rows = []
+        for index, column in enumerate(flattened, start=1):
+            column_data = (
+                relation.database,
+                relation.schema,
+                relation.name,
+                relation.type,
+                None,
+                None,
+                column.name,
+                index,
+                column.data_type,
+                None,
+            )
+            column_dict = dict(zip(self._catalog_column_names, column_data))
+            column_dict.update(relation_stats)
+            rows.append(column_dict)
+        return rows
+
     def get_catalog(self, manifest):
+        """Get the catalog for the schemas in the manifest. Tables are fetched
+        concurrently, on up to 'threads' threads sharing this thread's client.
+        """
         connection = self.connections.get_thread_connection()
-        client = connection.handle
 
         schemas = manifest.get_used_schemas()
 
-        column_names = (
-            'table_database',
-            'table_schema',
-            'table_name',
-            'table_type',
-            'table_comment',
-            # does not exist in bigquery, but included for consistency
-            'table_owner',
-            'column_name',
-            'column_index',
-            'column_type',
-            'column_comment',
-        )
-        all_names = column_names + self._get_stats_column_names()
-        columns = []
+        all_names = self._catalog_column_names + \
+            self._get_stats_column_names()
 
+        relations = []
         for database_name, schema_name in schemas:
-            relations = self.list_relations(database_name, schema_name)
-            for relation in relations:
-
-                # This relation contains a subset of the info we care about.
-                # Fetch the full table object here
-                table_ref = self.connections.table_ref(
-                    database_name,
-                    relation.schema,
-                    relation.identifier,
-                    connection
+            relations.extend(self.list_relations(database_name, schema_name))
+
+        num_threads = min(self.config.threads, len(relations))
+        if num_threads > 1:
+            pool = ThreadPool(num_threads)
+            try:
+                results = pool.map(
+                    functools.partial(self._get_catalog_rows, connection),
+                    relations
                 )
-                table = client.get_table(table_ref)
-
-                flattened = self._flat_columns_in_table(table)
-                relation_stats = dict(self._get_stats_columns(table,
-                                                              relation.type))
-
-                for index, column in enumerate(flattened, start=1):
-                    column_data = (
-                        relation.database,
-                        relation.schema,
-                        relation.name,
-                        relation.type,
-                        None,
-                        None,
-                        column.name,
-                        index,
-                        column.data_type,
-                        None,
-                    )
-                    column_dict = dict(zip(column_names, column_data))
-                    column_dict.update(copy.deepcopy(relation_stats))
-
-                    columns.append(column_dict)
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            results = [
+                self._get_catalog_rows(connection, relation)
+                for relation in relations
+            ]
 
+        columns = [row for rows in results for row in rows]
         return dbt.clients.agate_helper.table_from_data(columns, all_names)
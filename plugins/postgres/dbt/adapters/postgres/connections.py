@@ -1,3 +1,6 @@
+import csv
+import io
+import time
 from contextlib import contextmanager
 
 import psycopg2
@@ -34,6 +37,33 @@ class PostgresCredentials(Credentials):
         return ('host', 'port', 'user', 'database', 'schema', 'search_path')
 
 
+class _CSVRowsFile:
+    """A read-only file-like object that renders rows as CSV as they are
+    read, so `copy_expert` can stream them without building the whole file.
+    None is written as an empty field.
+    """
+    def __init__(self, rows):
+        self._rows = iter(rows)
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer, lineterminator='\n')
+        self._pending = ''
+
+    def read(self, size=-1):
+        while size < 0 or len(self._pending) < size:
+            row = next(self._rows, None)
+            if row is None:
+                break
+            self._writer.writerow(row)
+            self._pending += self._buffer.getvalue()
+            self._buffer.seek(0)
+            self._buffer.truncate()
+
+        if size < 0:
+            size = len(self._pending)
+        result, self._pending = self._pending[:size], self._pending[size:]
+        return result
+
+
 class PostgresConnectionManager(SQLConnectionManager):
     TYPE = 'postgres'
 
@@ -111,6 +141,14 @@ class PostgresConnectionManager(SQLConnectionManager):
 
         return connection
 
+    @classmethod
+    def is_alive(cls, connection):
+        # psycopg2 sets `closed` when it notices the connection was lost
+        return (
+            connection.handle is not None and
+            connection.handle.closed == 0
+        )
+
     def cancel(self, connection):
         connection_name = connection.name
         pid = connection.handle.get_backend_pid()
@@ -124,6 +162,43 @@ class PostgresConnectionManager(SQLConnectionManager):
 
         logger.debug("Cancel query '{}': {}".format(connection_name, res))
 
+    def copy_rows(self, table, column_names, rows):
+        """Load rows into the table with `COPY ... FROM STDIN`, in the current
+        transaction. Returns the COPY statement.
+
+        :param str table: The rendered name of the table to load.
+        :param List[str] column_names: The columns to load, in row order.
+        :param Iterable[Sequence[Any]] rows: The rows to load. None values are
+            loaded as null.
+        """
+        connection = self.get_thread_connection()
+        if connection.transaction_open is False:
+            self.begin()
+
+        cols_sql = ', '.join(column_names)
+        # in csv format, unquoted empty fields are null. force_null also
+        # makes a quoted empty field null, which csv.writer emits for a None
+        # in a single-column row.
+        sql = (
+            'copy {} ({}) from stdin with (format csv, force_null ({}))'
+            .format(table, cols_sql, cols_sql)
+        )
+        logger.debug(
+            'On {connection_name}: {sql}',
+            connection_name=connection.name,
+            sql=sql,
+        )
+        with self.exception_handler(sql):
+            pre = time.time()
+            cursor = connection.handle.cursor()
+            cursor.copy_expert(sql, _CSVRowsFile(rows))
+            logger.debug(
+                "SQL status: {status} in {elapsed:0.2f} seconds",
+                status=self.get_status(cursor),
+                elapsed=(time.time() - pre)
+            )
+        return sql
+
     @classmethod
     def get_credentials(cls, credentials):
         return credentials
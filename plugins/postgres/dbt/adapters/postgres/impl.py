@@ -34,6 +34,15 @@ class PostgresAdapter(SQLAdapter):
         # return an empty string on success so macros can call this
         return ''
 
+    @available
+    def copy_csv_rows(self, relation, agate_table):
+        """Bulk-load the rows of a seed's agate table into relation with
+        COPY, and return the COPY statement.
+        """
+        return self.connections.copy_rows(
+            relation.render(False), agate_table.column_names, agate_table.rows
+        )
+
     def _link_cached_database_relations(self, schemas):
         """
 
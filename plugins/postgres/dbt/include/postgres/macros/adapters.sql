@@ -72,6 +72,28 @@
   {{ return(load_result('list_relations_without_caching').table) }}
 {% endmacro %}
 
+{% macro postgres__get_relations_fingerprint(schemas) %}
+  {#-- oids change when a relation is dropped and recreated --#}
+  {% call statement('get_relations_fingerprint', fetch_result=True) -%}
+    select md5(coalesce(string_agg(
+        n.nspname || '.' || c.relname || '.' || c.relkind || '.' || c.oid,
+        ',' order by n.nspname, c.relname
+      ), '')) as fingerprint
+    from pg_class c
+    join pg_namespace n on n.oid = c.relnamespace
+    where c.relkind in ('r', 'v', 'm', 'p')
+      and lower(n.nspname) in (
+        {%- set schema_names = [] -%}
+        {%- for database, schema in schemas -%}
+          {%- do schema_names.append(schema) -%}
+        {%- endfor -%}
+        {{ string_literal_list(schema_names) }}
+      )
+  {%- endcall %}
+  {{ return(load_result('get_relations_fingerprint').table) }}
+{% endmacro %}
+
+
 {% macro postgres__information_schema_name(database) -%}
   {% if database_name -%}
     {{ adapter.verify_database(database_name) }}
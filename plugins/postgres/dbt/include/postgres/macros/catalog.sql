@@ -1,5 +1,5 @@
 
-{% macro postgres__get_catalog(information_schemas) -%}
+{% macro postgres__get_catalog(information_schemas, schemas) -%}
 
   {%- call statement('catalog', fetch_result=True) -%}
     {% if (information_schemas | length) != 1 %}
@@ -27,7 +27,8 @@
     join pg_catalog.pg_class tbl on tbl.relnamespace = sch.oid
     join pg_catalog.pg_attribute col on col.attrelid = tbl.oid
 
-    where sch.nspname != 'information_schema'
+    where lower(sch.nspname) in ({{ string_literal_list(schemas) }}) -- only the schemas dbt uses
+      and sch.nspname != 'information_schema'
       and sch.nspname not like 'pg_%' -- avoid postgres system schemas
       and not pg_is_other_temp_schema(sch.oid) -- not a temporary schema belonging to another session
       and tbl.relpersistence = 'p' -- [p]ermanent table. Other values are [u]nlogged table, [t]emporary table
@@ -0,0 +1,9 @@
+
+{% macro postgres__load_csv_rows(model, agate_table) %}
+  {#-- COPY large seeds in one statement, insert small ones in batches --#}
+  {% if (agate_table.rows | length) > 10000 %}
+    {{ return(adapter.copy_csv_rows(this, agate_table)) }}
+  {% else %}
+    {{ return(basic_load_csv_rows(model, 10000, agate_table)) }}
+  {% endif %}
+{% endmacro %}
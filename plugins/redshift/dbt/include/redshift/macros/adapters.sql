@@ -150,6 +150,28 @@
 {% endmacro %}
 
 
+{% macro redshift__get_relations_fingerprint(schemas) %}
+  {#-- redshift has no string_agg, and listagg is limited to 64K --#}
+  {% call statement('get_relations_fingerprint', fetch_result=True) -%}
+    select
+      count(*)::varchar || '.' || coalesce(sum(c.oid::bigint), 0)::varchar
+      || '.' || coalesce(sum(strtol(substring(md5(n.nspname || '.' || c.relname), 1, 8), 16)), 0)::varchar
+        as fingerprint
+    from pg_class c
+    join pg_namespace n on n.oid = c.relnamespace
+    where c.relkind in ('r', 'v')
+      and lower(n.nspname) in (
+        {%- set schema_names = [] -%}
+        {%- for database, schema in schemas -%}
+          {%- do schema_names.append(schema) -%}
+        {%- endfor -%}
+        {{ string_literal_list(schema_names) }}
+      )
+  {%- endcall %}
+  {{ return(load_result('get_relations_fingerprint').table) }}
+{% endmacro %}
+
+
 {% macro redshift__information_schema_name(database) -%}
   {{ return(postgres__information_schema_name(database)) }}
 {%- endmacro %}
@@ -175,3 +197,13 @@
 {% macro redshift__make_temp_relation(base_relation, suffix) %}
     {% do return(postgres__make_temp_relation(base_relation, suffix)) %}
 {% endmacro %}
+
+
+{#- backslashes also start escape sequences in Redshift string literals -#}
+{% macro redshift__string_literal_list(values) -%}
+  {%- for value in values -%}
+    '{{ value | replace("\\", "\\\\") | replace("'", "''") }}'{% if not loop.last %}, {% endif %}
+  {%- else -%}
+    null
+  {%- endfor -%}
+{%- endmacro %}
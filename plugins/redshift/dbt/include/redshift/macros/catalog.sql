@@ -1,5 +1,5 @@
 
-{% macro redshift__get_base_catalog(information_schemas) -%}
+{% macro redshift__get_base_catalog(information_schemas, schemas) -%}
   {%- call statement('base_catalog', fetch_result=True) -%}
     {% if (information_schemas | length) != 1 %}
         {{ exceptions.raise_compiler_error('redshift get_catalog requires exactly one database') }}
@@ -23,6 +23,7 @@
         cols(table_schema name, table_name name, column_name name,
              column_type varchar,
              column_index int)
+      where lower(table_schema) in ({{ string_literal_list(schemas) }})
         order by "column_index"
     ),
 
@@ -35,6 +36,7 @@
             tableowner as table_owner
 
         from pg_tables
+        where lower(schemaname) in ({{ string_literal_list(schemas) }})
 
         union all
 
@@ -45,6 +47,7 @@
             viewowner as table_owner
 
         from pg_views
+        where lower(schemaname) in ({{ string_literal_list(schemas) }})
 
     ),
 
@@ -57,6 +60,7 @@
         table_type
 
       from information_schema.tables
+      where lower(table_schema) in ({{ string_literal_list(schemas) }})
 
     ),
 
@@ -75,6 +79,7 @@
 
 
         from information_schema."columns"
+        where lower(table_schema) in ({{ string_literal_list(schemas) }})
 
     ),
 
@@ -106,7 +111,7 @@
   {{ return(load_result('base_catalog').table) }}
 {%- endmacro %}
 
-{% macro redshift__get_extended_catalog(information_schemas) %}
+{% macro redshift__get_extended_catalog(schemas) %}
   {%- call statement('extended_catalog', fetch_result=True) -%}
 
     select
@@ -183,6 +188,7 @@
         (skew_rows is not null) as "stats:skew_rows:include"
 
     from svv_table_info
+    where lower("schema") in ({{ string_literal_list(schemas) }})
 
   {%- endcall -%}
 
@@ -218,16 +224,16 @@
 {% endmacro %}
 
 
-{% macro redshift__get_catalog(information_schemas) %}
+{% macro redshift__get_catalog(information_schemas, schemas) %}
 
     {#-- Compute a left-outer join in memory. Some Redshift queries are
       -- leader-only, and cannot be joined to other compute-based queries #}
 
-    {% set catalog = redshift__get_base_catalog(information_schemas) %}
+    {% set catalog = redshift__get_base_catalog(information_schemas, schemas) %}
 
     {% set select_extended =  redshift__can_select_from('svv_table_info') %}
     {% if select_extended %}
-        {% set extended_catalog = redshift__get_extended_catalog() %}
+        {% set extended_catalog = redshift__get_extended_catalog(schemas) %}
         {% set catalog = catalog.join(extended_catalog, 'table_id') %}
     {% else %}
         {{ redshift__no_svv_table_info_warning() }}
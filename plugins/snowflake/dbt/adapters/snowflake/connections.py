@@ -135,6 +135,13 @@ class SnowflakeConnectionManager(SQLConnectionManager):
 
             raise dbt.exceptions.FailedToConnectException(str(e))
 
+    @classmethod
+    def is_alive(cls, connection):
+        return (
+            connection.handle is not None and
+            not connection.handle.is_closed()
+        )
+
     def cancel(self, connection):
         handle = connection.handle
         sid = handle.session_id
@@ -125,3 +125,13 @@
     alter table {{ relation }} alter {{ column_name }} set data type {{ new_column_type }};
   {% endcall %}
 {% endmacro %}
+
+
+{#- backslashes also start escape sequences in Snowflake string literals -#}
+{% macro snowflake__string_literal_list(values) -%}
+  {%- for value in values -%}
+    '{{ value | replace("\\", "\\\\") | replace("'", "''") }}'{% if not loop.last %}, {% endif %}
+  {%- else -%}
+    null
+  {%- endfor -%}
+{%- endmacro %}
@@ -1,5 +1,5 @@
 
-{% macro snowflake__get_catalog(information_schemas) -%}
+{% macro snowflake__get_catalog(information_schemas, schemas) -%}
 
     {%- call statement('catalog', fetch_result=True) -%}
     {% for information_schema in information_schemas %}
@@ -32,6 +32,7 @@
                     (bytes is not null) as "stats:bytes:include"
 
                 from {{ information_schema }}.tables
+                where lower(table_schema) in ({{ string_literal_list(schemas) }})
 
             ),
 
@@ -49,6 +50,7 @@
                     null as "column_comment"
 
                 from {{ information_schema }}.columns
+                where lower(table_schema) in ({{ string_literal_list(schemas) }})
 
             )
 
@@ -0,0 +1,126 @@
+"""Micro-benchmark for generating the runtime context of many nodes in a
+project with many macros.
+
+Run it from the repository root:
+
+    python -m test.benchmark.context_generation --nodes 5000 --macros 1500
+"""
+import argparse
+import time
+
+from dbt.adapters.postgres import PostgresAdapter
+from dbt.contracts.graph.manifest import Manifest
+from dbt.contracts.graph.parsed import (
+    DependsOn, NodeConfig, ParsedMacro, ParsedModelNode
+)
+from dbt.node_types import NodeType
+import dbt.context.runtime
+import dbt.tracking
+
+from test.unit.utils import config_from_parts_or_dicts, inject_adapter
+
+
+PROJECT = {
+    'name': 'root',
+    'version': '0.1',
+    'profile': 'test',
+    'project-root': '/tmp/dbt/does-not-exist',
+}
+
+PROFILE = {
+    'outputs': {
+        'test': {
+            'type': 'postgres',
+            'dbname': 'postgres',
+            'user': 'root',
+            'host': 'thishostshouldnotexist',
+            'pass': 'password',
+            'port': 5432,
+            'schema': 'public'
+        }
+    },
+    'target': 'test'
+}
+
+
+def make_macros(num_macros):
+    macros = {}
+    for idx in range(num_macros):
+        package_name = ('dbt', 'root', 'utils')[idx % 3]
+        macro = ParsedMacro(
+            name='macro_{}'.format(idx),
+            resource_type=NodeType.Macro,
+            unique_id='macro.{}.macro_{}'.format(package_name, idx),
+            package_name=package_name,
+            original_file_path='macros/macro_{}.sql'.format(idx),
+            root_path='/usr/src/app',
+            path='macros/macro_{}.sql'.format(idx),
+            raw_sql='{% macro macro_' + str(idx) + '() %}1{% endmacro %}',
+        )
+        macros[macro.unique_id] = macro
+    return macros
+
+
+def make_nodes(num_nodes):
+    nodes = {}
+    for idx in range(num_nodes):
+        name = 'model_{}'.format(idx)
+        node = ParsedModelNode(
+            alias=name,
+            name=name,
+            database='dbt',
+            schema='analytics',
+            resource_type=NodeType.Model,
+            unique_id='model.root.{}'.format(name),
+            fqn=['root', name],
+            package_name='root',
+            original_file_path='{}.sql'.format(name),
+            root_path='/usr/src/app',
+            refs=[],
+            sources=[],
+            depends_on=DependsOn(),
+            config=NodeConfig.from_dict({
+                'enabled': True,
+                'materialized': 'view',
+                'persist_docs': {},
+                'post-hook': [],
+                'pre-hook': [],
+                'vars': {},
+                'quoting': {},
+                'column_types': {},
+                'tags': [],
+            }),
+            tags=[],
+            path='{}.sql'.format(name),
+            raw_sql='select 1 as id',
+            description='',
+            columns={}
+        )
+        nodes[node.unique_id] = node
+    return nodes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--nodes', type=int, default=5000)
+    parser.add_argument('--macros', type=int, default=1500)
+    args = parser.parse_args()
+
+    dbt.tracking.do_not_track()
+    config = config_from_parts_or_dicts(PROJECT, PROFILE)
+    inject_adapter(PostgresAdapter(config))
+    nodes = make_nodes(args.nodes)
+    manifest = Manifest(nodes=nodes, macros=make_macros(args.macros),
+                        docs={}, generated_at=None, disabled=[], files={})
+
+    start = time.perf_counter()
+    for node in nodes.values():
+        dbt.context.runtime.generate(node, config, manifest)
+    elapsed = time.perf_counter() - start
+    print('{} nodes, {} macros: {:8.3f}s, {:8.1f}us per node'.format(
+        args.nodes, args.macros, elapsed, elapsed / args.nodes * 1e6
+    ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+"""Micro-benchmark for draining a GraphQueue over synthetic DAGs.
+
+Run it from the repository root:
+
+    python -m test.benchmark.graph_queue --nodes 10000 50000 100000
+"""
+import argparse
+import random
+import time
+
+import networkx as nx
+
+from dbt.linker import GraphQueue
+from dbt.node_types import NodeType
+
+
+class _Node:
+    resource_type = NodeType.Model
+
+    def __init__(self, unique_id):
+        self.unique_id = unique_id
+
+    def get_materialization(self):
+        return 'table'
+
+
+class _Manifest:
+    def __init__(self, graph):
+        self.nodes = {node: _Node(node) for node in graph.nodes()}
+
+
+class _UnscoredGraphQueue(GraphQueue):
+    """A GraphQueue that skips calculating scores, so the benchmark only
+    measures scheduling.
+    """
+    def _calculate_scores(self):
+        return {node: 0 for node in self.graph.nodes()}
+
+
+def make_dag(num_nodes, width, max_parents, seed=0):
+    """Make a layered DAG with `width` nodes per layer. Each node depends on
+    up to `max_parents` random nodes from the previous layer.
+    """
+    rng = random.Random(seed)
+    graph = nx.DiGraph()
+    previous = []
+    for start in range(0, num_nodes, width):
+        layer = ['model.{}'.format(i)
+                 for i in range(start, min(start + width, num_nodes))]
+        graph.add_nodes_from(layer)
+        for node in layer:
+            if not previous:
+                continue
+            num_parents = rng.randint(1, min(max_parents, len(previous)))
+            for parent in rng.sample(previous, num_parents):
+                graph.add_edge(parent, node)
+        previous = layer
+    return graph
+
+
+def drain(queue):
+    while not queue.empty():
+        node = queue.get(block=False)
+        queue.mark_done(node.unique_id)
+
+
+def run(num_nodes, width, max_parents, scored):
+    graph = make_dag(num_nodes, width, max_parents)
+    queue_cls = GraphQueue if scored else _UnscoredGraphQueue
+    # the queue removes nodes from the graph as they finish
+    num_edges = graph.number_of_edges()
+
+    start = time.perf_counter()
+    queue = queue_cls(graph, _Manifest(graph))
+    built = time.perf_counter()
+    drain(queue)
+    done = time.perf_counter()
+
+    print('{:>8} nodes {:>8} edges: init {:8.3f}s  drain {:8.3f}s'.format(
+        num_nodes, num_edges, built - start, done - built
+    ))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--nodes', type=int, nargs='+',
+                        default=[10000, 50000, 100000])
+    parser.add_argument('--width', type=int, default=100,
+                        help='The number of nodes in each layer of the DAG')
+    parser.add_argument('--max-parents', type=int, default=3)
+    parser.add_argument('--scored', action='store_true',
+                        help='Also calculate node scores')
+    args = parser.parse_args()
+    for num_nodes in args.nodes:
+        run(num_nodes, args.width, args.max_parents, args.scored)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""Benchmark subsetting a large DAG to a small selection, compared to taking
+the subgraph of the transitive closure.
+
+Run it from the repository root:
+
+    python -m test.benchmark.subset_graph --nodes 5000 --selected 50
+"""
+import argparse
+import random
+import time
+import tracemalloc
+
+import networkx as nx
+
+from dbt.linker import _subset_graph
+from test.benchmark.graph_queue import make_dag
+
+
+def _closure_subset(graph, include_nodes):
+    new_graph = nx.algorithms.transitive_closure(graph)
+    for node in graph.nodes():
+        if node not in include_nodes:
+            new_graph.remove_node(node)
+    return new_graph
+
+
+def measure(func, *args):
+    tracemalloc.start()
+    start = time.perf_counter()
+    func(*args)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--nodes', type=int, default=5000)
+    parser.add_argument('--width', type=int, default=100)
+    parser.add_argument('--selected', type=int, default=50)
+    parser.add_argument('--skip-closure', action='store_true',
+                        help='Only measure the new subsetting')
+    args = parser.parse_args()
+
+    graph = make_dag(args.nodes, args.width, 3)
+    include_nodes = set(random.Random(0).sample(
+        list(graph.nodes()), args.selected
+    ))
+
+    funcs = [('reachability', _subset_graph)]
+    if not args.skip_closure:
+        funcs.append(('transitive closure', _closure_subset))
+
+    for name, func in funcs:
+        elapsed, peak = measure(func, graph, include_nodes)
+        print('{:>20}: {:8.3f}s  peak memory {:10.1f} MiB'.format(
+            name, elapsed, peak / 2**20
+        ))
+
+
+if __name__ == '__main__':
+    main()
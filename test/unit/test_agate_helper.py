@@ -6,7 +6,9 @@ from isodate import tzinfo
 import os
 from shutil import rmtree
 from tempfile import mkdtemp
+import tracemalloc
 from dbt.clients import agate_helper
+import dbt.exceptions
 
 SAMPLE_CSV_DATA = """a,b,c,d,e,f,g
 1,n,test,3.2,20180806T11:33:29.320Z,True,NULL
@@ -63,3 +65,70 @@ class TestAgateHelper(unittest.TestCase):
         self.assertEqual(len(tbl), len(EXPECTED))
         for idx, row in enumerate(tbl):
             self.assertEqual(list(row), EXPECTED[idx])
+
+    def test_from_csv_text_columns(self):
+        path = os.path.join(self.tempdir, 'input.csv')
+        with open(path, 'wb') as fp:
+            fp.write(SAMPLE_CSV_DATA.encode('utf-8'))
+        tbl = agate_helper.from_csv(path, text_columns=['a', 'd'])
+        self.assertEqual([row['a'] for row in tbl], ['1', '2'])
+        self.assertEqual([row['d'] for row in tbl], ['3.2', '900'])
+        self.assertEqual([row['b'] for row in tbl], ['n', 'y'])
+
+    def test_streaming_from_csv_small(self):
+        path = os.path.join(self.tempdir, 'input.csv')
+        with open(path, 'wb') as fp:
+            fp.write(SAMPLE_CSV_DATA.encode('utf-8'))
+        tbl = agate_helper.streaming_from_csv(path)
+        self.assertNotIsInstance(tbl, agate_helper.StreamingTable)
+        self.assertEqual([list(row) for row in tbl], EXPECTED)
+
+    def test_streaming_from_csv(self):
+        path = os.path.join(self.tempdir, 'input.csv')
+        with open(path, 'wb') as fp:
+            fp.write(SAMPLE_CSV_BOM_DATA.encode('utf-8'))
+        # the sampled row has no value for 'g', it would be a number
+        tbl = agate_helper.streaming_from_csv(path, text_columns=['g'],
+                                              sample_size=1)
+        self.assertIsInstance(tbl, agate_helper.StreamingTable)
+        self.assertEqual(tbl.column_names, ('a', 'b', 'c', 'd', 'e', 'f', 'g'))
+        # aggregations only see the sample, the rows are the whole file
+        self.assertEqual(len(tbl), 1)
+        self.assertEqual(len(tbl.rows), len(EXPECTED))
+        self.assertEqual([list(row) for row in tbl.rows], EXPECTED)
+        # rows can be read more than once
+        self.assertEqual([row['c'] for row in tbl.rows], ['test', 'asdf'])
+
+    def test_streaming_from_csv_bad_value(self):
+        path = os.path.join(self.tempdir, 'input.csv')
+        with open(path, 'w') as fp:
+            fp.write('a,b\n1,x\n2,y\nthree,z\n')
+        tbl = agate_helper.streaming_from_csv(path, sample_size=2)
+        with self.assertRaises(dbt.exceptions.CompilationException) as exc:
+            list(tbl.rows)
+        self.assertIn('Row 4', str(exc.exception))
+
+        # a text override loads the column as written
+        tbl = agate_helper.streaming_from_csv(path, text_columns=['a'],
+                                              sample_size=2)
+        self.assertEqual([row['a'] for row in tbl.rows], ['1', '2', 'three'])
+
+    def test_streaming_from_csv_memory(self):
+        num_rows = 2000000
+        path = os.path.join(self.tempdir, 'input.csv')
+        with open(path, 'w') as fp:
+            fp.write('name\n')
+            for idx in range(num_rows):
+                fp.write('name_{}\n'.format(idx))
+
+        tracemalloc.start()
+        try:
+            tbl = agate_helper.streaming_from_csv(path)
+            count = sum(1 for _ in tbl.rows)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        self.assertEqual(count, num_rows)
+        self.assertEqual(len(tbl.rows), num_rows)
+        # the whole file as agate rows takes hundreds of megabytes
+        self.assertLess(peak, 20 * 1024 * 1024)
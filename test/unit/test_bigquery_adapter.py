@@ -3,6 +3,8 @@ from unittest.mock import patch, MagicMock
 
 import dbt.flags as flags
 
+from google.cloud.bigquery import SchemaField
+
 from dbt.adapters.bigquery import BigQueryCredentials
 from dbt.adapters.bigquery import BigQueryAdapter
 from dbt.adapters.bigquery import BigQueryRelation
@@ -197,6 +199,64 @@ class TestConnectionNamePassthrough(BaseTestBigQueryAdapter):
         )
 
 
+class TestBigQueryCatalog(BaseTestBigQueryAdapter):
+
+    def setUp(self):
+        super().setUp()
+        self.raw_profile['outputs']['oauth']['threads'] = 4
+        self.adapter = self.get_adapter('oauth')
+
+    def _relation(self, schema, identifier):
+        return self.adapter.Relation.create(
+            database='dbt-unit-000000', schema=schema, identifier=identifier,
+            type='table'
+        )
+
+    def _get_table(self, table_ref):
+        table = MagicMock(
+            num_bytes=10, num_rows=2, location='US', partitioning_type=None,
+            clustering_fields=None
+        )
+        table.schema = [
+            SchemaField('id', 'INTEGER'),
+            SchemaField('record', 'RECORD', fields=[
+                SchemaField('name', 'STRING'),
+            ]),
+        ]
+        return table
+
+    def test_get_catalog(self):
+        relations = {
+            'schema_a': [self._relation('schema_a', 'table_{}'.format(i))
+                         for i in range(5)],
+            'schema_b': [self._relation('schema_b', 'other')],
+        }
+        manifest = MagicMock()
+        manifest.get_used_schemas.return_value = [
+            ('dbt-unit-000000', 'schema_a'), ('dbt-unit-000000', 'schema_b')
+        ]
+        connection = MagicMock()
+        connection.handle.get_table.side_effect = self._get_table
+
+        with patch.object(self.adapter.connections, 'get_thread_connection',
+                          return_value=connection), \
+                patch.object(self.adapter, 'list_relations',
+                             side_effect=lambda d, s: relations[s]):
+            catalog = self.adapter.get_catalog(manifest)
+
+        self.assertEqual(connection.handle.get_table.call_count, 6)
+        # two flattened columns per table, in table order
+        self.assertEqual(len(catalog), 12)
+        self.assertEqual(
+            [(r['table_name'], r['column_name'], r['column_index'])
+             for r in catalog.rows[:2]],
+            [('table_0', 'id', 1), ('table_0', 'record.name', 2)]
+        )
+        self.assertEqual(catalog.rows[-1]['table_schema'], 'schema_b')
+        self.assertEqual(catalog.rows[-1]['stats:num_rows:value'], 2)
+        self.assertEqual(catalog.rows[-1]['stats:location:value'], 'US')
+
+
 class TestBigQueryRelation(unittest.TestCase):
     def setUp(self):
         flags.STRICT_MODE = True
@@ -4,6 +4,7 @@ from dbt.adapters.base.relation import BaseRelation
 from multiprocessing.dummy import Pool as ThreadPool
 import dbt.exceptions
 
+import json
 import random
 import time
 
@@ -255,6 +256,42 @@ class TestAdd(TestCache):
         self.assertIsNot(self.cache.relations[('dbt_2', 'foo', 'bar')].inner, None)
 
 
+class TestBulkAdd(TestCache):
+    def test_bulk_add(self):
+        self.cache.add(make_relation('dbt', 'foo', 'bar'))
+        self.cache.bulk_add([
+            make_relation('dbt', 'foo', 'bar'),
+            make_relation('dbt', 'foo', 'baz'),
+            make_relation('dbt', 'FOO2', 'bar'),
+        ])
+        self.assertEqual(len(self.cache.relations), 3)
+        self.assertEqual(self.cache.schemas, {('dbt', 'foo'), ('dbt', 'foo2')})
+        self.assert_relations_exist('dbt', 'foo', 'bar', 'baz')
+        self.assert_relations_exist('dbt', 'FOO2', 'bar')
+
+
+class TestSerialize(TestCache):
+    def test_roundtrip(self):
+        self.cache.add(make_relation('dbt', 'foo', 'bar'))
+        self.cache.add(make_relation('dbt', 'FOO', 'baz'))
+        self.cache.add_link(make_relation('dbt', 'foo', 'bar'),
+                            make_relation('dbt', 'foo', 'baz'))
+        self.cache.update_schemas([('dbt', 'empty')])
+        data = json.loads(json.dumps(self.cache.serialize()))
+
+        loaded = RelationsCache()
+        loaded.add(make_relation('dbt', 'other', 'stale'))
+        loaded.load(data, BaseRelation)
+        self.assertEqual(loaded.schemas, self.cache.schemas)
+        self.assertEqual(set(loaded.relations), set(self.cache.relations))
+        self.assertEqual(len(loaded.get_relations('dbt', 'foo')), 2)
+        self.assertNotIn(('dbt', 'other'), loaded)
+
+        # the link was loaded, so dropping bar drops baz
+        loaded.drop(make_relation('dbt', 'foo', 'bar'))
+        self.assertEqual(len(loaded.relations), 0)
+
+
 class TestLikeDbt(TestCase):
     def setUp(self):
         self.cache = RelationsCache()
@@ -386,6 +423,74 @@ class TestLikeDbt(TestCase):
             self.test_threaded()
 
 
+class TestConcurrentUpdates(TestCase):
+    def setUp(self):
+        self.cache = RelationsCache()
+        self.cache.add(make_relation('dbt', 'shared', 'base'))
+        self.schemas = ['schema_{}'.format(i) for i in range(16)]
+        self.reading = True
+
+    def _swap(self, schema):
+        # what a materialization does: build a temp table, move the old one
+        # aside, swap in the new one and drop the old one, cascading to its
+        # dependent view. Then rebuild the view.
+        for iteration in range(20):
+            self.cache.add(make_relation('dbt', schema, 'model__tmp'))
+            if iteration > 0:
+                self.cache.rename(
+                    make_relation('dbt', schema, 'model'),
+                    make_relation('dbt', schema, 'model__backup')
+                )
+            self.cache.rename(make_relation('dbt', schema, 'model__tmp'),
+                              make_relation('dbt', schema, 'model'))
+            if iteration > 0:
+                self.cache.drop(make_relation('dbt', schema, 'model__backup'))
+            self.cache.add(make_relation('dbt', schema, 'child'))
+            self.cache.add_link(make_relation('dbt', schema, 'model'),
+                                make_relation('dbt', schema, 'child'))
+            self.cache.add_link(make_relation('dbt', 'shared', 'base'),
+                                make_relation('dbt', schema, 'child'))
+        return schema
+
+    def _read(self, schema):
+        reads = 0
+        while self.reading or reads == 0:
+            for relation in self.cache.get_relations('dbt', schema):
+                self.assertEqual(relation.schema, schema)
+            reads += 1
+            time.sleep(0.001)
+        return reads
+
+    def test_concurrent_renames_and_drops(self):
+        readers = ThreadPool(4)
+        reads = readers.map_async(self._read, self.schemas[:4])
+        writers = ThreadPool(8)
+        done = writers.map(self._swap, self.schemas)
+        writers.close()
+        writers.join()
+        self.reading = False
+        readers.close()
+        readers.join()
+        self.assertEqual(sorted(done), sorted(self.schemas))
+        self.assertTrue(all(r > 0 for r in reads.get()))
+
+        for schema in self.schemas:
+            relations = self.cache.get_relations('dbt', schema)
+            self.assertEqual({r.identifier for r in relations},
+                             {'model', 'child'})
+        base = self.cache.relations[('dbt', 'shared', 'base')]
+        self.assertEqual(len(base.referenced_by), len(self.schemas))
+
+        # dropping the shared table cascades to every schema's view
+        self.cache.drop(make_relation('dbt', 'shared', 'base'))
+        for schema in self.schemas:
+            relations = self.cache.get_relations('dbt', schema)
+            self.assertEqual([r.identifier for r in relations], ['model'])
+            model = self.cache.relations[('dbt', schema, 'model')]
+            self.assertEqual(model.referenced_by, {})
+        self.assertEqual(len(self.cache.relations), len(self.schemas))
+
+
 class TestComplexCache(TestCase):
     def setUp(self):
         self.cache = RelationsCache()
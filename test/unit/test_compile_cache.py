@@ -0,0 +1,199 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+import dbt.compilation
+import dbt.flags
+import dbt.tracking
+from dbt.adapters.postgres import PostgresAdapter
+from dbt.contracts.graph.manifest import Manifest
+from dbt.contracts.graph.parsed import DependsOn, NodeConfig, ParsedModelNode
+from dbt.node_types import NodeType
+
+from .utils import config_from_parts_or_dicts, inject_adapter
+
+
+def _model(name, raw_sql, materialized='view', refs=()):
+    return ParsedModelNode(
+        alias=name,
+        name=name,
+        database='dbt',
+        schema='analytics',
+        resource_type=NodeType.Model,
+        unique_id='model.root.{}'.format(name),
+        fqn=['root', name],
+        package_name='root',
+        original_file_path='{}.sql'.format(name),
+        root_path='/usr/src/app',
+        refs=[[ref] for ref in refs],
+        sources=[],
+        depends_on=DependsOn(
+            nodes=['model.root.{}'.format(ref) for ref in refs]
+        ),
+        config=NodeConfig.from_dict({
+            'enabled': True,
+            'materialized': materialized,
+            'persist_docs': {},
+            'post-hook': [],
+            'pre-hook': [],
+            'vars': {},
+            'quoting': {},
+            'column_types': {},
+            'tags': [],
+        }),
+        tags=[],
+        path='{}.sql'.format(name),
+        raw_sql=raw_sql,
+        description='',
+        columns={}
+    )
+
+
+class _Macro:
+    def __init__(self, name, macro_sql):
+        self.name = name
+        self.macro_sql = macro_sql
+
+
+class TestVolatileMacros(unittest.TestCase):
+    def test_volatile_names(self):
+        macros = {
+            'macro.a.stable': _Macro('stable', '{{ adapter.quote("x") }}'),
+            'macro.a.query': _Macro('query', '{{ adapter.execute("x") }}'),
+            'macro.a.calls_query': _Macro('calls_query', '{{ query() }}'),
+            'macro.a.now': _Macro('now', '{{ run_started_at }}'),
+            'macro.a.dispatch': _Macro(
+                'dispatch', '{{ adapter_macro("a.lookup") }}'
+            ),
+            'macro.a.default__lookup': _Macro(
+                'default__lookup', '{{ calls_query() }}'
+            ),
+        }
+        volatile = dbt.compilation._VolatileMacros(macros, 0)
+        self.assertEqual(
+            volatile.names,
+            {'query', 'calls_query', 'now', 'dispatch', 'lookup',
+             'default__lookup'}
+        )
+
+
+class TestCompileCache(unittest.TestCase):
+    def setUp(self):
+        dbt.flags.STRICT_MODE = True
+        self.active_user = dbt.tracking.active_user
+        dbt.tracking.do_not_track()
+        self.tempdir = tempfile.mkdtemp()
+        project_cfg = {
+            'name': 'root',
+            'version': '0.1',
+            'profile': 'test',
+            'project-root': self.tempdir,
+        }
+        profile_cfg = {
+            'outputs': {
+                'test': {
+                    'type': 'postgres',
+                    'dbname': 'postgres',
+                    'user': 'root',
+                    'host': 'thishostshouldnotexist',
+                    'pass': 'password',
+                    'port': 5432,
+                    'schema': 'public'
+                }
+            },
+            'target': 'test'
+        }
+        self.config = config_from_parts_or_dicts(project_cfg, profile_cfg)
+        self.config.target_path = os.path.join(self.tempdir, 'target')
+        self.adapter = PostgresAdapter(self.config)
+        inject_adapter(self.adapter)
+
+    def tearDown(self):
+        dbt.tracking.active_user = self.active_user
+        shutil.rmtree(self.tempdir)
+
+    def _manifest(self, *nodes):
+        return Manifest(
+            nodes={n.unique_id: n for n in nodes}, macros={}, docs={},
+            generated_at=None, disabled=[], files={}
+        )
+
+    def _compile_all(self, manifest):
+        cache = dbt.compilation.CompileCache.load(self.config)
+        results = {}
+        for unique_id in sorted(manifest.nodes):
+            node = manifest.nodes[unique_id]
+            compiled = dbt.compilation.compile_node(
+                self.adapter, self.config, node, manifest, {}, cache=cache
+            )
+            manifest.update_node(compiled)
+            results[node.name] = compiled
+        cache.write(manifest)
+        return results
+
+    def _nodes(self, view_sql='select * from {{ ref("ephemeral") }}'):
+        return (
+            _model('ephemeral', 'select 1 as id', materialized='ephemeral'),
+            _model('view', view_sql, refs=['ephemeral']),
+        )
+
+    def test_reuse(self):
+        first = self._compile_all(self._manifest(*self._nodes()))
+        self.assertTrue(os.path.exists(
+            dbt.compilation.CompileCache.path(self.config)
+        ))
+
+        with mock.patch.object(dbt.compilation.Compiler, 'render_node') as r:
+            second = self._compile_all(self._manifest(*self._nodes()))
+        r.assert_not_called()
+        self.assertEqual(second['view'].compiled_sql,
+                         first['view'].compiled_sql)
+        self.assertEqual(second['view'].injected_sql,
+                         first['view'].injected_sql)
+        self.assertIn('__dbt__CTE__ephemeral', second['view'].injected_sql)
+
+    def test_changed_node(self):
+        self._compile_all(self._manifest(*self._nodes()))
+        second = self._compile_all(self._manifest(*self._nodes(
+            view_sql='select id from {{ ref("ephemeral") }}'
+        )))
+        self.assertTrue(
+            second['view'].compiled_sql.startswith('select id from')
+        )
+
+    def test_changed_dependency(self):
+        self._compile_all(self._manifest(*self._nodes()))
+        ephemeral, view = self._nodes()
+        ephemeral.config.materialized = 'table'
+        second = self._compile_all(self._manifest(ephemeral, view))
+        self.assertEqual(second['view'].compiled_sql,
+                         'select * from "dbt"."analytics"."ephemeral"')
+
+    def test_changed_vars(self):
+        self._compile_all(self._manifest(*self._nodes()))
+        self.config.cli_vars = {'x': 1}
+        cache = dbt.compilation.CompileCache.load(self.config)
+        _, view = self._nodes()
+        self.assertIsNone(cache.lookup(view, self._manifest(*self._nodes())))
+
+    def test_volatile_nodes_not_cached(self):
+        manifest = self._manifest(
+            _model('env', 'select {{ env_var("HOME") }}'),
+            _model('introspective', '{% do adapter.get_relation("a", "b", '
+                   '"c") %}select 1'),
+        )
+        cache = dbt.compilation.CompileCache(self.config)
+        for node in manifest.nodes.values():
+            self.assertIsNone(cache.fingerprint(node, manifest))
+
+    def test_added_macros_rescanned(self):
+        node = _model('calls', 'select {{ lookup() }}')
+        manifest = self._manifest(node)
+        cache = dbt.compilation.CompileCache(self.config)
+        self.assertIsNotNone(cache.fingerprint(node, manifest))
+
+        lookup = _Macro('lookup', '{{ adapter.execute("x") }}')
+        manifest.add_macros({'macro.root.lookup': lookup})
+        self.assertIsNone(cache.fingerprint(node, manifest))
@@ -0,0 +1,137 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+import dbt.compilation
+import dbt.flags
+import dbt.tracking
+import dbt.writer
+from dbt.adapters.postgres import PostgresAdapter
+from dbt.contracts.graph.manifest import Manifest
+from dbt.contracts.graph.parsed import DependsOn, NodeConfig, ParsedModelNode
+from dbt.node_types import NodeType
+
+from .utils import config_from_parts_or_dicts, inject_adapter
+
+
+def _model(name, raw_sql, materialized='view', refs=()):
+    return ParsedModelNode(
+        alias=name,
+        name=name,
+        database='dbt',
+        schema='analytics',
+        resource_type=NodeType.Model,
+        unique_id='model.root.{}'.format(name),
+        fqn=['root', name],
+        package_name='root',
+        original_file_path='{}.sql'.format(name),
+        root_path='/usr/src/app',
+        refs=[[ref] for ref in refs],
+        sources=[],
+        depends_on=DependsOn(
+            nodes=['model.root.{}'.format(ref) for ref in refs]
+        ),
+        config=NodeConfig.from_dict({
+            'enabled': True,
+            'materialized': materialized,
+            'persist_docs': {},
+            'post-hook': [],
+            'pre-hook': [],
+            'vars': {},
+            'quoting': {},
+            'column_types': {},
+            'tags': [],
+        }),
+        tags=[],
+        path='{}.sql'.format(name),
+        raw_sql=raw_sql,
+        description='',
+        columns={}
+    )
+
+
+@unittest.skipUnless(hasattr(os, 'fork'), 'the compile pool forks')
+class TestCompilePool(unittest.TestCase):
+    def setUp(self):
+        dbt.flags.STRICT_MODE = True
+        self.active_user = dbt.tracking.active_user
+        dbt.tracking.do_not_track()
+        self.tempdir = tempfile.mkdtemp()
+        project_cfg = {
+            'name': 'root',
+            'version': '0.1',
+            'profile': 'test',
+            'project-root': self.tempdir,
+        }
+        profile_cfg = {
+            'outputs': {
+                'test': {
+                    'type': 'postgres',
+                    'dbname': 'postgres',
+                    'user': 'root',
+                    'host': 'thishostshouldnotexist',
+                    'pass': 'password',
+                    'port': 5432,
+                    'schema': 'public'
+                }
+            },
+            'target': 'test'
+        }
+        self.config = config_from_parts_or_dicts(project_cfg, profile_cfg)
+        self.config.target_path = os.path.join(self.tempdir, 'target')
+        self.adapter = PostgresAdapter(self.config)
+        inject_adapter(self.adapter)
+
+        nodes = [
+            _model('ephemeral', 'select 1 as id', materialized='ephemeral'),
+            _model('view', 'select * from {{ ref("ephemeral") }}',
+                   refs=['ephemeral']),
+            _model('plain', 'select {{ 1 + 1 }} as id'),
+            _model('introspective', '{% do adapter.execute("select 1") %}'),
+        ]
+        self.manifest = Manifest(
+            nodes={n.unique_id: n for n in nodes}, macros={}, docs={},
+            generated_at=None, disabled=[], files={}
+        )
+        self.manifest.build_flat_graph()
+        self.pool = dbt.compilation.CompilePool.start(
+            self.config, self.manifest, 2
+        )
+
+    def tearDown(self):
+        self.pool.terminate()
+        dbt.tracking.active_user = self.active_user
+        shutil.rmtree(self.tempdir)
+
+    def _compile(self, name):
+        node = self.manifest.nodes['model.root.{}'.format(name)]
+        compiled = self.pool.compile_node(self.adapter, self.config, node,
+                                          self.manifest)
+        self.manifest.update_node(compiled)
+        return compiled
+
+    def test_compile_with_ephemeral(self):
+        self._compile('ephemeral')
+        view = self._compile('view')
+        self.assertTrue(view.compiled)
+        self.assertIn('__dbt__CTE__ephemeral as (\nselect 1 as id\n)',
+                      view.injected_sql)
+        dbt.writer.flush()
+        self.assertTrue(os.path.exists(view.build_path))
+
+    def test_rendered_in_worker(self):
+        with mock.patch.object(dbt.compilation, 'compile_node') as fallback:
+            plain = self._compile('plain')
+        fallback.assert_not_called()
+        self.assertEqual(plain.injected_sql, 'select 2 as id')
+
+    def test_introspective_node_falls_back(self):
+        with mock.patch.object(dbt.compilation, 'compile_node') as fallback:
+            node = self.manifest.nodes['model.root.introspective']
+            result = self.pool.compile_node(self.adapter, self.config, node,
+                                            self.manifest)
+        fallback.assert_called_once_with(self.adapter, self.config, node,
+                                         self.manifest, {}, cache=None)
+        self.assertIs(result, fallback.return_value)
@@ -13,6 +13,7 @@ import dbt.config
 import dbt.exceptions
 from dbt.adapters.postgres import PostgresCredentials
 from dbt.adapters.redshift import RedshiftCredentials
+from dbt.clients.jinja import bytecode_cache
 from dbt.contracts.project import PackageConfig, LocalPackage, GitPackage
 from dbt.semver import VersionSpecifier
 from dbt.task.run_operation import RunOperationTask
@@ -916,6 +917,8 @@ class TestRunOperationTask(BaseFileTest):
         # These tests will change the directory to the project path,
         # so it's necessary to change it back at the end.
         os.chdir(INITIAL_ROOT)
+        # the task enables the jinja cache in the temporary project
+        bytecode_cache.set_directory(None)
 
     def test_run_operation_task(self):
         self.assertEqual(os.getcwd(), INITIAL_ROOT)
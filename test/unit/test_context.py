@@ -1,9 +1,17 @@
+import os
 import unittest
 from unittest import mock
 
-from dbt.contracts.graph.parsed import ParsedModelNode, NodeConfig, DependsOn
-from dbt.context import parser, runtime
+from dbt.contracts.graph.manifest import Manifest
+from dbt.contracts.graph.parsed import (
+    ParsedModelNode, NodeConfig, DependsOn, ParsedMacro
+)
+from dbt.context import common, parser, runtime
+from dbt.context.dependencies import (
+    ParseDependencies, TargetDict, record_dependencies
+)
 from dbt.node_types import NodeType
+import dbt.clients.jinja
 import dbt.exceptions
 from .mock_adapter import adapter_factory
 
@@ -78,6 +86,53 @@ class TestVar(unittest.TestCase):
         self.assertEqual(var('foo', 'bar'), 'bar')
         self.assertEqual(var('foo'), None)
 
+    def test_parser_var_records_dependencies(self):
+        var = parser.Var(self.model, self.context, overrides={'foo': 'baz'})
+        with record_dependencies() as dependencies:
+            var('foo')
+            var('missing', 'bar')
+        self.assertEqual(set(dependencies.vars), {'foo', 'missing'})
+        self.assertEqual(dependencies.changed({'foo': 'baz'}, {}), [])
+        self.assertEqual(
+            dependencies.changed({'foo': 'qux', 'missing': None}, {}),
+            ['var "foo"', 'var "missing"']
+        )
+
+
+class TestParseDependencies(unittest.TestCase):
+    def test_env_var(self):
+        with mock.patch.dict(os.environ, {'DBT_TEST_ENV_VAR': 'a'}):
+            with record_dependencies() as dependencies:
+                self.assertEqual(common.env_var('DBT_TEST_ENV_VAR'), 'a')
+            self.assertEqual(dependencies.changed({}, {}), [])
+        self.assertEqual(dependencies.changed({}, {}),
+                         ['env_var "DBT_TEST_ENV_VAR"'])
+
+    def test_target(self):
+        target = TargetDict(name='dev', schema='analytics', threads=1)
+        with record_dependencies() as dependencies:
+            target['name']
+            target.get('schema')
+        self.assertEqual(set(dependencies.target), {'name', 'schema'})
+        self.assertEqual(
+            dependencies.changed({}, {'name': 'dev', 'schema': 'analytics'}),
+            []
+        )
+        self.assertEqual(
+            dependencies.changed({}, {'name': 'prod', 'schema': 'analytics',
+                                      'threads': 4}),
+            ['target "name"']
+        )
+
+    def test_not_recording(self):
+        # outside of parsing, nothing is recorded
+        target = TargetDict(name='dev')
+        with record_dependencies() as dependencies:
+            pass
+        target['name']
+        common.env_var('HOME')
+        self.assertEqual(dependencies, ParseDependencies())
+
 
 class TestParseWrapper(unittest.TestCase):
     def setUp(self):
@@ -124,3 +179,232 @@ class TestRuntimeWrapper(unittest.TestCase):
         self.responder.list_relations_without_caching.assert_called_once_with(
             mock.ANY, 'schema'
         )
+
+
+def _macro(package_name, name, body):
+    return ParsedMacro(
+        name=name,
+        resource_type=NodeType.Macro,
+        unique_id='macro.{}.{}'.format(package_name, name),
+        package_name=package_name,
+        original_file_path='macros/{}.sql'.format(name),
+        root_path='/usr/src/{}'.format(package_name),
+        path='macros/{}.sql'.format(name),
+        raw_sql='{{% macro {}() %}}{}{{% endmacro %}}'.format(name, body),
+    )
+
+
+class TestMacroNamespaces(unittest.TestCase):
+    def setUp(self):
+        dbt.clients.jinja.template_cache.clear()
+        macros = [
+            _macro('dbt', 'foo', 'global foo'),
+            _macro('dbt', 'bar', 'global bar'),
+            _macro('root', 'foo', 'local foo'),
+            _macro('root', 'outer', 'outer {{ foo() }} {{ bar() }}'),
+            _macro('other', 'baz', 'other baz {{ foo() }}'),
+        ]
+        self.manifest = Manifest.from_macros(
+            macros={m.unique_id: m for m in macros}
+        )
+        self.model = mock.MagicMock(package_name='root')
+
+    def tearDown(self):
+        dbt.clients.jinja.template_cache.clear()
+
+    def _context(self, model=None):
+        context = {'existing': 1}
+        context = common._add_macros(context, model or self.model,
+                                     self.manifest)
+        context['context'] = context
+        return context
+
+    def _render(self, string, context):
+        return dbt.clients.jinja.get_rendered(string, context)
+
+    def test_lookups(self):
+        context = self._context()
+        self.assertEqual(self._render('{{ foo() }}', context), 'local foo')
+        self.assertEqual(self._render('{{ dbt.foo() }}', context),
+                         'global foo')
+        self.assertEqual(self._render('{{ root.foo() }}', context),
+                         'local foo')
+        self.assertEqual(self._render('{{ outer() }}', context),
+                         'outer local foo global bar')
+        # macros from other packages are only available with a prefix
+        self.assertEqual(self._render('{{ other.baz() }}', context),
+                         'other baz local foo')
+        self.assertNotIn('baz', context)
+        self.assertEqual(
+            self._render("{{ context.get('bar') is not none }}", context),
+            'True'
+        )
+        self.assertEqual(
+            self._render("{{ context['dbt']['bar']() }}", context),
+            'global bar'
+        )
+
+    def test_global_package_model(self):
+        model = mock.MagicMock(package_name='other')
+        context = self._context(model)
+        self.assertEqual(self._render('{{ foo() }}', context), 'global foo')
+        self.assertEqual(self._render('{{ baz() }}', context),
+                         'other baz global foo')
+
+    def test_namespaces_bind_lazily(self):
+        with mock.patch.object(ParsedMacro, 'generator',
+                               new_callable=mock.PropertyMock) as generator:
+            context = self._context()
+            self.assertEqual(generator.call_count, 0)
+            context['dbt']['foo']
+            context['dbt']['foo']
+            self.assertEqual(generator.call_count, 1)
+        self.assertEqual(set(context['dbt']), {'foo', 'bar'})
+
+    def test_macro_maps_reused(self):
+        first = self._context()
+        second = self._context()
+        self.assertIs(first['foo'], second['foo'])
+        self.assertIsNot(first['dbt'], second['dbt'])
+
+        replaced = _macro('root', 'foo', 'replaced foo')
+        self.manifest.macros[replaced.unique_id] = replaced
+        dbt.clients.jinja.template_cache.clear()
+        self.assertEqual(self._render('{{ foo() }}', self._context()),
+                         'replaced foo')
+
+    def test_macro_maps_rebuilt(self):
+        self._context()
+        added = _macro('root', 'added', 'added macro')
+        self.manifest.add_macros({added.unique_id: added})
+        self.assertEqual(self._render('{{ added() }}', self._context()),
+                         'added macro')
+
+        # a same-length set of macros, in place of the mapped one
+        macros = dict(self.manifest.macros)
+        del macros['macro.other.baz']
+        other = _macro('other', 'qux', 'other qux')
+        macros[other.unique_id] = other
+        self.manifest.macros = macros
+        context = self._context()
+        self.assertEqual(self._render('{{ other.qux() }}', context),
+                         'other qux')
+        self.assertNotIn('baz', context['other'])
+
+
+class TestBaseContext(unittest.TestCase):
+    def setUp(self):
+        common._BASE_CONTEXTS.clear()
+        self.config = self._config()
+        self.adapter = mock.MagicMock()
+        self.adapter.date_function.return_value = 'now()'
+        patcher = mock.patch.object(common, 'get_adapter',
+                                    return_value=self.adapter)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.manifest = mock.MagicMock(macros={}, flat_graph={})
+
+    def tearDown(self):
+        common._BASE_CONTEXTS.clear()
+
+    def _config(self):
+        config = mock.MagicMock(cli_vars={}, target_name='dev')
+        config.to_profile_info.side_effect = lambda: {'credentials': None}
+        config.credentials.to_dict.side_effect = lambda **kw: {
+            'schema': 'analytics', 'password': 'secret',
+        }
+        config.credentials.type = 'postgres'
+        return config
+
+    def _model(self, name):
+        return ParsedModelNode(
+            alias=name,
+            name=name,
+            database='dbt',
+            schema='analytics',
+            resource_type=NodeType.Model,
+            unique_id='model.root.{}'.format(name),
+            fqn=['root', name],
+            package_name='root',
+            original_file_path='{}.sql'.format(name),
+            root_path='/usr/src/app',
+            refs=[],
+            sources=[],
+            depends_on=DependsOn(),
+            config=NodeConfig.from_dict({
+                'enabled': True,
+                'materialized': 'view',
+                'persist_docs': {},
+                'post-hook': [],
+                'pre-hook': [],
+                'vars': {},
+                'quoting': {},
+                'column_types': {},
+                'tags': [],
+            }),
+            tags=[],
+            path='{}.sql'.format(name),
+            raw_sql='',
+            description='',
+            columns={}
+        )
+
+    def test_shared_base(self):
+        with mock.patch.object(common, 'generate_target_context',
+                               wraps=common.generate_target_context) as gen:
+            first = runtime.generate(self._model('one'), self.config,
+                                     self.manifest)
+            second = runtime.generate(self._model('two'), self.config,
+                                      self.manifest)
+        self.assertEqual(gen.call_count, 1)
+
+        self.assertEqual(first['target'], second['target'])
+        self.assertEqual(first['target']['schema'], 'analytics')
+        self.assertNotIn('password', first['target'])
+        self.assertIs(first['context'], first)
+        self.assertIs(second['context'], second)
+        self.assertEqual(first['model']['name'], 'one')
+        self.assertEqual(second['model']['name'], 'two')
+        self.assertIn('validation', first)
+        self.assertIn('invocation_id', first)
+
+        # per-node members are not shared
+        self.assertIsNot(first['_sql_results'], second['_sql_results'])
+        first['store_result']('main', 'OK')
+        self.assertIsNone(second['load_result']('main'))
+        first['schema'] = 'changed'
+        self.assertEqual(second['schema'], 'analytics')
+
+        # nor are the nested members that a template could change
+        self.assertIs(first['env'], first['target'])
+        first['target'].update({'schema': 'changed'})
+        self.assertEqual(second['target']['schema'], 'analytics')
+        first['api']['Relation'] = None
+        self.assertIsNotNone(second['api']['Relation'])
+        first['modules']['datetime']['date'] = None
+        self.assertIsNotNone(second['modules']['datetime']['date'])
+        third = runtime.generate(self._model('three'), self.config,
+                                 self.manifest)
+        self.assertEqual(third['target']['schema'], 'analytics')
+
+    def test_rebuilt_for_new_config(self):
+        first = runtime.generate(self._model('one'), self.config,
+                                 self.manifest)
+        config = self._config()
+        config.credentials.to_dict.side_effect = lambda **kw: {
+            'schema': 'other',
+        }
+        second = runtime.generate(self._model('one'), config, self.manifest)
+        self.assertEqual(first['target']['schema'], 'analytics')
+        self.assertEqual(second['target']['schema'], 'other')
+
+    def test_per_provider(self):
+        first = runtime.generate(self._model('one'), self.config,
+                                 self.manifest)
+        with mock.patch.object(parser, 'get_adapter',
+                               return_value=self.adapter):
+            second = parser.generate(self._model('one'), self.config,
+                                     self.manifest, mock.MagicMock())
+        self.assertIsInstance(first['adapter'], runtime.DatabaseWrapper)
+        self.assertIsInstance(second['adapter'], parser.DatabaseWrapper)
+        self.assertFalse(second['execute'])
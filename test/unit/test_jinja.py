@@ -1,5 +1,12 @@
+import os
+import shutil
+import tempfile
+import time
 import unittest
+from unittest import mock
 
+import dbt.clients.jinja
+from dbt.clients.jinja import BytecodeCache
 from dbt.clients.jinja import get_template
 from dbt.clients.jinja import extract_toplevel_blocks
 from dbt.exceptions import CompilationException
@@ -14,6 +21,127 @@ class TestJinja(unittest.TestCase):
         self.assertEqual(mod.my_dict, {'a': 1})
 
 
+class TestBytecodeCache(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+        self.cache = BytecodeCache()
+        self.cache.set_directory(self.tempdir)
+        self.patcher = mock.patch.object(
+            dbt.clients.jinja, 'bytecode_cache', self.cache
+        )
+        self.patcher.start()
+
+    def tearDown(self):
+        self.patcher.stop()
+        shutil.rmtree(self.tempdir)
+
+    def test_render_uses_cache(self):
+        template = get_template('{{ 1 + x }}', {'x': 1})
+        self.assertEqual(len(self.cache._code), 1)
+        self.assertEqual(template.render(x=2), '3')
+
+        with mock.patch.object(
+            dbt.clients.jinja.MacroFuzzEnvironment, '_compile'
+        ) as compile_mock:
+            template = get_template('{{ 1 + x }}', {'x': 1})
+            self.assertEqual(template.render(x=3), '4')
+        compile_mock.assert_not_called()
+
+    def test_disk_cache(self):
+        get_template('{{ 1 + x }}', {'x': 1})
+
+        # a new cache, like a new invocation, loads the code from disk
+        new_cache = BytecodeCache()
+        new_cache.set_directory(self.tempdir)
+        with mock.patch.object(dbt.clients.jinja, 'bytecode_cache', new_cache):
+            with mock.patch.object(
+                dbt.clients.jinja.MacroFuzzEnvironment, '_compile'
+            ) as compile_mock:
+                template = get_template('{{ 1 + x }}', {'x': 1})
+                self.assertEqual(template.render(x=3), '4')
+        compile_mock.assert_not_called()
+
+    def test_key_changes_with_source(self):
+        self.assertNotEqual(
+            self.cache.key('{{ a }}', None, False),
+            self.cache.key('{{ b }}', None, False),
+        )
+        self.assertNotEqual(
+            self.cache.key('{{ a }}', None, False),
+            self.cache.key('{{ a }}', None, True),
+        )
+
+    def test_corrupt_file_recompiles(self):
+        key = self.cache.key('{{ a }}', None, False)
+        path = self.cache._path(key)
+        os.makedirs(os.path.dirname(path))
+        with open(path, 'wb') as fp:
+            fp.write(b'not marshal data')
+        self.assertIsNone(self.cache.get(key))
+        template = get_template('{{ a }}', {'a': 'x'})
+        self.assertEqual(template.render(a='y'), 'y')
+
+    def test_no_directory(self):
+        cache = BytecodeCache()
+        code = compile('1', '<string>', 'exec')
+        key = cache.key('1', None, False)
+        cache.set(key, code)
+        self.assertIs(cache.get(key), code)
+        self.assertEqual(os.listdir(self.tempdir), ['.pruned'])
+
+    def test_memory_bounded(self):
+        cache = BytecodeCache(size=2)
+        codes = {}
+        for source in ('1', '2', '3'):
+            codes[source] = compile(source, '<string>', 'exec')
+            cache.set(cache.key(source, None, False), codes[source])
+        self.assertEqual(len(cache._code), 2)
+        self.assertIsNone(cache.get(cache.key('1', None, False)))
+        self.assertIs(cache.get(cache.key('3', None, False)), codes['3'])
+
+    def test_prune(self):
+        get_template('{{ a }}', {'a': 'x'})
+        get_template('{{ b }}', {'b': 'x'})
+        old = self.cache._path(self.cache.key('{{ a }}', None, False))
+        kept = self.cache._path(self.cache.key('{{ b }}', None, False))
+        long_ago = time.time() - dbt.clients.jinja.BYTECODE_CACHE_MAX_AGE - 1
+        os.utime(old, (long_ago, long_ago))
+
+        self.cache.prune()
+        self.assertFalse(os.path.exists(old))
+        self.assertTrue(os.path.exists(kept))
+
+    def test_prune_on_set_directory(self):
+        get_template('{{ a }}', {'a': 'x'})
+        path = self.cache._path(self.cache.key('{{ a }}', None, False))
+        long_ago = time.time() - dbt.clients.jinja.BYTECODE_CACHE_MAX_AGE - 1
+        os.utime(path, (long_ago, long_ago))
+
+        # the directory was pruned in setUp, so the next prune is not due
+        # until the interval passes
+        BytecodeCache().set_directory(self.tempdir)
+        self.assertTrue(os.path.exists(path))
+        marker = os.path.join(self.tempdir, '.pruned')
+        os.utime(marker, (long_ago, long_ago))
+        BytecodeCache().set_directory(self.tempdir)
+        self.assertFalse(os.path.exists(path))
+        with mock.patch.object(BytecodeCache, 'prune') as prune:
+            BytecodeCache().set_directory(self.tempdir)
+        prune.assert_not_called()
+
+    def test_use_refreshes_mtime(self):
+        get_template('{{ a }}', {'a': 'x'})
+        key = self.cache.key('{{ a }}', None, False)
+        path = self.cache._path(key)
+        long_ago = time.time() - dbt.clients.jinja.BYTECODE_CACHE_MAX_AGE - 1
+        os.utime(path, (long_ago, long_ago))
+
+        cache = BytecodeCache()
+        cache.directory = self.tempdir
+        self.assertIsNotNone(cache.get(key))
+        self.assertGreater(os.stat(path).st_mtime, long_ago + 1)
+
+
 class TestBlockLexer(unittest.TestCase):
     def test_basic(self):
         body = '{{ config(foo="bar") }}\r\nselect * from this.that\r\n'
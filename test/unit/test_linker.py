@@ -1,8 +1,11 @@
 import os
+import random
 import tempfile
 import unittest
 from unittest import mock
 
+import networkx as nx
+
 from dbt import linker
 try:
     from queue import Empty
@@ -130,6 +133,71 @@ class LinkerTest(unittest.TestCase):
         self.assert_would_join(queue)
         self.assertTrue(queue.empty())
 
+    def test_linker_waits_for_all_dependencies(self):
+        # D depends on B and C, which both depend on A
+        actual_deps = [('B', 'A'), ('C', 'A'), ('D', 'B'), ('D', 'C')]
+
+        for (l, r) in actual_deps:
+            self.linker.dependency(l, r)
+
+        queue = self.linker.as_graph_queue(_mock_manifest('ABCD'))
+        got = queue.get(block=False)
+        self.assertEqual(got.unique_id, 'A')
+        queue.mark_done('A')
+
+        second = queue.get(block=False)
+        third = queue.get(block=False)
+        self.assertEqual({second.unique_id, third.unique_id}, {'B', 'C'})
+        queue.mark_done(second.unique_id)
+        with self.assertRaises(Empty):
+            queue.get(block=False)
+        queue.mark_done(third.unique_id)
+
+        got = queue.get(block=False)
+        self.assertEqual(got.unique_id, 'D')
+        self.assertTrue(queue.empty())
+        queue.mark_done('D')
+        self.assert_would_join(queue)
+
+    def test_linker_scores(self):
+        # B and D depend on A, C depends on B, E depends on C and D
+        actual_deps = [('B', 'A'), ('C', 'B'), ('D', 'A'), ('E', 'C'),
+                       ('E', 'D')]
+        for (l, r) in actual_deps:
+            self.linker.dependency(l, r)
+        # C does not count towards scores
+        self.is_blocking_dependency.side_effect = lambda n: n.unique_id != 'C'
+
+        queue = self.linker.as_graph_queue(_mock_manifest('ABCDE'))
+        self.assertEqual(
+            queue._scores,
+            {'A': -3, 'B': -1, 'C': -1, 'D': -1, 'E': 0}
+        )
+
+    def test_linker_critical_path(self):
+        # B depends on A, D and E depend on C
+        actual_deps = [('B', 'A'), ('D', 'C'), ('E', 'C')]
+        for (l, r) in actual_deps:
+            self.linker.dependency(l, r)
+        manifest = _mock_manifest('ABCDE')
+
+        # C has the most descendants
+        queue = self.linker.as_graph_queue(manifest)
+        self.assertEqual(queue.get(block=False).unique_id, 'C')
+
+        # but B takes the longest
+        times = {'A': 1.0, 'B': 100.0, 'C': 1.0, 'D': 2.0, 'E': 3.0}
+        queue = self.linker.as_graph_queue(manifest, execution_times=times)
+        self.assertEqual(queue._scores['A'], (-101.0, -1))
+        self.assertEqual(queue._scores['C'], (-4.0, -2))
+        self.assertEqual(queue.get(block=False).unique_id, 'A')
+        self.assertEqual(queue.get(block=False).unique_id, 'C')
+
+        # nodes without a time get the mean of the others
+        times = {'A': 1.0, 'B': 3.0}
+        queue = self.linker.as_graph_queue(manifest, execution_times=times)
+        self.assertEqual(queue._scores['C'], (-4.0, -2))
+
     def test_linker_dependencies_limited_to_some_nodes(self):
         actual_deps = [('A', 'B'), ('B', 'C'), ('C', 'D')]
 
@@ -185,3 +253,58 @@ class LinkerTest(unittest.TestCase):
             self.linker.dependency(l, r)
 
         self.assertIsNone(self.linker.find_cycles())
+
+
+def _closure_subset(graph, include_nodes):
+    """The old way of subsetting graphs: take the subgraph of the transitive
+    closure.
+    """
+    return nx.transitive_closure(graph).subgraph(include_nodes)
+
+
+class SubsetGraphTest(unittest.TestCase):
+    def assert_same_ordering(self, graph, include_nodes):
+        new_graph = linker._subset_graph(graph, include_nodes)
+        self.assertEqual(set(new_graph.nodes()), set(include_nodes))
+        expected = _closure_subset(graph, include_nodes)
+        self.assertEqual(
+            set(nx.transitive_closure(new_graph).edges()),
+            set(expected.edges())
+        )
+
+    def test_chain(self):
+        graph = nx.DiGraph([('A', 'B'), ('B', 'C'), ('C', 'D')])
+        new_graph = linker._subset_graph(graph, ['A', 'D'])
+        self.assertEqual(set(new_graph.edges()), {('A', 'D')})
+        new_graph = linker._subset_graph(graph, ['A', 'C', 'D'])
+        self.assertEqual(set(new_graph.edges()), {('A', 'C'), ('C', 'D')})
+
+    def test_diamond(self):
+        graph = nx.DiGraph([('A', 'B'), ('A', 'C'), ('B', 'D'), ('C', 'D')])
+        new_graph = linker._subset_graph(graph, ['A', 'D'])
+        self.assertEqual(set(new_graph.edges()), {('A', 'D')})
+
+    def test_keeps_node_data(self):
+        graph = nx.DiGraph([('A', 'B'), ('B', 'C')])
+        graph.nodes['A']['name'] = 'a'
+        new_graph = linker._subset_graph(graph, ['A', 'C'])
+        self.assertEqual(new_graph.nodes['A'], {'name': 'a'})
+
+    def test_missing_node(self):
+        graph = nx.DiGraph([('A', 'B')])
+        with self.assertRaises(RuntimeError):
+            linker._subset_graph(graph, ['A', 'Z'])
+
+    def test_random_graphs(self):
+        rng = random.Random(0)
+        for _ in range(20):
+            graph = nx.gnp_random_graph(40, 0.08, seed=rng.randint(0, 1000),
+                                        directed=True)
+            # keep edges going forward so the graph is a DAG
+            graph = nx.DiGraph(
+                (u, v) for u, v in graph.edges() if u < v
+            )
+            graph.add_nodes_from(range(40))
+            for fraction in (0.1, 0.5, 1.0):
+                include_nodes = rng.sample(range(40), int(40 * fraction))
+                self.assert_same_ordering(graph, include_nodes)
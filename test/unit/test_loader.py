@@ -1,10 +1,18 @@
+import os
+import shutil
+import tempfile
 import unittest
 from unittest import mock
 
 from .utils import config_from_parts_or_dicts, normalize
 
+import dbt.flags
 from dbt import loader
-from dbt.contracts.graph.manifest import FileHash, FilePath, SourceFile
+from dbt.context.dependencies import ParseDependencies, fingerprint
+from dbt.contracts.graph.manifest import (
+    FileHash, FilePath, SourceFile, Manifest
+)
+from dbt.exceptions import CompilationException
 from dbt.parser import ParseResult
 from dbt.parser.search import FileBlock
 
@@ -65,7 +73,7 @@ class TestLoader(unittest.TestCase):
         )
 
     def _new_results(self):
-        return ParseResult(MatchingHash(), MatchingHash(), {})
+        return ParseResult(MatchingHash(), {})
 
     def _mismatched_file(self, searched, name):
         return self._new_file(searched, name, False)
@@ -142,3 +150,145 @@ class TestLoader(unittest.TestCase):
         # the filename wasn't in the cache, so parse_file should get called
         # with a  FileBlock that has the given source file in it.
         self.parser.parse_file.assert_called_once_with(FileBlock(file=source_file))
+
+    def test_model_cache_dependency_changed(self):
+        source_file = self._matching_file('models', 'model_1.sql')
+        self.parser.load_file.return_value = source_file
+
+        source_file_dupe = self._matching_file('models', 'model_1.sql')
+        source_file_dupe.nodes.append('model.root.model_1')
+
+        old_results = self._new_results()
+        old_results.files[source_file_dupe.path.search_key] = source_file_dupe
+        old_results.nodes = {'model.root.model_1': mock.MagicMock()}
+        search_key = source_file_dupe.path.search_key
+        old_results.dependencies[search_key] = ParseDependencies(
+            vars={'test_schema_name': fingerprint([True, 'bar'])}
+        )
+
+        self.loader.parse_with_cache(source_file.path, self.parser,
+                                     old_results)
+        # the var the file used changed, so parse_file should get called
+        self.parser.parse_file.assert_called_once_with(
+            FileBlock(file=source_file)
+        )
+
+    def test_model_cache_dependency_unchanged(self):
+        source_file = self._matching_file('models', 'model_1.sql')
+        self.parser.load_file.return_value = source_file
+
+        source_file_dupe = self._matching_file('models', 'model_1.sql')
+        source_file_dupe.nodes.append('model.root.model_1')
+
+        old_results = self._new_results()
+        old_results.files[source_file_dupe.path.search_key] = source_file_dupe
+        old_results.nodes = {'model.root.model_1': mock.MagicMock()}
+        search_key = source_file_dupe.path.search_key
+        old_results.dependencies[search_key] = ParseDependencies(
+            vars={'test_schema_name': fingerprint([True, 'foo'])},
+            target={'schema': fingerprint('analytics')},
+        )
+
+        self.loader.parse_with_cache(source_file.path, self.parser,
+                                     old_results)
+        # the file's dependencies match, so parse_file should never be called
+        self.parser.parse_file.assert_not_called()
+
+
+class TestParallelParse(unittest.TestCase):
+    def setUp(self):
+        self.project_dir = tempfile.mkdtemp()
+        project_path = os.path.join(self.project_dir, 'dbt_project.yml')
+        with open(project_path, 'w') as fp:
+            fp.write('name: root\nversion: "0.1"\nprofile: test\n')
+        models_dir = os.path.join(self.project_dir, 'models')
+        os.mkdir(models_dir)
+        for idx in range(20):
+            model_path = os.path.join(models_dir, 'model_{}.sql'.format(idx))
+            with open(model_path, 'w') as fp:
+                if idx == 0:
+                    fp.write('select 1 as id')
+                else:
+                    fp.write("select * from {{{{ ref('model_{}') }}}}"
+                             .format(idx - 1))
+        with open(os.path.join(models_dir, 'schema.yml'), 'w') as fp:
+            fp.write(
+                'version: 2\n'
+                'models:\n'
+                '  - name: model_0\n'
+                '    description: the first model\n'
+                '    columns:\n'
+                '      - name: id\n'
+                '        tests: [unique, not_null]\n'
+            )
+
+        profile_data = {
+            'target': 'test',
+            'quoting': {},
+            'outputs': {
+                'test': {
+                    'type': 'postgres',
+                    'host': 'localhost',
+                    'schema': 'analytics',
+                    'user': 'test',
+                    'pass': 'test',
+                    'dbname': 'test',
+                    'port': 1,
+                }
+            }
+        }
+        root_project = {
+            'name': 'root',
+            'version': '0.1',
+            'profile': 'test',
+            'project-root': self.project_dir,
+        }
+        self.config = config_from_parts_or_dicts(
+            project=root_project,
+            profile=profile_data,
+        )
+        self.macro_manifest = Manifest.from_macros()
+        self.patchers = [
+            mock.patch.object(loader, 'PARALLEL_PARSE_MIN_FILES', 2),
+            mock.patch('dbt.context.parser.get_adapter'),
+            mock.patch(
+                'dbt.loader.make_parse_result',
+                side_effect=lambda *a: ParseResult(FileHash.empty(), {})
+            ),
+        ]
+        for patcher in self.patchers:
+            patcher.start()
+
+    def tearDown(self):
+        for patcher in self.patchers:
+            patcher.stop()
+        dbt.flags.PARALLEL_PARSE = False
+        shutil.rmtree(self.project_dir)
+
+    def _parse(self, parallel):
+        dbt.flags.PARALLEL_PARSE = parallel
+        graph_loader = loader.GraphLoader(self.config, {'root': self.config})
+        graph_loader.parse_project(self.config, self.macro_manifest, None)
+        return graph_loader.results
+
+    @unittest.skipUnless(loader._parallel_parse_supported(), 'requires fork')
+    def test_parallel_matches_serial(self):
+        serial = self._parse(False)
+        parallel = self._parse(True)
+        self.assertEqual(len(serial.nodes), 22)
+        self.assertEqual(serial.nodes, parallel.nodes)
+        self.assertEqual(list(serial.nodes), list(parallel.nodes))
+        self.assertEqual(serial.patches, parallel.patches)
+        self.assertEqual(
+            {k: v.nodes for k, v in serial.files.items()},
+            {k: v.nodes for k, v in parallel.files.items()},
+        )
+
+    @unittest.skipUnless(loader._parallel_parse_supported(), 'requires fork')
+    def test_parallel_error(self):
+        model_path = os.path.join(self.project_dir, 'models', 'model_7.sql')
+        with open(model_path, 'w') as fp:
+            fp.write("select * from {{ ref('model_6' }}")
+        with self.assertRaises(CompilationException) as exc:
+            self._parse(True)
+        self.assertIn('model_7', str(exc.exception))
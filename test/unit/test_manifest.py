@@ -4,11 +4,12 @@ from unittest import mock
 import copy
 from datetime import datetime
 
+import dbt.exceptions
 import dbt.flags
 from dbt import tracking
 from dbt.contracts.graph.manifest import Manifest, ManifestMetadata
 from dbt.contracts.graph.parsed import (
-    ParsedModelNode, DependsOn, NodeConfig, ParsedSeedNode
+    ParsedModelNode, DependsOn, NodeConfig, ParsedSeedNode, ParsedMacro
 )
 from dbt.contracts.graph.compiled import CompiledModelNode
 from dbt.node_types import NodeType
@@ -361,6 +362,97 @@ class ManifestTest(unittest.TestCase):
         resource_fqns = manifest.get_resource_fqns()
         self.assertEqual(resource_fqns, expect)
 
+    def test_find_refable_by_name(self):
+        nodes = copy.copy(self.nested_nodes)
+        manifest = Manifest(nodes=nodes, macros={}, docs={},
+                            generated_at=datetime.utcnow(), disabled=[],
+                            files={})
+        # with no package, the first match in node order is found
+        self.assertIs(manifest.find_refable_by_name('events', None),
+                      nodes['model.snowplow.events'])
+        self.assertIs(manifest.find_refable_by_name('events', 'root'),
+                      nodes['model.root.events'])
+        self.assertIs(manifest.find_refable_by_name('dep', None),
+                      nodes['model.root.dep'])
+        self.assertIsNone(manifest.find_refable_by_name('dep', 'snowplow'))
+        self.assertIsNone(manifest.find_refable_by_name('missing', None))
+        # sources aren't refable
+        self.assertIsNone(manifest.find_source_by_name('root', 'dep', None))
+
+    def test_find_refable_by_name_after_add(self):
+        nodes = copy.copy(self.nested_nodes)
+        manifest = Manifest(nodes=nodes, macros={}, docs={},
+                            generated_at=datetime.utcnow(), disabled=[],
+                            files={})
+        self.assertIsNone(manifest.find_refable_by_name('added', None))
+        new_node = nodes['model.root.dep'].replace(
+            name='added', unique_id='model.root.added'
+        )
+        manifest.add_nodes({'model.root.added': new_node})
+        self.assertIs(manifest.find_refable_by_name('added', None), new_node)
+
+        updated = new_node.replace(alias='updated')
+        manifest.update_node(updated)
+        self.assertIs(manifest.find_refable_by_name('added', 'root'), updated)
+
+    def test_find_refable_by_name_after_replace(self):
+        manifest = Manifest(nodes=copy.copy(self.nested_nodes), macros={},
+                            docs={}, generated_at=datetime.utcnow(),
+                            disabled=[], files={})
+        self.assertIsNone(manifest.find_refable_by_name('added', None))
+        # a same-length subgraph, in place of the indexed one
+        nodes = copy.copy(self.nested_nodes)
+        removed = nodes.pop('model.root.dep')
+        added = removed.replace(name='added', unique_id='model.root.added')
+        nodes['model.root.added'] = added
+        manifest.nodes = nodes
+        self.assertIs(manifest.find_refable_by_name('added', None), added)
+        self.assertIsNone(manifest.find_refable_by_name('dep', None))
+
+    def test_find_macro_by_name_after_add_macros(self):
+        def make_macro(name):
+            return ParsedMacro(
+                name=name,
+                resource_type=NodeType.Macro,
+                unique_id='macro.root.{}'.format(name),
+                package_name='root',
+                original_file_path='macros/{}.sql'.format(name),
+                root_path='/usr/src/app',
+                path='macros/{}.sql'.format(name),
+                raw_sql='{{% macro {}() %}}{{% endmacro %}}'.format(name),
+            )
+
+        old = make_macro('old')
+        manifest = Manifest.from_macros(macros={old.unique_id: old})
+        self.assertIs(manifest.find_macro_by_name('old', 'root'), old)
+        self.assertEqual(manifest.generation('macros'), 0)
+
+        new = make_macro('new')
+        manifest.add_macros({new.unique_id: new})
+        self.assertEqual(manifest.generation('macros'), 1)
+        self.assertIs(manifest.find_macro_by_name('new', 'root'), new)
+        self.assertIs(manifest.find_macro_by_name('old', 'root'), old)
+
+    def test_find_disabled_by_name(self):
+        disabled = [self.nested_nodes['model.root.dep']]
+        manifest = Manifest(nodes={}, macros={}, docs={},
+                            generated_at=datetime.utcnow(), disabled=disabled,
+                            files={})
+        self.assertIs(manifest.find_disabled_by_name('dep'), disabled[0])
+        self.assertIs(manifest.find_disabled_by_name('dep', 'root'),
+                      disabled[0])
+        self.assertIsNone(manifest.find_disabled_by_name('dep', 'snowplow'))
+
+    def test_find_by_name_malformed(self):
+        nodes = {
+            'model.root.bad.name': self.nested_nodes['model.root.dep'],
+        }
+        manifest = Manifest(nodes=nodes, macros={}, docs={},
+                            generated_at=datetime.utcnow(), disabled=[],
+                            files={})
+        with self.assertRaises(dbt.exceptions.CompilationException):
+            manifest.find_refable_by_name('dep', None)
+
 
 class MixedManifestTest(unittest.TestCase):
     def setUp(self):
@@ -381,6 +381,70 @@ class ModelParserTest(BaseParserTest):
             self.parser.parse_file(block)
         self.assert_has_results_length(self.parser.results, files=0)
 
+    def test_static_calls_skip_render(self):
+        raw_sql = (
+            "{{ config(materialized='table', tags=['a']) }}"
+            "{% do config({'tags': 'b'}) %}"
+            "select * from {{ ref('model_2') }} "
+            "join {{ ref('snowplow', 'events') }} "
+            "join {{ source('my_source', 'my_table') }}"
+        )
+        block = self.file_block_for(raw_sql, 'nested/model_1.sql')
+        with mock.patch('dbt.parser.base.get_rendered') as get_rendered:
+            self.parser.parse_file(block)
+        get_rendered.assert_not_called()
+        node = list(self.parser.results.nodes.values())[0]
+        self.assertEqual(node.refs, [['model_2'], ['snowplow', 'events']])
+        self.assertEqual(node.sources, [['my_source', 'my_table']])
+        self.assertEqual(node.config.materialized, 'table')
+        self.assertEqual(node.tags, ['a', 'b'])
+
+    def test_static_calls_fallback(self):
+        for raw_sql in (
+            "select * from {{ ref(var('model_name')) }}",
+            "{% if true %}select * from {{ ref('model_2') }}{% endif %}",
+            "select * from {{ this }}",
+            "select * from {{ ref('a', 'b', 'c') }}",
+        ):
+            self.assertIsNone(self.parser.get_static_calls(
+                mock.MagicMock(raw_sql=raw_sql)
+            ))
+
+    def test_static_calls_overridden_macro(self):
+        self.parser.macro_manifest = Manifest.from_macros(
+            macros={'macro.root.ref': ParsedMacro(
+                name='ref',
+                resource_type=NodeType.Macro,
+                unique_id='macro.root.ref',
+                package_name='root',
+                original_file_path=normalize('macros/ref.sql'),
+                root_path=get_abs_os_path('./dbt_modules/root'),
+                path=normalize('macros/ref.sql'),
+                raw_sql='{% macro ref(name) %}{% endmacro %}',
+            )}
+        )
+        self.assertIsNone(self.parser.get_static_calls(
+            mock.MagicMock(raw_sql="select * from {{ ref('model_2') }}")
+        ))
+
+    def test_static_calls_verify(self):
+        dbt.flags.TEST_STATIC_PARSER = True
+        self.addCleanup(setattr, dbt.flags, 'TEST_STATIC_PARSER', False)
+        raw_sql = (
+            "{{ config(materialized='table') }}"
+            "select * from {{ ref('model_2') }}"
+        )
+        block = self.file_block_for(raw_sql, 'nested/model_1.sql')
+        self.parser.parse_file(block)
+        node = list(self.parser.results.nodes.values())[0]
+        self.assertEqual(node.refs, [['model_2']])
+        self.assertEqual(node.config.materialized, 'table')
+
+        with mock.patch.object(self.parser, 'apply_static_calls'):
+            block = self.file_block_for(raw_sql, 'nested/model_3.sql')
+            with self.assertRaises(CompilationException):
+                self.parser.parse_file(block)
+
 
 class SnapshotParserTest(BaseParserTest):
     def setUp(self):
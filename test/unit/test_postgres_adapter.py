@@ -1,16 +1,24 @@
+import os
+import shutil
+import tempfile
+from datetime import datetime
+import time
 import unittest
 from unittest import mock
 
 import dbt.flags as flags
 from dbt.task.debug import DebugTask
 
+from dbt.adapters.base.impl import SchemaSearchMap
 from dbt.adapters.postgres import PostgresAdapter
+from dbt.clients.agate_helper import table_from_data
 from dbt.exceptions import ValidationException, DbtConfigError
 from dbt.logger import GLOBAL_LOGGER as logger  # noqa
 from dbt.parser.results import ParseResult
 from psycopg2 import extensions as psycopg2_extensions
 from psycopg2 import DatabaseError, Error
 import agate
+import pytz
 
 from .utils import config_from_parts_or_dicts, inject_adapter, mock_connection
 
@@ -109,6 +117,179 @@ class TestPostgresAdapter(unittest.TestCase):
             port=5432,
             connect_timeout=10)
 
+    @mock.patch('dbt.adapters.postgres.connections.psycopg2')
+    def test_prewarm_connections(self, psycopg2):
+        psycopg2.connect.return_value.closed = 0
+        self.config.threads = 3
+        self.adapter.prewarm_connections(4)
+        self.assertEqual(psycopg2.connect.call_count, 3)
+        self.assertEqual(len(self.adapter.connections.pool), 3)
+
+        # acquiring uses a pooled connection instead of connecting
+        connection = self.adapter.acquire_connection('dummy')
+        self.assertEqual(connection.state, 'open')
+        self.assertEqual(connection.name, 'dummy')
+        self.assertEqual(psycopg2.connect.call_count, 3)
+        self.assertEqual(len(self.adapter.connections.pool), 2)
+
+        self.adapter.cleanup_connections()
+        self.assertEqual(len(self.adapter.connections.pool), 0)
+        self.assertEqual(psycopg2.connect.return_value.close.call_count, 3)
+
+    @mock.patch('dbt.adapters.postgres.connections.psycopg2')
+    def test_dead_connection_reopened(self, psycopg2):
+        psycopg2.connect.return_value.closed = 0
+        self.adapter.acquire_connection('first')
+        self.adapter.release_connection()
+        self.adapter.acquire_connection('second')
+        psycopg2.connect.assert_called_once()
+        self.adapter.release_connection()
+
+        # the server closed the connection
+        psycopg2.connect.return_value.closed = 2
+        connection = self.adapter.acquire_connection('third')
+        self.assertEqual(psycopg2.connect.call_count, 2)
+        self.assertEqual(connection.state, 'open')
+
+    @mock.patch('dbt.adapters.postgres.connections.psycopg2')
+    def test_idle_connection_reopened(self, psycopg2):
+        psycopg2.connect.return_value.closed = 0
+        self.adapter.acquire_connection('first')
+        self.adapter.release_connection()
+        later = time.monotonic() + 3600
+        with mock.patch('time.monotonic', return_value=later):
+            self.adapter.acquire_connection('second')
+        self.assertEqual(psycopg2.connect.call_count, 2)
+
+    @mock.patch('dbt.adapters.postgres.connections.psycopg2')
+    def test_relations_cache_for_schemas_threaded(self, psycopg2):
+        psycopg2.connect.return_value.closed = 0
+        self.config.threads = 4
+        schemas = ['schema_{}'.format(i) for i in range(10)]
+        search_map = SchemaSearchMap()
+        for schema in schemas:
+            search_map.add(self.adapter.Relation.create(
+                database='postgres', schema=schema, identifier='x'
+            ))
+
+        def list_relations(information_schema, schema):
+            # each thread uses its own connection
+            conn = self.adapter.connections.get_thread_connection()
+            self.assertEqual(conn.name, 'list_postgres_{}'.format(schema))
+            return [self.adapter.Relation.create(
+                database='postgres', schema=schema, identifier='table',
+                type='table'
+            )]
+
+        with mock.patch.object(
+            self.adapter, '_get_cache_schemas', return_value=search_map
+        ), mock.patch.object(
+            self.adapter, 'list_relations_without_caching',
+            side_effect=list_relations
+        ), mock.patch.object(self.adapter, '_link_cached_relations'):
+            self.adapter.set_relations_cache(mock.MagicMock())
+
+        for schema in schemas:
+            self.assertIn(('postgres', schema), self.adapter.cache)
+            relations = self.adapter.cache.get_relations('postgres', schema)
+            self.assertEqual([r.identifier for r in relations], ['table'])
+        # the worker threads' connections were given to the pool
+        self.assertEqual(self.adapter.connections.thread_connections, {})
+        self.assertEqual(len(self.adapter.connections.pool),
+                         psycopg2.connect.call_count)
+
+    def test_persisted_relations_cache(self):
+        search_map = SchemaSearchMap()
+        search_map.add(self.adapter.Relation.create(
+            database='postgres', schema='analytics', identifier='x'
+        ))
+        relation = self.adapter.Relation.create(
+            database='postgres', schema='analytics', identifier='table',
+            type='table'
+        )
+        self.config.target_path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.config.target_path)
+        self.adapter.cache.add(relation)
+        self.adapter.cache.update_schemas(search_map.schemas_searched())
+
+        with mock.patch.object(flags, 'RELATIONS_CACHE_TTL', 0), \
+                mock.patch.object(PostgresAdapter, 'get_relations_fingerprint',
+                                  return_value='abc'), \
+                mock.patch.object(PostgresAdapter, '_get_cache_schemas',
+                                  return_value=search_map), \
+                mock.patch.object(PostgresAdapter,
+                                  '_relations_cache_for_schemas') as populate:
+            self.adapter.save_relations_cache()
+
+            # the fingerprint is unchanged, so the saved cache is reused
+            adapter = PostgresAdapter(self.config)
+            adapter.set_relations_cache(mock.MagicMock())
+            populate.assert_not_called()
+            self.assertIn(('postgres', 'analytics'), adapter.cache)
+            relations = adapter.cache.get_relations('postgres', 'analytics')
+            self.assertEqual([r.identifier for r in relations], ['table'])
+            # the saved cache is only reused once
+            self.assertFalse(os.path.exists(
+                self.adapter._relations_cache_path()
+            ))
+
+            # the fingerprint changed, so the cache is populated from scratch
+            self.adapter.save_relations_cache()
+            PostgresAdapter.get_relations_fingerprint.return_value = 'def'
+            adapter = PostgresAdapter(self.config)
+            adapter.set_relations_cache(mock.MagicMock())
+            populate.assert_called_once()
+            self.assertNotIn(('postgres', 'analytics'), adapter.cache)
+
+            # a run without a TTL also changes the database, so it removes
+            # the saved cache
+            self.adapter.save_relations_cache()
+            with mock.patch.object(flags, 'RELATIONS_CACHE_TTL', None):
+                PostgresAdapter(self.config).set_relations_cache(
+                    mock.MagicMock()
+                )
+            self.assertFalse(os.path.exists(
+                self.adapter._relations_cache_path()
+            ))
+
+    @mock.patch('dbt.adapters.postgres.connections.psycopg2')
+    def test_copy_csv_rows(self, psycopg2):
+        copied = []
+
+        def copy_expert(sql, fp):
+            # psycopg2 reads the file in chunks
+            while True:
+                chunk = fp.read(8)
+                if not chunk:
+                    break
+                copied.append(chunk)
+
+        cursor = psycopg2.connect.return_value.cursor.return_value
+        cursor.copy_expert.side_effect = copy_expert
+        table = agate.Table(
+            rows=[(1, 'a,b', None), (2, None, True)],
+            column_names=['id', 'name', 'flag'],
+        )
+        relation = self.adapter.Relation.create(
+            database='postgres', schema='analytics', identifier='seed'
+        )
+
+        self.adapter.acquire_connection('seed')
+        sql = self.adapter.copy_csv_rows(relation, table)
+
+        self.assertEqual(
+            sql,
+            'copy "postgres"."analytics"."seed" (id, name, flag) from stdin '
+            'with (format csv, force_null (id, name, flag))'
+        )
+        cursor.copy_expert.assert_called_once()
+        self.assertEqual(cursor.copy_expert.call_args[0][0], sql)
+        self.assertEqual(''.join(copied), '1,"a,b",\n2,,True\n')
+        # the copy ran inside a transaction
+        self.assertTrue(
+            self.adapter.connections.get_thread_connection().transaction_open
+        )
+
     @mock.patch('dbt.adapters.postgres.connections.psycopg2')
     def test_changed_keepalive(self, psycopg2):
         self.config.credentials = self.config.credentials.replace(keepalives_idle=256)
@@ -180,12 +361,133 @@ class TestPostgresAdapter(unittest.TestCase):
         mock_manifest = mock.MagicMock()
         mock_manifest.get_used_schemas.return_value = {('dbt', 'foo'),
                                                        ('dbt', 'quux')}
-
-        catalog = self.adapter.get_catalog(mock_manifest)
+        search_map = SchemaSearchMap()
+        for schema in ('foo', 'quux'):
+            search_map.add(self.adapter.Relation.create(
+                database='dbt', schema=schema, identifier='x'
+            ))
+
+        with mock.patch.object(self.adapter, '_get_cache_schemas',
+                               return_value=search_map):
+            catalog = self.adapter.get_catalog(mock_manifest)
         self.assertEqual(
             set(map(tuple, catalog)),
             {('dbt', 'foo', 'bar'), ('dbt', 'FOO', 'baz'), ('dbt', 'quux', 'bar')}
         )
+        # the catalog query is limited to the schemas in the manifest
+        mock_execute.assert_called_once()
+        kwargs = mock_execute.call_args[1]['kwargs']
+        self.assertEqual(kwargs['schemas'], ['foo', 'quux'])
+        self.assertEqual([r.database for r in kwargs['information_schemas']],
+                         ['dbt'])
+
+    @mock.patch.object(PostgresAdapter, 'execute_macro')
+    def test_get_catalog_mixed_types(self, mock_execute):
+        column_names = ['table_database', 'table_schema', 'table_name',
+                        'table_comment']
+        # an empty table and an all-null column infer different types than
+        # a table with comments
+        mock_execute.side_effect = [
+            table_from_data([], column_names),
+            table_from_data([{'table_database': 'other',
+                              'table_schema': 'foo',
+                              'table_name': 'bar',
+                              'table_comment': None}], column_names),
+            table_from_data([{'table_database': 'third',
+                              'table_schema': 'foo',
+                              'table_name': 'baz',
+                              'table_comment': 'a comment'}], column_names),
+        ]
+
+        mock_manifest = mock.MagicMock()
+        mock_manifest.get_used_schemas.return_value = {
+            ('dbt', 'foo'), ('other', 'foo'), ('third', 'foo')
+        }
+        search_map = SchemaSearchMap()
+        for database in ('dbt', 'other', 'third'):
+            search_map.add(self.adapter.Relation.create(
+                database=database, schema='foo', identifier='x'
+            ))
+
+        with mock.patch.object(self.adapter, '_get_cache_schemas',
+                               return_value=search_map):
+            catalog = self.adapter.get_catalog(mock_manifest)
+        self.assertEqual(mock_execute.call_count, 3)
+        self.assertEqual(
+            set(map(tuple, catalog)),
+            {('other', 'foo', 'bar', None),
+             ('third', 'foo', 'baz', 'a comment')}
+        )
+
+    @mock.patch.object(PostgresAdapter, 'execute_macro')
+    def test_calculate_freshness_batch(self, mock_execute):
+        loaded = datetime(2019, 1, 1, tzinfo=pytz.UTC)
+        now = datetime(2019, 1, 2, tzinfo=pytz.UTC)
+        # a naive timestamp keeps its own column, and is read as UTC
+        naive = datetime(2019, 1, 1, 12)
+        mock_execute.return_value = agate.Table(
+            rows=[(loaded, naive, None, 'invalid', now)],
+            column_names=['max_loaded_at_0', 'max_loaded_at_1',
+                          'max_loaded_at_2', 'max_loaded_at_3',
+                          'snapshotted_at']
+        )
+        sources = [
+            (self.adapter.Relation.create(database='dbt', schema='raw',
+                                          identifier=name),
+             'loaded_at', None)
+            for name in ('a', 'b', 'c', 'd')
+        ]
+
+        results = self.adapter.calculate_freshness_batch(sources)
+        self.assertEqual(results[0], {
+            'max_loaded_at': loaded,
+            'snapshotted_at': now,
+            'age': 86400.0,
+        })
+        self.assertEqual(results[1]['age'], 43200.0)
+        # an empty source was loaded infinitely long ago
+        self.assertEqual(results[2]['max_loaded_at'],
+                         datetime(1, 1, 1, tzinfo=pytz.UTC))
+        # invalid values are left for a single query
+        self.assertIsNone(results[3])
+        kwargs = mock_execute.call_args[1]['kwargs']
+        self.assertEqual([s['source'] for s in kwargs['sources']],
+                         [s[0] for s in sources])
+
+    @mock.patch.object(PostgresAdapter, 'execute_macro')
+    def test_calculate_freshness_batch_invalid_shape(self, mock_execute):
+        mock_execute.return_value = agate.Table(
+            rows=[(None, None)],
+            column_names=['max_loaded_at_0', 'snapshotted_at']
+        )
+        sources = [
+            (self.adapter.Relation.create(database='dbt', schema='raw',
+                                          identifier=name),
+             'loaded_at', None)
+            for name in ('a', 'b')
+        ]
+        self.assertEqual(self.adapter.calculate_freshness_batch(sources),
+                         [None, None])
+
+    def test_can_batch_freshness(self):
+        def macro(name, package_name):
+            node = mock.MagicMock(package_name=package_name)
+            node.name = name
+            return node
+
+        manifest = mock.MagicMock(macros={
+            'a': macro('collect_freshness', 'dbt'),
+            'b': macro('default__collect_freshness', 'dbt'),
+        })
+        self.assertTrue(self.adapter.can_batch_freshness(manifest))
+
+        manifest.macros['c'] = macro('postgres__collect_freshness',
+                                     'dbt_postgres')
+        self.assertFalse(self.adapter.can_batch_freshness(manifest))
+
+        del manifest.macros['c']
+        manifest.macros['d'] = macro('collect_freshness', 'root')
+        self.assertFalse(self.adapter.can_batch_freshness(manifest))
 
 
 class TestConnectingPostgresAdapter(unittest.TestCase):
@@ -0,0 +1,106 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+import dbt.flags
+from dbt.contracts.graph.manifest import FileHash
+from dbt.contracts.graph.parsed import DependsOn, NodeConfig, ParsedSeedNode
+from dbt.node_runners import ModelRunner, SeedRunner
+
+
+class TestSeedRunner(unittest.TestCase):
+    def setUp(self):
+        dbt.flags.FULL_REFRESH = False
+        self.tempdir = tempfile.mkdtemp()
+        self.seed_path = os.path.join(self.tempdir, 'seed.csv')
+        with open(self.seed_path, 'w') as fp:
+            fp.write('a,b\n1,2\n')
+
+        self.node = ParsedSeedNode(
+            name='seed',
+            database='dbt',
+            schema='analytics',
+            alias='seed',
+            resource_type='seed',
+            unique_id='seed.root.seed',
+            fqn=['root', 'seed'],
+            package_name='root',
+            refs=[],
+            sources=[],
+            depends_on=DependsOn(),
+            config=NodeConfig.from_dict({
+                'enabled': True,
+                'materialized': 'seed',
+                'column_types': {},
+            }),
+            tags=[],
+            path='seed.csv',
+            original_file_path='seed.csv',
+            root_path=self.tempdir,
+            raw_sql='-- csv --',
+            seed_file_path=self.seed_path,
+        )
+        self.adapter = mock.MagicMock()
+        self.adapter.Relation.create_from.return_value = 'dbt.analytics.seed'
+        self.runner = SeedRunner(mock.MagicMock(), self.adapter, self.node,
+                                 1, 1)
+
+        self.execute = mock.patch.object(ModelRunner, 'execute').start()
+        self.execute.return_value = mock.MagicMock(skip=False)
+
+    def tearDown(self):
+        mock.patch.stopall()
+        dbt.flags.FULL_REFRESH = False
+        shutil.rmtree(self.tempdir)
+
+    def test_file_hash_from_path(self):
+        self.assertEqual(
+            FileHash.from_path(self.seed_path, chunk_size=3),
+            FileHash.from_contents('a,b\n1,2\n')
+        )
+
+    def test_skip_unchanged(self):
+        result = self.runner.execute(self.node, None)
+        self.assertFalse(result.skip)
+        self.assertIn(self.node.unique_id, self.runner.seed_checksums)
+
+        result = self.runner.execute(self.node, None)
+        self.assertTrue(result.skip)
+        self.assertEqual(result.status, 'SKIP')
+        self.assertEqual(self.execute.call_count, 1)
+
+    def test_reload_changed_file(self):
+        self.runner.execute(self.node, None)
+        with open(self.seed_path, 'a') as fp:
+            fp.write('3,4\n')
+        result = self.runner.execute(self.node, None)
+        self.assertFalse(result.skip)
+        self.assertEqual(self.execute.call_count, 2)
+
+    def test_reload_changed_config(self):
+        self.runner.execute(self.node, None)
+        self.node.config.column_types = {'a': 'text'}
+        result = self.runner.execute(self.node, None)
+        self.assertFalse(result.skip)
+
+    def test_reload_missing_relation(self):
+        self.runner.execute(self.node, None)
+        self.adapter.get_relation.return_value = None
+        result = self.runner.execute(self.node, None)
+        self.assertFalse(result.skip)
+
+    def test_reload_full_refresh(self):
+        self.runner.execute(self.node, None)
+        dbt.flags.FULL_REFRESH = True
+        result = self.runner.execute(self.node, None)
+        self.assertFalse(result.skip)
+
+    def test_failed_load_forgets_checksum(self):
+        self.runner.execute(self.node, None)
+        self.node.config.column_types = {'a': 'text'}
+        self.execute.side_effect = RuntimeError('load failed')
+        with self.assertRaises(RuntimeError):
+            self.runner.execute(self.node, None)
+        self.assertNotIn(self.node.unique_id, self.runner.seed_checksums)
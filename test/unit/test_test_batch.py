@@ -0,0 +1,231 @@
+import time
+import unittest
+from unittest import mock
+
+import agate
+
+import dbt.exceptions
+from dbt.contracts.results import RunModelResult
+from dbt.node_runners import FreshnessBatch, TestBatch, TestRunner
+from dbt.node_types import NodeType
+from dbt.task.freshness import FreshnessTask
+from dbt.task.test import TestTask
+
+
+def _test_node(name, depends_on=('model.root.model',), tags=('schema',)):
+    node = mock.MagicMock(
+        unique_id='test.root.{}'.format(name),
+        resource_type=NodeType.Test,
+        tags=list(tags),
+    )
+    node.name = name
+    node.depends_on.nodes = list(depends_on)
+    return node
+
+
+def _compiled(adapter, config, node, manifest, extra_context):
+    compiled = mock.MagicMock(unique_id=node.unique_id)
+    compiled.wrapped_sql = 'select count(*) from {}'.format(node.name)
+    return compiled
+
+
+class TestTestBatch(unittest.TestCase):
+    def setUp(self):
+        self.tests = [_test_node(n) for n in ('a', 'b', 'c')]
+        self.adapter = mock.MagicMock()
+        self.runner = mock.MagicMock(adapter=self.adapter)
+        patcher = mock.patch('dbt.node_runners.compile_node',
+                             side_effect=_compiled)
+        self.compile_node = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _table(self, rows):
+        return agate.Table(rows, ['dbt_test_index', 'count'])
+
+    def test_batched_query(self):
+        self.adapter.execute.return_value = (
+            None, self._table([(0, 0), (1, 3), (2, 0)])
+        )
+        batch = TestBatch(self.tests)
+        for test in self.tests:
+            batch.compile(self.runner, None, test)
+
+        self.assertEqual(batch.get_failed_rows(self.adapter, self.tests[1]), 3)
+        self.assertEqual(batch.get_failed_rows(self.adapter, self.tests[0]), 0)
+        self.assertEqual(self.compile_node.call_count, 3)
+        self.adapter.execute.assert_called_once()
+        sql = self.adapter.execute.call_args[0][0]
+        self.assertEqual(sql.count('union all'), 2)
+        self.assertIn('select count(*) from b', sql)
+
+    def test_compile_error_isolated(self):
+        error = dbt.exceptions.CompilationException('bad test')
+
+        def compile_node(adapter, config, node, manifest, extra_context):
+            if node.name == 'b':
+                raise error
+            return _compiled(adapter, config, node, manifest, extra_context)
+
+        self.compile_node.side_effect = compile_node
+        self.adapter.execute.return_value = (
+            None, self._table([(0, 0), (1, 2)])
+        )
+        batch = TestBatch(self.tests)
+        with self.assertRaises(dbt.exceptions.CompilationException):
+            batch.compile(self.runner, None, self.tests[1])
+        batch.compile(self.runner, None, self.tests[2])
+        self.assertEqual(batch.get_failed_rows(self.adapter, self.tests[2]), 2)
+
+    def test_failed_query_runs_tests_individually(self):
+        self.adapter.execute.side_effect = \
+            dbt.exceptions.DatabaseException('syntax error')
+        batch = TestBatch(self.tests)
+        batch.compile(self.runner, None, self.tests[0])
+        self.assertIsNone(batch.get_failed_rows(self.adapter, self.tests[0]))
+        self.assertIsNone(batch.get_failed_rows(self.adapter, self.tests[1]))
+        self.adapter.execute.assert_called_once()
+
+    def test_many_rows_runs_test_individually(self):
+        self.adapter.execute.return_value = (
+            None, self._table([(0, 0), (1, 1), (1, 1), (2, 0)])
+        )
+        batch = TestBatch(self.tests)
+        batch.compile(self.runner, None, self.tests[0])
+        self.assertIsNone(batch.get_failed_rows(self.adapter, self.tests[1]))
+        self.assertEqual(batch.get_failed_rows(self.adapter, self.tests[2]), 0)
+
+    def test_timing_split_between_members(self):
+        self.adapter.execute.return_value = (
+            None, self._table([(0, 0), (1, 1), (1, 1), (2, 0)])
+        )
+        batch = TestBatch(self.tests)
+        results = []
+        for test in self.tests:
+            runner = TestRunner(mock.MagicMock(), self.adapter, test, 1, 3)
+            runner.batch = batch
+            batch.compile(runner, None, test)
+            batch.get_failed_rows(self.adapter, test)
+            result = RunModelResult(node=test, status=0)
+            results.append(runner.from_run_result(result, time.time(), []))
+
+        batch_elapsed = sum(
+            (t.completed_at - t.started_at).total_seconds()
+            for t in batch.timing
+        )
+        # test b returned many rows, so it is timed on its own
+        for result in (results[0], results[2]):
+            self.assertEqual([t.name for t in result.timing],
+                             ['compile', 'execute'])
+            self.assertEqual(result.execution_time, batch_elapsed / 2)
+        self.assertEqual(results[1].timing, [])
+
+    def test_runner_falls_back(self):
+        runner = TestRunner(mock.MagicMock(), self.adapter, self.tests[0],
+                            1, 1)
+        runner.batch = mock.MagicMock()
+        runner.batch.get_failed_rows.return_value = None
+        self.adapter.execute.return_value = (None, self._table([(5, 5)]))
+        self.assertEqual(runner.execute_test(self.tests[0]), 5)
+
+
+class TestBuildBatches(unittest.TestCase):
+    def _task(self, nodes, batch_size):
+        task = TestTask.__new__(TestTask)
+        task.args = mock.MagicMock(batch_size=batch_size)
+        task.manifest = mock.MagicMock(
+            nodes={n.unique_id: n for n in nodes}
+        )
+        return task
+
+    def test_build_batches(self):
+        nodes = [_test_node(n) for n in ('a', 'b', 'c', 'd', 'e')]
+        nodes.append(_test_node('other', depends_on=['model.root.other']))
+        nodes.append(_test_node('data', tags=['data']))
+        task = self._task(nodes, batch_size=2)
+
+        batches = task.build_batches({n.unique_id for n in nodes})
+        self.assertEqual(
+            sorted(batches),
+            ['test.root.a', 'test.root.b', 'test.root.c', 'test.root.d']
+        )
+        self.assertIs(batches['test.root.a'], batches['test.root.b'])
+        self.assertIsNot(batches['test.root.a'], batches['test.root.c'])
+
+    def test_no_batch_size(self):
+        nodes = [_test_node(n) for n in ('a', 'b')]
+        task = self._task(nodes, batch_size=None)
+        self.assertEqual(task.build_batches({n.unique_id for n in nodes}), {})
+
+
+class TestFreshnessBatch(unittest.TestCase):
+    def setUp(self):
+        self.sources = []
+        for name in ('a', 'b', 'c'):
+            node = mock.MagicMock(unique_id='source.root.raw.{}'.format(name))
+            node.name = name
+            self.sources.append(node)
+        self.adapter = mock.MagicMock()
+
+    def test_batched_query(self):
+        self.adapter.calculate_freshness_batch.return_value = [
+            {'age': 1}, None, {'age': 3}
+        ]
+        batch = FreshnessBatch(self.sources)
+        self.assertEqual(
+            batch.get_freshness(self.adapter, self.sources[0], None),
+            {'age': 1}
+        )
+        self.assertIsNone(
+            batch.get_freshness(self.adapter, self.sources[1], None)
+        )
+        self.assertEqual(
+            batch.get_freshness(self.adapter, self.sources[2], None),
+            {'age': 3}
+        )
+        self.adapter.calculate_freshness_batch.assert_called_once()
+
+    def test_failed_query_checks_sources_individually(self):
+        self.adapter.calculate_freshness_batch.side_effect = \
+            dbt.exceptions.DatabaseException('column types do not match')
+        batch = FreshnessBatch(self.sources)
+        for source in self.sources:
+            self.assertIsNone(batch.get_freshness(self.adapter, source, None))
+        self.adapter.calculate_freshness_batch.assert_called_once()
+
+    def _task(self, batch_size):
+        nodes = [mock.MagicMock(unique_id='source.root.raw.{}'.format(n),
+                                database='dbt', schema='raw')
+                 for n in ('a', 'b', 'c')]
+        nodes.append(mock.MagicMock(unique_id='source.root.other.d',
+                                    database='dbt', schema='other'))
+        task = FreshnessTask.__new__(FreshnessTask)
+        task.args = mock.MagicMock(batch_size=batch_size)
+        task.manifest = mock.MagicMock(
+            nodes={n.unique_id: n for n in nodes}
+        )
+        return task, nodes
+
+    def test_build_batches(self):
+        task, nodes = self._task(batch_size=50)
+        batches = task.build_batches(self.adapter,
+                                     {n.unique_id for n in nodes})
+        self.assertEqual(sorted(batches), [n.unique_id for n in nodes[:3]])
+        self.assertEqual(len(set(map(id, batches.values()))), 1)
+
+    def test_no_batch_size(self):
+        task, nodes = self._task(batch_size=None)
+        self.assertEqual(
+            task.build_batches(self.adapter, {n.unique_id for n in nodes}),
+            {}
+        )
+
+    def test_overridden_freshness_macro(self):
+        task, nodes = self._task(batch_size=50)
+        self.adapter.can_batch_freshness.return_value = False
+        self.assertEqual(
+            task.build_batches(self.adapter, {n.unique_id for n in nodes}),
+            {}
+        )
+        self.adapter.can_batch_freshness.assert_called_once_with(
+            task.manifest
+        )
@@ -0,0 +1,99 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+import dbt.writer
+from dbt.contracts.results import RunModelResult
+from dbt.task.runnable import GraphRunnableTask
+
+
+class _Node:
+    unique_id = 'model.root.model'
+    package_name = 'root'
+    path = 'models/model.sql'
+
+
+class TestBufferedWriter(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tempdir, 'compiled', 'root', 'models',
+                                 'model.sql')
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+    def _read(self):
+        with open(self.path) as fp:
+            return fp.read()
+
+    def test_write_node(self):
+        path = dbt.writer.write_node(_Node(), self.tempdir, 'compiled',
+                                     'select 1')
+        self.assertEqual(path, self.path)
+        dbt.writer.flush()
+        self.assertEqual(self._read(), 'select 1')
+
+    def test_writes_in_order(self):
+        writer = dbt.writer.BufferedWriter(maxsize=2)
+        for idx in range(10):
+            writer.write(self.path, 'select {}'.format(idx))
+        writer.flush()
+        self.assertEqual(self._read(), 'select 9')
+
+    def test_unchanged_not_written(self):
+        writer = dbt.writer.BufferedWriter()
+        writer.write(self.path, 'select 1')
+        writer.flush()
+        with mock.patch.object(dbt.writer, '_write_file') as write_file:
+            writer.write(self.path, 'select 1')
+            writer.flush()
+            write_file.assert_not_called()
+            writer.write(self.path, 'select 2')
+            writer.flush()
+            write_file.assert_called_once_with(self.path, 'select 2')
+
+    def test_removed_directory(self):
+        writer = dbt.writer.BufferedWriter()
+        writer.write(self.path, 'select 1')
+        writer.flush()
+        shutil.rmtree(os.path.join(self.tempdir, 'compiled'))
+        writer.write(self.path, 'select 2')
+        writer.flush()
+        self.assertEqual(self._read(), 'select 2')
+
+    def test_errors_raised_on_flush(self):
+        # a file where a directory should be
+        os.makedirs(os.path.join(self.tempdir, 'compiled'))
+        with open(os.path.join(self.tempdir, 'compiled', 'root'), 'w'):
+            pass
+        writer = dbt.writer.BufferedWriter()
+        writer.write(self.path, 'select 1', key='model.root.model')
+        writer.write(os.path.join(self.tempdir, 'ok.sql'), 'select 1')
+        with self.assertRaises(dbt.writer.WriteErrors) as exc:
+            writer.flush()
+        self.assertEqual(list(exc.exception.errors), ['model.root.model'])
+        self.assertIsInstance(exc.exception.errors['model.root.model'],
+                              OSError)
+        # the errors are only raised once
+        writer.flush()
+
+
+class TestFlushWrites(unittest.TestCase):
+    def _result(self, unique_id):
+        return RunModelResult(node=mock.MagicMock(unique_id=unique_id),
+                              status='CREATE VIEW')
+
+    def test_write_errors_mark_results(self):
+        task = GraphRunnableTask.__new__(GraphRunnableTask)
+        results = [self._result('model.root.a'), self._result('model.root.b')]
+        error = dbt.writer.WriteErrors({
+            'model.root.b': OSError('disk full'),
+            'operation.root.hook': OSError('disk full'),
+        })
+        with mock.patch.object(dbt.writer, 'flush', side_effect=error):
+            task.flush_writes(results)
+        self.assertIsNone(results[0].error)
+        self.assertEqual(results[1].error, 'disk full')
+        self.assertEqual(results[1].status, 'ERROR')